@@ -0,0 +1,132 @@
+"""Shared helpers for benchmarks that run against a live PostGIS database.
+
+Synthetic data is written inside a transaction that is always rolled back,
+so benchmarks can be pointed at a development database without leaving rows
+behind.
+"""
+
+import asyncio
+import statistics
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database import engine
+
+_SYNTHETIC_BUILDINGS = text(
+    """
+    INSERT INTO buildings (id, address, location)
+    SELECT gen_random_uuid(),
+           'synthetic ' || i,
+           ST_SetSRID(ST_MakePoint(random() * 360 - 180, random() * 170 - 85), 4326)::geography
+    FROM generate_series(1, :buildings) AS i
+    """
+)
+
+_SYNTHETIC_ORGANIZATIONS = text(
+    """
+    INSERT INTO organizations (id, name, phone_numbers, building_id)
+    SELECT gen_random_uuid(), 'synthetic org ' || b.id, ARRAY['0-000-000'], b.id
+    FROM buildings AS b, generate_series(1, :per_building)
+    WHERE b.address LIKE 'synthetic %'
+    """
+)
+
+
+@asynccontextmanager
+async def synthetic_session(
+    *, buildings: int = 200_000, organizations_per_building: int = 2
+) -> AsyncIterator[AsyncSession]:
+    """Yield a session over a database padded with synthetic, uniformly spread rows."""
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, expire_on_commit=False)
+        try:
+            await session.execute(_SYNTHETIC_BUILDINGS, {"buildings": buildings})
+            await session.execute(
+                _SYNTHETIC_ORGANIZATIONS, {"per_building": organizations_per_building}
+            )
+            await session.execute(text("ANALYZE buildings"))
+            await session.execute(text("ANALYZE organizations"))
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+    await engine.dispose()
+
+
+async def measure(
+    call: Callable[[], Awaitable[object]], *, repeat: int = 50, warmup: int = 3
+) -> dict[str, float]:
+    """Run ``call`` repeatedly and return latency percentiles in milliseconds."""
+    for _ in range(warmup):
+        await call()
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return _percentiles(samples)
+
+
+async def measure_cpu(
+    call: Callable[[], Awaitable[object]], *, repeat: int = 50, warmup: int = 3
+) -> dict[str, float]:
+    """Run ``call`` repeatedly and return percentiles of this process's CPU time in ms.
+
+    Time spent waiting for the database is left out; only the work done here counts.
+    """
+    for _ in range(warmup):
+        await call()
+
+    samples = []
+    for _ in range(repeat):
+        started = time.process_time()
+        await call()
+        samples.append((time.process_time() - started) * 1000)
+    return _percentiles(samples)
+
+
+async def measure_concurrent(
+    call: Callable[[], Awaitable[object]],
+    connection: asyncio.Lock,
+    *,
+    clients: int = 16,
+    repeat: int = 20,
+) -> dict[str, float]:
+    """Latency percentiles of ``clients`` concurrent callers sharing one connection.
+
+    Each call waits for ``connection`` and holds it until it returns, as a request
+    holds its pooled connection, so the measured latency includes queueing.
+    """
+    samples: list[float] = []
+
+    async def client() -> None:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            async with connection:
+                await call()
+            samples.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(client() for _ in range(clients)))
+    return _percentiles(samples)
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    samples = sorted(samples)
+    return {
+        "p50": statistics.median(samples),
+        "p99": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        "max": samples[-1],
+    }
+
+
+def report(title: str, rows: dict[str, dict[str, float]]) -> None:
+    print(f"\n{title}")
+    print(f"{'case':<32}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, stats in rows.items():
+        print(f"{name:<32}{stats['p50']:>10.2f}{stats['p99']:>10.2f}{stats['max']:>10.2f}")
@@ -0,0 +1,99 @@
+"""
+Benchmark CPU per request of 100-item organization pages: validated vs rendered.
+
+"validated" loads ORM objects with their building and activities, validates them
+into ``OrganizationRead`` and dumps the response JSON, as the endpoints do by
+default. "rendered" has PostgreSQL build every organization's JSON with
+``json_build_object``/``json_agg`` and only splices the documents into the page
+envelope. CPU time is this process's own, so the work moved into the database
+shows up in the latency table instead.
+
+Run: python -m benchmarks.database_rendering
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.common import measure, measure_cpu, report, synthetic_session
+from src.domain.schemas import OrganizationFilter, TotalMode
+from src.infrastructure.repositories import (
+    ActivityRepository,
+    BuildingRepository,
+    OrganizationRepository,
+)
+from src.services.organization import OrganizationService
+
+PAGE_SIZE = 100
+
+_SYNTHETIC_ACTIVITIES = text(
+    """
+    INSERT INTO activities (id, name, level)
+    SELECT gen_random_uuid(), 'synthetic activity ' || i, 1
+    FROM generate_series(1, 3) AS i
+    """
+)
+
+_SYNTHETIC_LINKS = text(
+    """
+    INSERT INTO organization_activity (organization_id, activity_id)
+    SELECT o.id, a.id
+    FROM organizations AS o, activities AS a
+    WHERE o.name LIKE 'synthetic org %' AND a.name LIKE 'synthetic activity %'
+    """
+)
+
+
+def _requests(
+    service: OrganizationService, session: AsyncSession
+) -> dict[str, Callable[[], Awaitable[object]]]:
+    everything = OrganizationFilter()
+
+    async def validated(page: int) -> bytes:
+        response = await service.search_matching(
+            everything, page=page, size=PAGE_SIZE, total_mode=TotalMode.NONE
+        )
+        # A request's session starts empty; reusing loaded objects would flatter the ORM.
+        session.expunge_all()
+        return response.model_dump_json().encode()
+
+    async def rendered(page: int) -> bytes:
+        return await service.render_matching(
+            everything, page=page, size=PAGE_SIZE, total_mode=TotalMode.NONE
+        )
+
+    return {
+        "page 1, validated": lambda: validated(1),
+        "page 1, rendered": lambda: rendered(1),
+        "page 50, validated": lambda: validated(50),
+        "page 50, rendered": lambda: rendered(50),
+    }
+
+
+async def _add_activities(session: AsyncSession) -> None:
+    await session.execute(_SYNTHETIC_ACTIVITIES)
+    await session.execute(_SYNTHETIC_LINKS)
+    await session.execute(text("ANALYZE organization_activity"))
+
+
+async def main() -> None:
+    async with synthetic_session(buildings=20_000) as session:
+        await _add_activities(session)
+        service = OrganizationService(
+            organization_repo=OrganizationRepository(session),
+            building_repo=BuildingRepository(session),
+            activity_repo=ActivityRepository(session),
+        )
+        cpu: dict[str, dict[str, float]] = {}
+        latency: dict[str, dict[str, float]] = {}
+        for name, request in _requests(service, session).items():
+            cpu[name] = await measure_cpu(request)
+            latency[name] = await measure(request)
+        report(f"CPU per request, {PAGE_SIZE} organizations with 3 activities each", cpu)
+        report("latency per request", latency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
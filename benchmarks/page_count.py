@@ -0,0 +1,55 @@
+"""
+Benchmark a page and its exact total: separate count vs ``count(*) OVER ()``.
+
+Each search runs once with the total counted in a second statement and once
+with the window total folded into the page statement. Alone, the difference is
+one round trip. Under pool pressure, every request holds its connection for
+both statements and the requests queued behind it wait for both.
+
+The synthetic rows live in one rolled-back transaction, so the pool is modelled
+as that single connection, which concurrent clients queue for.
+
+Run: python -m benchmarks.page_count
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from benchmarks.common import measure, measure_concurrent, report, synthetic_session
+from src.domain.schemas import GeoRectParams
+from src.infrastructure.repositories import OrganizationRepository
+
+CLIENTS = 16
+
+CITY = GeoRectParams(min_latitude=55.0, max_latitude=60.0, min_longitude=30.0, max_longitude=40.0)
+
+
+def _searches(repo: OrganizationRepository) -> dict[str, Callable[[], Awaitable[object]]]:
+    return {
+        "name, page 1": lambda: repo.search_by_name("org 1", limit=20),
+        "name, page 50": lambda: repo.search_by_name("org 1", offset=980, limit=20),
+        "rect, page 1": lambda: repo.find_in_rect(CITY, limit=20),
+    }
+
+
+async def main() -> None:
+    async with synthetic_session() as session:
+        repositories = {
+            "separate": OrganizationRepository(session),
+            "window": OrganizationRepository(session, window_count=True),
+        }
+        alone: dict[str, dict[str, float]] = {}
+        pressure: dict[str, dict[str, float]] = {}
+        connection = asyncio.Lock()
+        for mode, repo in repositories.items():
+            for name, search in _searches(repo).items():
+                alone[f"{name}, {mode}"] = await measure(search)
+                pressure[f"{name}, {mode}"] = await measure_concurrent(
+                    search, connection, clients=CLIENTS
+                )
+        report("page + exact total, one client", alone)
+        report(f"page + exact total, {CLIENTS} clients on one connection", pressure)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
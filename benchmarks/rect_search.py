@@ -0,0 +1,46 @@
+"""
+Benchmark organization search in rectangles of different shapes.
+
+Compares a narrow city viewport, a continent-wide viewport, a world-wide one
+and one crossing the antimeridian on a large synthetic dataset.
+
+Run: python -m benchmarks.rect_search
+"""
+
+import asyncio
+
+from benchmarks.common import measure, report, synthetic_session
+from src.domain.schemas import GeoRectParams
+from src.infrastructure.repositories import OrganizationRepository
+
+VIEWPORTS = {
+    "narrow (city)": GeoRectParams(
+        min_latitude=55.5, max_latitude=56.0, min_longitude=37.3, max_longitude=37.9
+    ),
+    "wide (continent, 150 deg)": GeoRectParams(
+        min_latitude=35.0, max_latitude=70.0, min_longitude=-10.0, max_longitude=140.0
+    ),
+    "world (360 deg)": GeoRectParams(
+        min_latitude=-85.0, max_latitude=85.0, min_longitude=-180.0, max_longitude=180.0
+    ),
+    "antimeridian (Pacific)": GeoRectParams(
+        min_latitude=-50.0, max_latitude=10.0, min_longitude=160.0, max_longitude=-150.0
+    ),
+}
+
+
+async def main() -> None:
+    async with synthetic_session() as session:
+        repo = OrganizationRepository(session)
+        results = {}
+        for name, params in VIEWPORTS.items():
+            _, total = await repo.find_in_rect(params, offset=0, limit=20)
+            print(f"{name}: {total} organizations, {len(params.longitude_ranges)} envelope(s)")
+            results[name] = await measure(
+                lambda params=params: repo.find_in_rect(params, offset=0, limit=20)
+            )
+        report("find_in_rect, first page of 20", results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""
+Micro-benchmark of list response serialization for buildings and organizations.
+
+"before" reproduces the former ``Building.latitude``/``longitude`` properties,
+which parsed the location WKB through shapely on every access. "after" uses the
+coordinates selected as ``ST_Y``/``ST_X`` columns. No database is needed.
+
+Run: python -m benchmarks.serialization
+"""
+
+import timeit
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from geoalchemy2.shape import to_shape
+
+from src.domain.models import Building
+from src.domain.schemas import BuildingRead, OrganizationRead, PaginatedResponse
+from src.services.pagination import paginate
+
+PAGE_SIZE = 100
+ROUNDS = 200
+
+
+class LegacyBuilding(SimpleNamespace):
+    @property
+    def latitude(self) -> float:
+        return to_shape(self.location).y
+
+    @property
+    def longitude(self) -> float:
+        return to_shape(self.location).x
+
+
+def _buildings(legacy: bool) -> list:
+    created_at = datetime(2025, 1, 1, tzinfo=UTC)
+    buildings = []
+    for i in range(PAGE_SIZE):
+        latitude, longitude = 55.0 + i / 1000, 37.0 + i / 1000
+        fields = {"id": uuid4(), "address": f"Address {i}", "created_at": created_at}
+        location = Building.make_location(latitude, longitude)
+        if legacy:
+            buildings.append(LegacyBuilding(location=location, **fields))
+        else:
+            buildings.append(SimpleNamespace(latitude=latitude, longitude=longitude, **fields))
+    return buildings
+
+
+def _organizations(buildings: list) -> list:
+    created_at = datetime(2025, 1, 1, tzinfo=UTC)
+    activity = SimpleNamespace(
+        id=uuid4(), name="Еда", parent_id=None, level=1, created_at=created_at
+    )
+    return [
+        SimpleNamespace(
+            id=uuid4(),
+            name=f"Organization {i}",
+            phone_numbers=["2-222-222"],
+            building=building,
+            activities=[activity],
+            created_at=created_at,
+        )
+        for i, building in enumerate(buildings)
+    ]
+
+
+def _render(items: list, schema: type) -> bytes:
+    response = paginate(items, len(items), 1, PAGE_SIZE, schema)
+    return PaginatedResponse[schema].model_validate(response).model_dump_json().encode()
+
+
+def main() -> None:
+    print(f"{'case':<32}{'before ms':>12}{'after ms':>12}")
+    for name, schema, wrap in (
+        ("/buildings/", BuildingRead, lambda buildings: buildings),
+        ("organization list", OrganizationRead, _organizations),
+    ):
+        timings = []
+        for legacy in (True, False):
+            items = wrap(_buildings(legacy))
+            seconds = timeit.timeit(
+                lambda items=items, schema=schema: _render(items, schema), number=ROUNDS
+            )
+            timings.append(seconds / ROUNDS * 1000)
+        print(f"{name + f' ({PAGE_SIZE} items)':<32}{timings[0]:>12.3f}{timings[1]:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
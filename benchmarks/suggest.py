@@ -0,0 +1,58 @@
+"""
+Micro-benchmark of prefix suggestions from the in-memory name index.
+
+Loads synthetic organization and activity names built from a small Russian
+vocabulary, so short prefixes match tens of thousands of names, then times
+lookups by prefix length. No database is needed.
+
+Run: python -m benchmarks.suggest
+"""
+
+import asyncio
+import random
+import time
+from uuid import uuid4
+
+from benchmarks.common import measure, report
+from src.domain.schemas import SuggestionKind
+from src.infrastructure.cache.names import NamePrefixIndex
+
+ORGANIZATIONS = 200_000
+ACTIVITIES = 500
+LIMIT = 10
+
+WORDS = [
+    "Рога", "Копыта", "Молочная", "Продукция", "Мясная", "Ферма", "Аптека", "Здоровье",
+    "Пекарня", "Хлеб", "Автосервис", "Шиномонтаж", "Цветы", "Книги", "Одежда", "Обувь",
+    "Ремонт", "Техника", "Строй", "Материалы", "Кафе", "Ресторан", "Столовая", "Север",
+    "Юг", "Восток", "Запад", "Центр", "Плюс", "Мир", "Дом", "Сад",
+]  # fmt: skip
+
+
+def _names(count: int, rng: random.Random) -> list[str]:
+    return [" ".join(rng.choices(WORDS, k=rng.randint(1, 4))) for _ in range(count)]
+
+
+async def main() -> None:
+    rng = random.Random(42)
+    rows = [(SuggestionKind.ORGANIZATION, uuid4(), name) for name in _names(ORGANIZATIONS, rng)]
+    rows += [(SuggestionKind.ACTIVITY, uuid4(), name) for name in _names(ACTIVITIES, rng)]
+
+    index = NamePrefixIndex()
+    started = time.perf_counter()
+    index.load(rows)
+    print(f"loaded {len(index)} keys in {time.perf_counter() - started:.2f} s")
+
+    async def lookup(prefix: str) -> None:
+        index.suggest(prefix, LIMIT)
+
+    results = {}
+    for prefix in ("м", "мол", "молочная пр", "нет такого"):
+        results[f"prefix {prefix!r}"] = await measure(
+            lambda prefix=prefix: lookup(prefix), repeat=2000, warmup=100
+        )
+    report(f"suggest, top {LIMIT} of {len(rows)} names", results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+"""data versions
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 10:12:41.503214
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TRACKED_TABLES = ("buildings", "organizations", "activities", "organization_activity")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "data_versions",
+        sa.Column("table_name", sa.String(63), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+    )
+    op.execute(
+        "INSERT INTO data_versions (table_name) VALUES "
+        + ", ".join(f"('{table}')" for table in TRACKED_TABLES)
+    )
+    op.execute(
+        """
+        CREATE FUNCTION bump_data_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE data_versions SET version = version + 1 WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in TRACKED_TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_data_version "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version()"
+        )
+
+
+def downgrade() -> None:
+    for table in TRACKED_TABLES:
+        op.execute(f"DROP TRIGGER trg_{table}_data_version ON {table}")
+    op.execute("DROP FUNCTION bump_data_version()")
+    op.drop_table("data_versions")
@@ -0,0 +1,95 @@
+"""activity path
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 11:03:27.918345
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "activities",
+        sa.Column(
+            "path",
+            sa.Text(collation="C"),
+            nullable=True,
+            comment="Materialized path of hex ids, root first, each followed by '.'",
+        ),
+    )
+    op.execute(
+        """
+        WITH RECURSIVE tree AS (
+            SELECT id, replace(id::text, '-', '') || '.' AS path
+            FROM activities
+            WHERE parent_id IS NULL
+            UNION ALL
+            SELECT a.id, tree.path || replace(a.id::text, '-', '') || '.'
+            FROM activities a
+            JOIN tree ON a.parent_id = tree.id
+        )
+        UPDATE activities SET path = tree.path FROM tree WHERE activities.id = tree.id
+        """
+    )
+    op.alter_column("activities", "path", nullable=False)
+    op.create_index(op.f("ix_activities_path"), "activities", ["path"])
+
+    # A row's path is its parent's path plus its own id, set on insert and on
+    # parent change; a move then rewrites the paths of the whole subtree.
+    op.execute(
+        """
+        CREATE FUNCTION activities_set_path() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.parent_id IS NULL THEN
+                NEW.path := replace(NEW.id::text, '-', '') || '.';
+            ELSE
+                SELECT path || replace(NEW.id::text, '-', '') || '.' INTO NEW.path
+                FROM activities WHERE id = NEW.parent_id;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_activities_set_path "
+        "BEFORE INSERT OR UPDATE OF parent_id ON activities "
+        "FOR EACH ROW EXECUTE FUNCTION activities_set_path()"
+    )
+    op.execute(
+        """
+        CREATE FUNCTION activities_move_subtree() RETURNS trigger AS $$
+        BEGIN
+            UPDATE activities
+            SET path = NEW.path || substr(path, length(OLD.path) + 1)
+            WHERE starts_with(path, OLD.path) AND id <> NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_activities_move_subtree "
+        "AFTER UPDATE OF parent_id ON activities "
+        "FOR EACH ROW WHEN (OLD.path IS DISTINCT FROM NEW.path) "
+        "EXECUTE FUNCTION activities_move_subtree()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER trg_activities_move_subtree ON activities")
+    op.execute("DROP FUNCTION activities_move_subtree()")
+    op.execute("DROP TRIGGER trg_activities_set_path ON activities")
+    op.execute("DROP FUNCTION activities_set_path()")
+    op.drop_index(op.f("ix_activities_path"), table_name="activities")
+    op.drop_column("activities", "path")
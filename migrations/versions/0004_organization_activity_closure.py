@@ -0,0 +1,121 @@
+"""organization activity closure
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 12:20:09.114782
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "organization_activity_closure",
+        sa.Column(
+            "activity_id",
+            sa.Uuid(),
+            sa.ForeignKey("activities.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "organization_id",
+            sa.Uuid(),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        comment=(
+            "Every activity an organization belongs to, directly or through a descendant; "
+            "maintained by triggers"
+        ),
+    )
+    op.create_index(
+        op.f("ix_organization_activity_closure_organization_id"),
+        "organization_activity_closure",
+        ["organization_id"],
+    )
+
+    # The ancestors of an activity, itself included, are the ids in its path.
+    op.execute(
+        """
+        CREATE FUNCTION refresh_organization_closure(org_id uuid) RETURNS void AS $$
+        BEGIN
+            DELETE FROM organization_activity_closure WHERE organization_id = org_id;
+            INSERT INTO organization_activity_closure (activity_id, organization_id)
+            SELECT DISTINCT unnest(string_to_array(rtrim(a.path, '.'), '.'))::uuid, org_id
+            FROM organization_activity oa
+            JOIN activities a ON a.id = oa.activity_id
+            WHERE oa.organization_id = org_id;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION organization_activity_refresh_closure() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM refresh_organization_closure(OLD.organization_id);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM refresh_organization_closure(NEW.organization_id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_organization_activity_closure "
+        "AFTER INSERT OR UPDATE OR DELETE ON organization_activity "
+        "FOR EACH ROW EXECUTE FUNCTION organization_activity_refresh_closure()"
+    )
+    # Moving an activity rewrites the paths of its subtree row by row, so every
+    # organization attached to a moved activity gets its closure rebuilt.
+    op.execute(
+        """
+        CREATE FUNCTION activities_refresh_closure() RETURNS trigger AS $$
+        BEGIN
+            PERFORM refresh_organization_closure(organization_id)
+            FROM organization_activity WHERE activity_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_activities_refresh_closure "
+        "AFTER UPDATE OF parent_id, path ON activities "
+        "FOR EACH ROW WHEN (OLD.path IS DISTINCT FROM NEW.path) "
+        "EXECUTE FUNCTION activities_refresh_closure()"
+    )
+
+    op.execute(
+        """
+        INSERT INTO organization_activity_closure (activity_id, organization_id)
+        SELECT DISTINCT unnest(string_to_array(rtrim(a.path, '.'), '.'))::uuid, oa.organization_id
+        FROM organization_activity oa
+        JOIN activities a ON a.id = oa.activity_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER trg_activities_refresh_closure ON activities")
+    op.execute("DROP FUNCTION activities_refresh_closure()")
+    op.execute("DROP TRIGGER trg_organization_activity_closure ON organization_activity")
+    op.execute("DROP FUNCTION organization_activity_refresh_closure()")
+    op.execute("DROP FUNCTION refresh_organization_closure(uuid)")
+    op.drop_index(
+        op.f("ix_organization_activity_closure_organization_id"),
+        table_name="organization_activity_closure",
+    )
+    op.drop_table("organization_activity_closure")
@@ -0,0 +1,28 @@
+"""organization name id index
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 14:02:41.530917
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # (name, id) backs the keyset predicate ``(name, id) > (:name, :id)`` and
+    # still serves every lookup the single-column name index did.
+    op.create_index("ix_organizations_name_id", "organizations", ["name", "id"])
+    op.drop_index(op.f("ix_organizations_name"), table_name="organizations")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_organizations_name"), "organizations", ["name"])
+    op.drop_index("ix_organizations_name_id", table_name="organizations")
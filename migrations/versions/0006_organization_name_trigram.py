@@ -0,0 +1,34 @@
+"""organization name trigram index
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 16:48:12.730415
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # GiST rather than GIN: besides the ``<%`` and ILIKE filters it can return rows
+    # in ``<<->`` distance order, so a ranked LIMIT query stops after the top rows.
+    op.create_index(
+        "ix_organizations_name_trgm",
+        "organizations",
+        ["name"],
+        postgresql_using="gist",
+        postgresql_ops={"name": "gist_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    # pg_trgm stays: it may have been installed before this revision or be used elsewhere.
+    op.drop_index("ix_organizations_name_trgm", table_name="organizations")
@@ -0,0 +1,158 @@
+"""organization search document
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 18:05:37.281964
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0007"
+down_revision: str | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "organizations",
+        sa.Column(
+            "search_document",
+            postgresql.TSVECTOR(),
+            nullable=True,
+            comment=(
+                "Russian full-text document: name (A), activity names (B) and building "
+                "address (C); maintained by triggers"
+            ),
+        ),
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION organization_search_document(
+            org_id uuid, org_name text, org_building_id uuid
+        ) RETURNS tsvector AS $$
+            SELECT setweight(to_tsvector('russian', org_name), 'A')
+                || setweight(to_tsvector('russian', coalesce((
+                    SELECT string_agg(a.name, ' ')
+                    FROM organization_activity oa
+                    JOIN activities a ON a.id = oa.activity_id
+                    WHERE oa.organization_id = org_id
+                ), '')), 'B')
+                || setweight(to_tsvector('russian', coalesce((
+                    SELECT address FROM buildings WHERE id = org_building_id
+                ), '')), 'C')
+        $$ LANGUAGE sql STABLE
+        """
+    )
+    # The other triggers only SET search_document, so they do not re-enter this one.
+    op.execute(
+        """
+        CREATE FUNCTION organizations_set_search_document() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_document := organization_search_document(
+                NEW.id, NEW.name, NEW.building_id
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_organizations_search_document "
+        "BEFORE INSERT OR UPDATE OF name, building_id ON organizations "
+        "FOR EACH ROW EXECUTE FUNCTION organizations_set_search_document()"
+    )
+    op.execute(
+        """
+        CREATE FUNCTION organization_activity_refresh_search() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE organizations
+                SET search_document = organization_search_document(id, name, building_id)
+                WHERE id = OLD.organization_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE organizations
+                SET search_document = organization_search_document(id, name, building_id)
+                WHERE id = NEW.organization_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_organization_activity_search "
+        "AFTER INSERT OR UPDATE OR DELETE ON organization_activity "
+        "FOR EACH ROW EXECUTE FUNCTION organization_activity_refresh_search()"
+    )
+    op.execute(
+        """
+        CREATE FUNCTION activities_refresh_search() RETURNS trigger AS $$
+        BEGIN
+            UPDATE organizations
+            SET search_document = organization_search_document(id, name, building_id)
+            WHERE id IN (
+                SELECT organization_id FROM organization_activity WHERE activity_id = NEW.id
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_activities_refresh_search "
+        "AFTER UPDATE OF name ON activities "
+        "FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name) "
+        "EXECUTE FUNCTION activities_refresh_search()"
+    )
+    op.execute(
+        """
+        CREATE FUNCTION buildings_refresh_search() RETURNS trigger AS $$
+        BEGIN
+            UPDATE organizations
+            SET search_document = organization_search_document(id, name, building_id)
+            WHERE building_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_buildings_refresh_search "
+        "AFTER UPDATE OF address ON buildings "
+        "FOR EACH ROW WHEN (OLD.address IS DISTINCT FROM NEW.address) "
+        "EXECUTE FUNCTION buildings_refresh_search()"
+    )
+
+    op.execute(
+        "UPDATE organizations "
+        "SET search_document = organization_search_document(id, name, building_id)"
+    )
+    op.alter_column("organizations", "search_document", nullable=False)
+    op.create_index(
+        "ix_organizations_search_document",
+        "organizations",
+        ["search_document"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_organizations_search_document", table_name="organizations")
+    op.execute("DROP TRIGGER trg_buildings_refresh_search ON buildings")
+    op.execute("DROP FUNCTION buildings_refresh_search()")
+    op.execute("DROP TRIGGER trg_activities_refresh_search ON activities")
+    op.execute("DROP FUNCTION activities_refresh_search()")
+    op.execute("DROP TRIGGER trg_organization_activity_search ON organization_activity")
+    op.execute("DROP FUNCTION organization_activity_refresh_search()")
+    op.execute("DROP TRIGGER trg_organizations_search_document ON organizations")
+    op.execute("DROP FUNCTION organizations_set_search_document()")
+    op.execute("DROP FUNCTION organization_search_document(uuid, text, uuid)")
+    op.drop_column("organizations", "search_document")
@@ -0,0 +1,83 @@
+"""organization phone
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 19:21:54.602117
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0008"
+down_revision: str | None = "0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "organization_phone",
+        sa.Column("reversed_digits", sa.Text(collation="C"), primary_key=True),
+        sa.Column(
+            "organization_id",
+            sa.Uuid(),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        comment=(
+            "Digits of every organization phone number, reversed so that a number "
+            "suffix is a key prefix; maintained by triggers"
+        ),
+    )
+    op.create_index(
+        op.f("ix_organization_phone_organization_id"),
+        "organization_phone",
+        ["organization_id"],
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION organizations_refresh_phones() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' THEN
+                DELETE FROM organization_phone WHERE organization_id = OLD.id;
+            END IF;
+            INSERT INTO organization_phone (reversed_digits, organization_id)
+            SELECT DISTINCT reverse(digits), NEW.id
+            FROM unnest(NEW.phone_numbers) AS phone,
+                LATERAL regexp_replace(phone, '[^0-9]', '', 'g') AS digits
+            WHERE digits <> '';
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_organizations_refresh_phones "
+        "AFTER INSERT OR UPDATE OF phone_numbers ON organizations "
+        "FOR EACH ROW EXECUTE FUNCTION organizations_refresh_phones()"
+    )
+
+    op.execute(
+        """
+        INSERT INTO organization_phone (reversed_digits, organization_id)
+        SELECT DISTINCT reverse(digits), o.id
+        FROM organizations o,
+            unnest(o.phone_numbers) AS phone,
+            LATERAL regexp_replace(phone, '[^0-9]', '', 'g') AS digits
+        WHERE digits <> ''
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER trg_organizations_refresh_phones ON organizations")
+    op.execute("DROP FUNCTION organizations_refresh_phones()")
+    op.drop_index(
+        op.f("ix_organization_phone_organization_id"),
+        table_name="organization_phone",
+    )
+    op.drop_table("organization_phone")
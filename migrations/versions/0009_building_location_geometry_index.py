@@ -0,0 +1,32 @@
+"""building location geometry index
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 10:12:37.418206
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0009"
+down_revision: str | None = "0008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Vector tiles filter on the location as planar lon/lat geometry: tile envelopes
+    # 180° or wider have no well-defined edges on the sphere.
+    op.create_index(
+        "ix_buildings_location_geometry",
+        "buildings",
+        [sa.text("(location::geometry(Geometry,4326))")],
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_buildings_location_geometry", table_name="buildings")
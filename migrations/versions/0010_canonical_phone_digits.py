@@ -0,0 +1,87 @@
+"""canonical phone digits
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 11:03:52.160844
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0010"
+down_revision: str | None = "0009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Mirrors ``phone_digits``: an 11-digit number with the domestic trunk prefix 8
+    # is stored with the country code 7, so "8-923-..." and "+7 923 ..." are equal.
+    op.execute(
+        """
+        CREATE FUNCTION phone_digits(phone text) RETURNS text AS $$
+            SELECT CASE
+                WHEN digits ~ '^8[0-9]{10}$' THEN '7' || substr(digits, 2)
+                ELSE digits
+            END
+            FROM regexp_replace(phone, '[^0-9]', '', 'g') AS digits
+        $$ LANGUAGE sql IMMUTABLE STRICT
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION organizations_refresh_phones() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' THEN
+                DELETE FROM organization_phone WHERE organization_id = OLD.id;
+            END IF;
+            INSERT INTO organization_phone (reversed_digits, organization_id)
+            SELECT DISTINCT reverse(digits), NEW.id
+            FROM unnest(NEW.phone_numbers) AS phone,
+                LATERAL phone_digits(phone) AS digits
+            WHERE digits <> '';
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    _rebuild("phone_digits(phone)")
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION organizations_refresh_phones() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE' THEN
+                DELETE FROM organization_phone WHERE organization_id = OLD.id;
+            END IF;
+            INSERT INTO organization_phone (reversed_digits, organization_id)
+            SELECT DISTINCT reverse(digits), NEW.id
+            FROM unnest(NEW.phone_numbers) AS phone,
+                LATERAL regexp_replace(phone, '[^0-9]', '', 'g') AS digits
+            WHERE digits <> '';
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    _rebuild("regexp_replace(phone, '[^0-9]', '', 'g')")
+    op.execute("DROP FUNCTION phone_digits(text)")
+
+
+def _rebuild(digits: str) -> None:
+    """Refill the phone table from every organization with ``digits`` of each ``phone``."""
+    op.execute("DELETE FROM organization_phone")
+    op.execute(
+        f"""
+        INSERT INTO organization_phone (reversed_digits, organization_id)
+        SELECT DISTINCT reverse(digits), o.id
+        FROM organizations o,
+            unnest(o.phone_numbers) AS phone,
+            LATERAL {digits} AS digits
+        WHERE digits <> ''
+        """
+    )
@@ -0,0 +1,61 @@
+"""data version sequences
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 12:26:09.931574
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0011"
+down_revision: str | None = "0010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TRACKED_TABLES = ("buildings", "organizations", "activities", "organization_activity")
+
+
+def upgrade() -> None:
+    # A sequence per table instead of a counter row: ``nextval`` takes no row lock,
+    # so concurrent writers to a table no longer queue behind each other's commit.
+    for table in TRACKED_TABLES:
+        op.execute(f"CREATE SEQUENCE data_version_{table}")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_data_version() RETURNS trigger AS $$
+        BEGIN
+            PERFORM nextval(('data_version_' || TG_TABLE_NAME)::regclass);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.drop_table("data_versions")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "data_versions",
+        sa.Column("table_name", sa.String(63), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+    )
+    op.execute(
+        "INSERT INTO data_versions (table_name) VALUES "
+        + ", ".join(f"('{table}')" for table in TRACKED_TABLES)
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_data_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE data_versions SET version = version + 1 WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in TRACKED_TABLES:
+        op.execute(f"DROP SEQUENCE data_version_{table}")
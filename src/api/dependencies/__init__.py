@@ -6,7 +6,10 @@ from src.api.dependencies.auth import verify_api_key
 from src.api.dependencies.database import SessionDep
 from src.api.dependencies.services import (
     BuildingServiceDep,
+    ExportServiceDep,
     OrganizationServiceDep,
+    SuggestServiceDep,
+    TileServiceDep,
 )
 
 ApiKeyDep = Annotated[str, Depends(verify_api_key)]
@@ -14,6 +17,9 @@ ApiKeyDep = Annotated[str, Depends(verify_api_key)]
 __all__ = [
     "ApiKeyDep",
     "BuildingServiceDep",
+    "ExportServiceDep",
     "OrganizationServiceDep",
     "SessionDep",
+    "SuggestServiceDep",
+    "TileServiceDep",
 ]
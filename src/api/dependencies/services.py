@@ -1,26 +1,78 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Annotated
 
 from fastapi import Depends
 
 from src.api.dependencies.database import SessionDep
+from src.core.config import config
+from src.infrastructure.cache import (
+    activity_tree_cache,
+    building_spatial_index,
+    count_cache,
+    name_prefix_index,
+    search_cache,
+    tile_cache,
+)
+from src.infrastructure.database import async_session_factory
 from src.infrastructure.repositories.activity import ActivityRepository
 from src.infrastructure.repositories.building import BuildingRepository
 from src.infrastructure.repositories.organization import OrganizationRepository
 from src.services.building import BuildingService
+from src.services.export import OrganizationExportService
 from src.services.organization import OrganizationService
+from src.services.suggest import SuggestService
+from src.services.tile import TileService
 
 
 def get_organization_service(session: SessionDep) -> OrganizationService:
+    window_count = config.pagination.window_count
     return OrganizationService(
-        organization_repo=OrganizationRepository(session),
+        organization_repo=OrganizationRepository(session, window_count=window_count),
         building_repo=BuildingRepository(session),
         activity_repo=ActivityRepository(session),
+        spatial_index=building_spatial_index,
+        search_cache=search_cache if config.search_cache.enabled else None,
+        search_cache_precision=config.search_cache.precision,
+        activity_tree=activity_tree_cache,
+        count_cache=count_cache if config.count_cache.enabled else None,
     )
 
 
 def get_building_service(session: SessionDep) -> BuildingService:
-    return BuildingService(repository=BuildingRepository(session))
+    return BuildingService(
+        repository=BuildingRepository(session, window_count=config.pagination.window_count),
+        count_cache=count_cache if config.count_cache.enabled else None,
+    )
+
+
+@asynccontextmanager
+async def _own_organization_repository() -> AsyncIterator[OrganizationRepository]:
+    """A repository on a session of its own, for bodies streamed after the request's."""
+    async with async_session_factory() as session:
+        yield OrganizationRepository(session)
+
+
+def get_export_service() -> OrganizationExportService:
+    return OrganizationExportService(
+        repository_factory=_own_organization_repository,
+        batch_size=config.export.batch_size,
+    )
+
+
+def get_suggest_service() -> SuggestService:
+    return SuggestService(
+        index=name_prefix_index if config.suggest.enabled else None,
+        repository_factory=_own_organization_repository,
+    )
+
+
+def get_tile_service(session: SessionDep) -> TileService:
+    return TileService(repository=BuildingRepository(session), cache=tile_cache)
 
 
 OrganizationServiceDep = Annotated[OrganizationService, Depends(get_organization_service)]
 BuildingServiceDep = Annotated[BuildingService, Depends(get_building_service)]
+TileServiceDep = Annotated[TileService, Depends(get_tile_service)]
+ExportServiceDep = Annotated[OrganizationExportService, Depends(get_export_service)]
+SuggestServiceDep = Annotated[SuggestService, Depends(get_suggest_service)]
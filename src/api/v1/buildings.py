@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Query
 
 from src.api.dependencies import ApiKeyDep, BuildingServiceDep
-from src.domain.schemas import BuildingRead, PaginatedResponse
+from src.domain.schemas import BuildingRead, PaginatedResponse, TotalMode
 
 router = APIRouter(prefix="/buildings", tags=["Buildings"])
 
@@ -17,5 +17,12 @@ async def get_buildings(
     service: BuildingServiceDep,
     page: int = Query(default=1, ge=1, description="Page number"),
     size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(
+        default=None, description="`next_cursor` of the previous page; replaces `page`"
+    ),
+    total: TotalMode = Query(
+        default=TotalMode.EXACT,
+        description="`exact` count, planner `estimate`, or `none` with `has_next` instead",
+    ),
 ) -> PaginatedResponse[BuildingRead]:
-    return await service.get_all(page=page, size=size)
+    return await service.get_all(page=page, size=size, cursor=cursor, total_mode=total)
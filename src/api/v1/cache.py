@@ -0,0 +1,21 @@
+from fastapi import APIRouter
+
+from src.api.dependencies import ApiKeyDep
+from src.domain.schemas import CacheStatsRead, CacheStatsResponse
+from src.infrastructure.cache import count_cache, search_cache, tile_cache
+
+router = APIRouter(prefix="/cache", tags=["Cache"])
+
+
+@router.get(
+    "/stats",
+    response_model=CacheStatsResponse,
+    summary="Cache statistics",
+    description="Size, hit, miss and eviction counters of the in-process caches.",
+)
+async def get_cache_stats(_: ApiKeyDep) -> CacheStatsResponse:
+    return CacheStatsResponse(
+        search=CacheStatsRead(**search_cache.stats._asdict()),
+        tiles=CacheStatsRead(**tile_cache.stats._asdict()),
+        counts=CacheStatsRead(**count_cache.stats._asdict()),
+    )
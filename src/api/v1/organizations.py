@@ -1,13 +1,51 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 
-from src.api.dependencies import ApiKeyDep, OrganizationServiceDep
-from src.domain.schemas import GeoCircleParams, GeoRectParams, OrganizationRead, PaginatedResponse
+from src.api.dependencies import (
+    ApiKeyDep,
+    ExportServiceDep,
+    OrganizationServiceDep,
+    SuggestServiceDep,
+)
+from src.core.config import config
+from src.domain.schemas import (
+    ClusterResponse,
+    ExportFormat,
+    GeoBatchParams,
+    GeoBatchResponse,
+    GeoCircleParams,
+    GeoClusterParams,
+    GeoOrder,
+    GeoPointParams,
+    GeoPolygonParams,
+    GeoRectParams,
+    NameOrder,
+    OrganizationBatchParams,
+    OrganizationBatchResponse,
+    OrganizationDistanceRead,
+    OrganizationFilter,
+    OrganizationRead,
+    PaginatedResponse,
+    PhoneMatch,
+    SuggestionRead,
+    TotalMode,
+)
+from src.domain.schemas.batch import MAX_BATCH_IDS, MAX_BATCH_ITEMS, MAX_BATCH_QUERIES
+from src.domain.schemas.geo import MAX_POLYGON_VERTICES
+from src.domain.schemas.search import MIN_PHONE_SUFFIX
+from src.domain.schemas.suggest import MAX_SUGGESTIONS
+from src.services.export import MEDIA_TYPES
 
 router = APIRouter(prefix="/organizations", tags=["Organizations"])
 
 
+def _json_response(content: bytes) -> Response:
+    """Send JSON the database already rendered, skipping response model validation."""
+    return Response(content=content, media_type="application/json")
+
+
 @router.get(
     "/by-building/{building_id}",
     response_model=PaginatedResponse[OrganizationRead],
@@ -21,8 +59,23 @@ async def get_by_building(
     service: OrganizationServiceDep,
     page: int = Query(default=1, ge=1, description="Page number"),
     size: int = Query(default=20, ge=1, le=100, description="Items per page"),
-) -> PaginatedResponse[OrganizationRead]:
-    return await service.get_by_building(building_id, page=page, size=size)
+    cursor: str | None = Query(
+        default=None, description="`next_cursor` of the previous page; replaces `page`"
+    ),
+    total: TotalMode = Query(
+        default=TotalMode.EXACT,
+        description="`exact` count, planner `estimate`, or `none` with `has_next` instead",
+    ),
+) -> PaginatedResponse[OrganizationRead] | Response:
+    if config.pagination.render_in_database:
+        return _json_response(
+            await service.render_by_building(
+                building_id, page=page, size=size, cursor=cursor, total_mode=total
+            )
+        )
+    return await service.get_by_building(
+        building_id, page=page, size=size, cursor=cursor, total_mode=total
+    )
 
 
 @router.get(
@@ -38,8 +91,17 @@ async def get_by_activity(
     service: OrganizationServiceDep,
     page: int = Query(default=1, ge=1, description="Page number"),
     size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(
+        default=None, description="`next_cursor` of the previous page; replaces `page`"
+    ),
+    total: TotalMode = Query(
+        default=TotalMode.EXACT,
+        description="`exact` count, planner `estimate`, or `none` with `has_next` instead",
+    ),
 ) -> PaginatedResponse[OrganizationRead]:
-    return await service.get_by_activity(activity_id, page=page, size=size)
+    return await service.get_by_activity(
+        activity_id, page=page, size=size, cursor=cursor, total_mode=total
+    )
 
 
 @router.get(
@@ -55,40 +117,167 @@ async def search_by_activity_tree(
     service: OrganizationServiceDep,
     page: int = Query(default=1, ge=1, description="Page number"),
     size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(
+        default=None, description="`next_cursor` of the previous page; replaces `page`"
+    ),
+    total: TotalMode = Query(
+        default=TotalMode.EXACT,
+        description="`exact` count, planner `estimate`, or `none` with `has_next` instead",
+    ),
 ) -> PaginatedResponse[OrganizationRead]:
-    return await service.search_by_activity_tree(activity_id, page=page, size=size)
+    return await service.search_by_activity_tree(
+        activity_id, page=page, size=size, cursor=cursor, total_mode=total
+    )
+
+
+@router.get(
+    "/suggest",
+    response_model=list[SuggestionRead],
+    summary="Name suggestions",
+    description=(
+        "Organization and activity names with a word starting with the prefix, "
+        "ignoring case, for search-as-you-type."
+    ),
+)
+async def suggest(
+    _: ApiKeyDep,
+    service: SuggestServiceDep,
+    prefix: str = Query(..., min_length=1, max_length=100, description="Typed prefix"),
+    limit: int = Query(default=10, ge=1, le=MAX_SUGGESTIONS, description="Number of suggestions"),
+) -> list[SuggestionRead]:
+    return await service.suggest(prefix, limit)
+
+
+@router.get(
+    "/search",
+    response_model=PaginatedResponse[OrganizationRead],
+    summary="Full-text search of organizations",
+    description=(
+        "Searches organization names, activity names and building addresses at once, "
+        "with Russian stemming. All words must match, in any of the fields; quoted "
+        "phrases, `or` and `-word` are supported. Results are ranked with name "
+        "matches above activity matches above address matches."
+    ),
+)
+async def search(
+    _: ApiKeyDep,
+    service: OrganizationServiceDep,
+    q: str = Query(..., min_length=1, description="Search query"),
+    page: int = Query(default=1, ge=1, description="Page number"),
+    size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    total: TotalMode = Query(
+        default=TotalMode.EXACT,
+        description="`exact` count, planner `estimate`, or `none` with `has_next` instead",
+    ),
+) -> PaginatedResponse[OrganizationRead]:
+    return await service.search(q, page=page, size=size, total_mode=total)
+
+
+@router.get(
+    "/search/by-phone",
+    response_model=PaginatedResponse[OrganizationRead],
+    summary="Search organizations by phone number",
+    description=(
+        "Finds organizations by phone number in any format: only its digits are "
+        "compared, and a leading 8 of an 11-digit number counts as the country code 7. "
+        "`suffix` matches numbers ending with the given digits, such as a "
+        f"local number without its area code, and needs at least {MIN_PHONE_SUFFIX} digits."
+    ),
+    responses={400: {"description": "Too few digits in the phone number"}},
+)
+async def search_by_phone(
+    _: ApiKeyDep,
+    service: OrganizationServiceDep,
+    phone: str = Query(..., min_length=1, max_length=50, description="Phone number"),
+    match: PhoneMatch = Query(default=PhoneMatch.EXACT, description="Exact or suffix match"),
+    page: int = Query(default=1, ge=1, description="Page number"),
+    size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(
+        default=None, description="`next_cursor` of the previous page; replaces `page`"
+    ),
+    total: TotalMode = Query(
+        default=TotalMode.EXACT,
+        description="`exact` count, planner `estimate`, or `none` with `has_next` instead",
+    ),
+) -> PaginatedResponse[OrganizationRead]:
+    return await service.search_by_phone(
+        phone, match=match, page=page, size=size, cursor=cursor, total_mode=total
+    )
 
 
 @router.get(
     "/search/by-name",
     response_model=PaginatedResponse[OrganizationRead],
     summary="Search organizations by name",
-    description="Case-insensitive partial name search across all organizations.",
+    description=(
+        "Case-insensitive partial name search across all organizations. "
+        "With `order=relevance` the search tolerates typos and returns the closest "
+        "matches first; such pages are addressed by number, not cursor."
+    ),
+    responses={400: {"description": "Cursor given with relevance order"}},
 )
 async def search_by_name(
     _: ApiKeyDep,
     service: OrganizationServiceDep,
     name: str = Query(..., min_length=1, description="Search query"),
+    order: NameOrder = Query(default=NameOrder.NAME, description="Result ordering"),
     page: int = Query(default=1, ge=1, description="Page number"),
     size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(
+        default=None, description="`next_cursor` of the previous page; replaces `page`"
+    ),
+    total: TotalMode = Query(
+        default=TotalMode.EXACT,
+        description="`exact` count, planner `estimate`, or `none` with `has_next` instead",
+    ),
 ) -> PaginatedResponse[OrganizationRead]:
-    return await service.search_by_name(name, page=page, size=size)
+    return await service.search_by_name(
+        name, order=order, page=page, size=size, cursor=cursor, total_mode=total
+    )
 
 
 @router.get(
     "/search/in-radius",
-    response_model=PaginatedResponse[OrganizationRead],
+    response_model=PaginatedResponse[OrganizationDistanceRead],
     summary="Search organizations within radius",
-    description="Find organizations in buildings within a given radius from a geographic point.",
+    description=(
+        "Find organizations in buildings within a given radius from a geographic point. "
+        "Each organization carries its distance from the point in meters."
+    ),
 )
 async def search_in_radius(
     _: ApiKeyDep,
     service: OrganizationServiceDep,
     params: GeoCircleParams = Depends(),
+    order: GeoOrder = Query(default=GeoOrder.NONE, description="Result ordering"),
     page: int = Query(default=1, ge=1, description="Page number"),
     size: int = Query(default=20, ge=1, le=100, description="Items per page"),
-) -> PaginatedResponse[OrganizationRead]:
-    return await service.find_in_radius(params, page=page, size=size)
+    cursor: str | None = Query(
+        default=None, description="`next_cursor` of the previous page; replaces `page`"
+    ),
+    total: TotalMode = Query(
+        default=TotalMode.EXACT,
+        description="`exact` count, planner `estimate`, or `none` with `has_next` instead",
+    ),
+) -> PaginatedResponse[OrganizationDistanceRead]:
+    return await service.find_in_radius(
+        params, order=order, page=page, size=size, cursor=cursor, total_mode=total
+    )
+
+
+@router.get(
+    "/search/nearest",
+    response_model=list[OrganizationDistanceRead],
+    summary="Nearest organizations",
+    description="Returns organizations closest to a geographic point, nearest first.",
+)
+async def search_nearest(
+    _: ApiKeyDep,
+    service: OrganizationServiceDep,
+    params: GeoPointParams = Depends(),
+    limit: int = Query(default=20, ge=1, le=100, description="Number of organizations"),
+) -> list[OrganizationDistanceRead]:
+    return await service.find_nearest(params, limit=limit)
 
 
 @router.get(
@@ -103,8 +292,161 @@ async def search_in_rect(
     params: GeoRectParams = Depends(),
     page: int = Query(default=1, ge=1, description="Page number"),
     size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(
+        default=None, description="`next_cursor` of the previous page; replaces `page`"
+    ),
+    total: TotalMode = Query(
+        default=TotalMode.EXACT,
+        description="`exact` count, planner `estimate`, or `none` with `has_next` instead",
+    ),
+) -> PaginatedResponse[OrganizationRead]:
+    return await service.find_in_rect(params, page=page, size=size, cursor=cursor, total_mode=total)
+
+
+@router.post(
+    "/search/in-polygon",
+    response_model=PaginatedResponse[OrganizationRead],
+    summary="Search organizations within polygon",
+    description=(
+        "Find organizations in buildings within a GeoJSON Polygon or MultiPolygon. "
+        f"The geometry is simplified and may keep at most {MAX_POLYGON_VERTICES} vertices."
+    ),
+)
+async def search_in_polygon(
+    params: GeoPolygonParams,
+    _: ApiKeyDep,
+    service: OrganizationServiceDep,
+    page: int = Query(default=1, ge=1, description="Page number"),
+    size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(
+        default=None, description="`next_cursor` of the previous page; replaces `page`"
+    ),
+    total: TotalMode = Query(
+        default=TotalMode.EXACT,
+        description="`exact` count, planner `estimate`, or `none` with `has_next` instead",
+    ),
 ) -> PaginatedResponse[OrganizationRead]:
-    return await service.find_in_rect(params, page=page, size=size)
+    return await service.find_in_polygon(
+        params, page=page, size=size, cursor=cursor, total_mode=total
+    )
+
+
+@router.post(
+    "/search/query",
+    response_model=PaginatedResponse[OrganizationRead],
+    summary="Search organizations by combined conditions",
+    description=(
+        "Finds organizations meeting every given condition at once: name, building, "
+        "activity with or without its nested activities, circle, rectangle or polygon. "
+        "An empty filter matches every organization."
+    ),
+)
+async def search_query(
+    filters: OrganizationFilter,
+    _: ApiKeyDep,
+    service: OrganizationServiceDep,
+    page: int = Query(default=1, ge=1, description="Page number"),
+    size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(
+        default=None, description="`next_cursor` of the previous page; replaces `page`"
+    ),
+    total: TotalMode = Query(
+        default=TotalMode.EXACT,
+        description="`exact` count, planner `estimate`, or `none` with `has_next` instead",
+    ),
+) -> PaginatedResponse[OrganizationRead] | Response:
+    if config.pagination.render_in_database:
+        return _json_response(
+            await service.render_matching(
+                filters, page=page, size=size, cursor=cursor, total_mode=total
+            )
+        )
+    return await service.search_matching(
+        filters, page=page, size=size, cursor=cursor, total_mode=total
+    )
+
+
+@router.post(
+    "/search/batch",
+    response_model=GeoBatchResponse,
+    summary="Batch geo search",
+    description=(
+        f"Runs up to {MAX_BATCH_QUERIES} radius and rectangle searches in one request. "
+        "Each query gets its total and up to `limit` organizations, in request order; "
+        "set `limit` to 0 to get counts only. The number of queries times `limit` may "
+        f"not exceed {MAX_BATCH_ITEMS}."
+    ),
+)
+async def search_batch(
+    params: GeoBatchParams,
+    _: ApiKeyDep,
+    service: OrganizationServiceDep,
+) -> GeoBatchResponse:
+    return await service.find_in_batch(params)
+
+
+@router.post(
+    "/batch",
+    response_model=OrganizationBatchResponse,
+    summary="Get organizations by IDs",
+    description=(
+        f"Returns up to {MAX_BATCH_IDS} organizations in one request, one result per id "
+        "in request order. Missing organizations have `found` false and a null `item`."
+    ),
+)
+async def get_organizations_batch(
+    params: OrganizationBatchParams,
+    _: ApiKeyDep,
+    service: OrganizationServiceDep,
+) -> OrganizationBatchResponse:
+    return await service.get_many(params.ids)
+
+
+@router.post(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export organizations",
+    description=(
+        "Streams every organization matching the filter, in id order, as NDJSON "
+        "(one organization per line) or CSV. All given conditions must hold; "
+        "an empty filter exports the whole directory."
+    ),
+    responses={
+        200: {"content": {media_type: {} for media_type in MEDIA_TYPES.values()}},
+    },
+)
+async def export_organizations(
+    filters: OrganizationFilter,
+    _: ApiKeyDep,
+    service: ExportServiceDep,
+    fmt: ExportFormat = Query(
+        default=ExportFormat.NDJSON, alias="format", description="Output format"
+    ),
+) -> StreamingResponse:
+    return StreamingResponse(
+        service.export(filters, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="organizations.{fmt}"'},
+    )
+
+
+@router.get(
+    "/clusters",
+    response_model=ClusterResponse,
+    summary="Organization clusters in a viewport",
+    description=(
+        "Counts organizations per grid cell within a bounding rectangle. "
+        "The grid is derived from the map zoom level or given as a cell size in degrees."
+    ),
+    responses={400: {"description": "Viewport has too many cells for the grid"}},
+)
+async def get_clusters(
+    _: ApiKeyDep,
+    service: OrganizationServiceDep,
+    params: GeoRectParams = Depends(),
+    grid: GeoClusterParams = Depends(),
+) -> ClusterResponse:
+    return await service.get_clusters(params, grid)
 
 
 @router.get(
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Path, Response
+
+from src.api.dependencies import ApiKeyDep, TileServiceDep
+from src.core.config import config
+
+router = APIRouter(prefix="/tiles", tags=["Tiles"])
+
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
+
+@router.get(
+    "/{z}/{x}/{y}.mvt",
+    response_class=Response,
+    summary="Buildings vector tile",
+    description=(
+        "Mapbox Vector Tile with a `buildings` layer. Each feature has the building id, "
+        "address, organization count and the ids of its most common activities."
+    ),
+    responses={
+        200: {"content": {MVT_MEDIA_TYPE: {}}},
+        400: {"description": "Tile coordinates outside the zoom grid"},
+    },
+)
+async def get_tile(
+    _: ApiKeyDep,
+    service: TileServiceDep,
+    z: int = Path(ge=0, le=22, description="Zoom level"),
+    x: int = Path(ge=0, description="Tile column"),
+    y: int = Path(ge=0, description="Tile row"),
+) -> Response:
+    tile = await service.get_tile(z, x, y)
+    return Response(
+        content=tile,
+        media_type=MVT_MEDIA_TYPE,
+        headers={"Cache-Control": f"private, max-age={config.tiles.cache_ttl}"},
+    )
@@ -53,11 +53,76 @@ class Config:
     @environ.config
     class Activity:
         max_depth: int = environ.var(default=3, converter=int)
+        cache_enabled: bool = environ.var(default=False, converter=_str_to_bool)
+        cache_check_interval: int = environ.var(default=30, converter=int)
+
+    @environ.config
+    class SpatialIndex:
+        enabled: bool = environ.var(default=False, converter=_str_to_bool)
+        refresh_interval: int = environ.var(default=300, converter=int)
+
+    @environ.config
+    class Tiles:
+        cache_size: int = environ.var(default=2048, converter=int)
+        cache_ttl: int = environ.var(default=600, converter=int)
+        check_interval: int = environ.var(default=5, converter=int)
+
+    @environ.config
+    class SearchCache:
+        enabled: bool = environ.var(default=False, converter=_str_to_bool)
+        size: int = environ.var(default=4096, converter=int)
+        ttl: int = environ.var(default=60, converter=int)
+        precision: int = environ.var(default=4, converter=int)
+        check_interval: int = environ.var(default=5, converter=int)
+
+    @environ.config
+    class Pagination:
+        """Page loading options.
+
+        ``render_in_database`` applies to ``/organizations/by-building/{id}`` and
+        ``/organizations/search/query`` only, the endpoints whose pages are built by
+        ``OrganizationRepository._render_page``. Every other paginated endpoint
+        validates ORM objects whatever the flag says: the radius search adds a
+        distance to each item, the radius and rectangle searches may be answered
+        from the spatial index and the search cache, and relevance name search and
+        the id-ordered searches page differently from ``_render_page``.
+        """
+
+        window_count: bool = environ.var(default=False, converter=_str_to_bool)
+        render_in_database: bool = environ.var(default=False, converter=_str_to_bool)
+
+    @environ.config
+    class Suggest:
+        enabled: bool = environ.var(default=False, converter=_str_to_bool)
+        check_interval: int = environ.var(default=10, converter=int)
+
+    @environ.config
+    class NameSearch:
+        similarity: float = environ.var(default=0.5, converter=float)
+
+    @environ.config
+    class Export:
+        batch_size: int = environ.var(default=1000, converter=int)
+
+    @environ.config
+    class CountCache:
+        enabled: bool = environ.var(default=False, converter=_str_to_bool)
+        size: int = environ.var(default=4096, converter=int)
+        ttl: int = environ.var(default=300, converter=int)
+        check_interval: int = environ.var(default=5, converter=int)
 
     postgres: Postgres = environ.group(Postgres)
     app: App = environ.group(App)
     security: Security = environ.group(Security)
     activity: Activity = environ.group(Activity)
+    spatial_index: SpatialIndex = environ.group(SpatialIndex)
+    tiles: Tiles = environ.group(Tiles)
+    search_cache: SearchCache = environ.group(SearchCache)
+    pagination: Pagination = environ.group(Pagination)
+    count_cache: CountCache = environ.group(CountCache)
+    export: Export = environ.group(Export)
+    name_search: NameSearch = environ.group(NameSearch)
+    suggest: Suggest = environ.group(Suggest)
 
     @classmethod
     def load(cls) -> "Config":
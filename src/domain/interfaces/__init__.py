@@ -1,3 +1,5 @@
+from src.domain.interfaces.caches import CacheProtocol
+from src.domain.interfaces.indexes import ActivityTreeProtocol, SpatialIndexProtocol
 from src.domain.interfaces.repositories import (
     ActivityRepositoryProtocol,
     BuildingRepositoryProtocol,
@@ -6,6 +8,9 @@ from src.domain.interfaces.repositories import (
 
 __all__ = [
     "ActivityRepositoryProtocol",
+    "ActivityTreeProtocol",
     "BuildingRepositoryProtocol",
+    "CacheProtocol",
     "OrganizationRepositoryProtocol",
+    "SpatialIndexProtocol",
 ]
@@ -0,0 +1,11 @@
+from collections.abc import Hashable
+from typing import Protocol, TypeVar
+
+K = TypeVar("K", bound=Hashable, contravariant=True)
+V = TypeVar("V")
+
+
+class CacheProtocol(Protocol[K, V]):
+    def get(self, key: K) -> V | None: ...
+
+    def set(self, key: K, value: V) -> None: ...
@@ -0,0 +1,28 @@
+from typing import Protocol
+from uuid import UUID
+
+from src.domain.schemas.geo import GeoCircleParams, GeoRectParams
+from src.domain.schemas.suggest import SuggestionRead
+
+
+class SpatialIndexProtocol(Protocol):
+    @property
+    def is_ready(self) -> bool: ...
+
+    def find_in_radius(self, params: GeoCircleParams) -> dict[UUID, float]: ...
+
+    def find_in_rect(self, params: GeoRectParams) -> list[UUID]: ...
+
+
+class ActivityTreeProtocol(Protocol):
+    @property
+    def is_ready(self) -> bool: ...
+
+    def get_path(self, activity_id: UUID) -> str | None: ...
+
+
+class NamePrefixIndexProtocol(Protocol):
+    @property
+    def is_ready(self) -> bool: ...
+
+    def suggest(self, prefix: str, limit: int) -> list[SuggestionRead]: ...
@@ -1,46 +1,232 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import AbstractAsyncContextManager
 from typing import Protocol
 from uuid import UUID
 
 from src.domain.models.activity import Activity
 from src.domain.models.building import Building
 from src.domain.models.organization import Organization
-from src.domain.schemas.geo import GeoCircleParams, GeoRectParams
+from src.domain.schemas.batch import GeoBatchParams
+from src.domain.schemas.filter import OrganizationFilter
+from src.domain.schemas.geo import (
+    GeoCircleParams,
+    GeoOrder,
+    GeoPointParams,
+    GeoPolygonParams,
+    GeoRectParams,
+)
+from src.domain.schemas.organization import RenderedOrganization
+from src.domain.schemas.pagination import TotalMode
+from src.domain.schemas.search import NameOrder, PhoneMatch
+from src.domain.schemas.suggest import SuggestionKind
 
 
 class BuildingRepositoryProtocol(Protocol):
     async def get_by_id(self, entity_id: UUID) -> Building | None: ...
 
-    async def get_all(self, *, offset: int = 0, limit: int = 100) -> Sequence[Building]: ...
+    async def exists(self, entity_id: UUID) -> bool: ...
+
+    async def get_light(self, entity_id: UUID) -> Building | None: ...
+
+    async def get_all(
+        self, *, offset: int = 0, limit: int = 100, after: UUID | None = None
+    ) -> Sequence[Building]: ...
+
+    async def get_page(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: UUID | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Building], int | None]: ...
 
     async def count(self) -> int: ...
 
+    async def count_total(self, *, total_mode: TotalMode = TotalMode.EXACT) -> int | None: ...
+
     async def find_in_radius(self, params: GeoCircleParams) -> Sequence[Building]: ...
 
     async def find_in_rect(self, params: GeoRectParams) -> Sequence[Building]: ...
 
+    async def get_coordinates(self) -> Sequence[tuple[UUID, float, float]]: ...
+
+    async def get_tile(self, z: int, x: int, y: int) -> bytes: ...
+
 
 class ActivityRepositoryProtocol(Protocol):
     async def get_by_id(self, entity_id: UUID) -> Activity | None: ...
 
-    async def get_subtree_ids(self, activity_id: UUID) -> list[UUID]: ...
+    async def exists(self, entity_id: UUID) -> bool: ...
+
+    async def get_light(self, entity_id: UUID) -> Activity | None: ...
+
+    async def get_names(self) -> Sequence[tuple[UUID, str]]: ...
+
+    async def get_paths(self) -> Sequence[tuple[UUID, str]]: ...
 
 
 class OrganizationRepositoryProtocol(Protocol):
     async def get_by_id_full(self, org_id: UUID) -> Organization | None: ...
 
+    async def get_many_full(self, ids: Sequence[UUID]) -> Sequence[Organization]: ...
+
+    async def get_names(self) -> Sequence[tuple[UUID, str]]: ...
+
+    async def suggest_names(
+        self, prefix: str, limit: int
+    ) -> Sequence[tuple[SuggestionKind, UUID, str]]: ...
+
     async def find_by_building_id(
-        self, building_id: UUID, *, offset: int = 0, limit: int = 100
-    ) -> tuple[Sequence[Organization], int]: ...
+        self,
+        building_id: UUID,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: tuple[str, UUID] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]: ...
+
+    async def render_by_building_id(
+        self,
+        building_id: UUID,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: tuple[str, UUID] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[RenderedOrganization], int | None]: ...
 
     async def find_by_activity_ids(
-        self, activity_ids: list[UUID], *, offset: int = 0, limit: int = 100
-    ) -> tuple[Sequence[Organization], int]: ...
+        self,
+        activity_ids: list[UUID],
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: UUID | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]: ...
+
+    async def find_by_phone(
+        self,
+        digits: str,
+        *,
+        match: PhoneMatch = PhoneMatch.EXACT,
+        offset: int = 0,
+        limit: int = 100,
+        after: UUID | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]: ...
+
+    async def find_by_activity_subtree(
+        self,
+        activity_id: UUID,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: UUID | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]: ...
 
     async def find_by_building_ids(
-        self, building_ids: list[UUID], *, offset: int = 0, limit: int = 100
-    ) -> tuple[Sequence[Organization], int]: ...
+        self,
+        building_ids: list[UUID],
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: tuple[str, UUID] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]: ...
+
+    async def find_in_radius(
+        self,
+        params: GeoCircleParams,
+        *,
+        order: GeoOrder = GeoOrder.NONE,
+        offset: int = 0,
+        limit: int = 100,
+        after: tuple[str, UUID] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[tuple[Organization, float]], int | None]: ...
+
+    async def find_nearest(
+        self, params: GeoPointParams, *, limit: int = 20
+    ) -> Sequence[tuple[Organization, float]]: ...
+
+    async def find_in_rect(
+        self,
+        params: GeoRectParams,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: tuple[str, UUID] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]: ...
+
+    async def find_in_polygon(
+        self,
+        params: GeoPolygonParams,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: tuple[str, UUID] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]: ...
+
+    async def find_in_batch(
+        self, params: GeoBatchParams
+    ) -> list[tuple[Sequence[Organization], int]]: ...
+
+    async def find_matching(
+        self,
+        filters: OrganizationFilter,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: tuple[str, UUID] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]: ...
+
+    async def render_matching(
+        self,
+        filters: OrganizationFilter,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: tuple[str, UUID] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[RenderedOrganization], int | None]: ...
+
+    def stream_batches(
+        self, filters: OrganizationFilter, *, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Organization]]: ...
+
+    async def cluster_in_rect(
+        self, params: GeoRectParams, cell_size: float
+    ) -> Sequence[tuple[float, float, int]]: ...
 
     async def search_by_name(
-        self, name: str, *, offset: int = 0, limit: int = 100
-    ) -> tuple[Sequence[Organization], int]: ...
+        self,
+        name: str,
+        *,
+        order: NameOrder = NameOrder.NAME,
+        offset: int = 0,
+        limit: int = 100,
+        after: tuple[str, UUID] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]: ...
+
+    async def search_text(
+        self,
+        query: str,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]: ...
+
+
+OrganizationRepositoryFactory = Callable[
+    [], AbstractAsyncContextManager[OrganizationRepositoryProtocol]
+]
+"""Opens a repository on a session of its own, closed when the context exits."""
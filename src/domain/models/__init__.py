@@ -1,5 +1,10 @@
 from src.domain.models.activity import Activity
-from src.domain.models.base import Base, organization_activity
+from src.domain.models.base import (
+    Base,
+    organization_activity,
+    organization_activity_closure,
+    organization_phone,
+)
 from src.domain.models.building import Building
 from src.domain.models.organization import Organization
 
@@ -9,4 +14,6 @@ __all__ = [
     "Building",
     "Organization",
     "organization_activity",
+    "organization_activity_closure",
+    "organization_phone",
 ]
@@ -6,7 +6,16 @@ from datetime import (
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, String, Uuid, func
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    FetchedValue,
+    ForeignKey,
+    String,
+    Text,
+    Uuid,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domain.models.base import Base, organization_activity
@@ -27,6 +36,14 @@ class Activity(Base):
         index=True,
     )
     level: Mapped[int] = mapped_column(default=1, nullable=False)
+    path: Mapped[str] = mapped_column(
+        Text(collation="C"),
+        nullable=False,
+        index=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+        comment="Materialized path of hex ids, root first, each followed by '.'",
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     parent: Mapped[Activity | None] = relationship(
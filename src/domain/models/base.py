@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Table, Uuid
+from sqlalchemy import Column, ForeignKey, Table, Text, Uuid
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -22,3 +22,44 @@ organization_activity = Table(
         primary_key=True,
     ),
 )
+
+
+organization_activity_closure = Table(
+    "organization_activity_closure",
+    Base.metadata,
+    Column(
+        "activity_id",
+        Uuid,
+        ForeignKey("activities.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "organization_id",
+        Uuid,
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+    comment=(
+        "Every activity an organization belongs to, directly or through a descendant; "
+        "maintained by triggers"
+    ),
+)
+
+
+organization_phone = Table(
+    "organization_phone",
+    Base.metadata,
+    Column("reversed_digits", Text(collation="C"), primary_key=True),
+    Column(
+        "organization_id",
+        Uuid,
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+    comment=(
+        "Digits of every organization phone number, reversed so that a number "
+        "suffix is a key prefix; maintained by triggers"
+    ),
+)
@@ -6,11 +6,11 @@ from datetime import (
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from geoalchemy2 import Geography, WKBElement
-from geoalchemy2.shape import from_shape, to_shape
+from geoalchemy2 import Geography, Geometry, WKBElement
+from geoalchemy2.shape import from_shape
 from shapely.geometry import Point
-from sqlalchemy import DateTime, Index, String, Uuid, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import DateTime, Float, Index, String, Uuid, cast, func, text
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
 from src.domain.models.base import Base
 
@@ -29,21 +29,28 @@ class Building(Base):
     )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
+    # Selected as plain floats alongside the row, so serialization never parses WKB.
+    latitude: Mapped[float] = column_property(
+        func.ST_Y(cast(location, Geometry(srid=4326)), type_=Float)
+    )
+    longitude: Mapped[float] = column_property(
+        func.ST_X(cast(location, Geometry(srid=4326)), type_=Float)
+    )
+
     organizations: Mapped[list[Organization]] = relationship(
         back_populates="building", lazy="selectin"
     )
 
-    __table_args__ = (Index("ix_buildings_location", "location", postgresql_using="gist"),)
-
-    @property
-    def latitude(self) -> float:
-        point = to_shape(self.location)
-        return point.y
-
-    @property
-    def longitude(self) -> float:
-        point = to_shape(self.location)
-        return point.x
+    # The geography index serves distance and polygon searches; the geometry one
+    # serves rectangle searches and vector tiles, both planar lon/lat boxes.
+    __table_args__ = (
+        Index("ix_buildings_location", "location", postgresql_using="gist"),
+        Index(
+            "ix_buildings_location_geometry",
+            text("(location::geometry(Geometry,4326))"),
+            postgresql_using="gist",
+        ),
+    )
 
     @classmethod
     def make_location(cls, latitude: float, longitude: float) -> WKBElement:
@@ -4,8 +4,8 @@ from datetime import datetime  # noqa: TCH003 - needed at runtime by SQLAlchemy
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, Uuid, func
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import DateTime, FetchedValue, ForeignKey, Index, String, Uuid, func
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domain.models.base import Base, organization_activity
@@ -19,7 +19,7 @@ class Organization(Base):
     __tablename__ = "organizations"
 
     id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
-    name: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(500), nullable=False)
     phone_numbers: Mapped[list[str]] = mapped_column(
         ARRAY(String(50)), nullable=False, default=list
     )
@@ -30,6 +30,18 @@ class Organization(Base):
         index=True,
     )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # Only ever read inside search queries, so it is not loaded with the row.
+    search_document: Mapped[str] = mapped_column(
+        TSVECTOR,
+        nullable=False,
+        deferred=True,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue(),
+        comment=(
+            "Russian full-text document: name (A), activity names (B) and building "
+            "address (C); maintained by triggers"
+        ),
+    )
 
     building: Mapped[Building] = relationship(back_populates="organizations", lazy="joined")
     activities: Mapped[list[Activity]] = relationship(
@@ -38,5 +50,19 @@ class Organization(Base):
         lazy="selectin",
     )
 
+    # (name, id) serves name lookups and keyset pagination; the trigram index serves
+    # substring and fuzzy name search ranked by similarity; the GIN index serves
+    # full-text search.
+    __table_args__ = (
+        Index("ix_organizations_name_id", "name", "id"),
+        Index(
+            "ix_organizations_name_trgm",
+            "name",
+            postgresql_using="gist",
+            postgresql_ops={"name": "gist_trgm_ops"},
+        ),
+        Index("ix_organizations_search_document", "search_document", postgresql_using="gin"),
+    )
+
     def __repr__(self) -> str:
         return f"<Organization(id={self.id}, name='{self.name}')>"
@@ -1,14 +1,60 @@
 from src.domain.schemas.activity import ActivityRead
+from src.domain.schemas.batch import (
+    GeoBatchParams,
+    GeoBatchResponse,
+    GeoBatchResult,
+    OrganizationBatchParams,
+    OrganizationBatchResponse,
+    OrganizationBatchResult,
+)
 from src.domain.schemas.building import BuildingRead
-from src.domain.schemas.geo import GeoCircleParams, GeoRectParams
-from src.domain.schemas.organization import OrganizationRead
-from src.domain.schemas.pagination import PaginatedResponse
+from src.domain.schemas.cache import CacheStatsRead, CacheStatsResponse
+from src.domain.schemas.cluster import ClusterRead, ClusterResponse, GeoClusterParams
+from src.domain.schemas.filter import ExportFormat, OrganizationFilter
+from src.domain.schemas.geo import (
+    GeoCircleParams,
+    GeoOrder,
+    GeoPointParams,
+    GeoPolygonParams,
+    GeoRectParams,
+)
+from src.domain.schemas.organization import (
+    OrganizationDistanceRead,
+    OrganizationRead,
+    RenderedOrganization,
+)
+from src.domain.schemas.pagination import PaginatedResponse, TotalMode
+from src.domain.schemas.search import NameOrder, PhoneMatch
+from src.domain.schemas.suggest import SuggestionKind, SuggestionRead
 
 __all__ = [
     "ActivityRead",
     "BuildingRead",
+    "CacheStatsRead",
+    "CacheStatsResponse",
+    "ClusterRead",
+    "ClusterResponse",
+    "ExportFormat",
+    "GeoBatchParams",
+    "GeoBatchResponse",
+    "GeoBatchResult",
     "GeoCircleParams",
+    "GeoClusterParams",
+    "GeoOrder",
+    "GeoPointParams",
+    "GeoPolygonParams",
     "GeoRectParams",
+    "NameOrder",
+    "OrganizationBatchParams",
+    "OrganizationBatchResponse",
+    "OrganizationBatchResult",
+    "OrganizationDistanceRead",
+    "OrganizationFilter",
     "OrganizationRead",
     "PaginatedResponse",
+    "PhoneMatch",
+    "RenderedOrganization",
+    "SuggestionKind",
+    "SuggestionRead",
+    "TotalMode",
 ]
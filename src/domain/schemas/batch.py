@@ -0,0 +1,61 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field, model_validator
+
+from src.domain.schemas.geo import GeoCircleParams, GeoRectParams
+from src.domain.schemas.organization import OrganizationRead
+
+MAX_BATCH_QUERIES = 1_000
+# Organizations a geo batch may return in total (queries times limit), each loaded
+# with its building and activities and validated into one response.
+MAX_BATCH_ITEMS = 5_000
+# SQLAlchemy's selectin loader issues one IN query per 500 parents; staying within it
+# keeps the activities of a whole batch in a single query.
+MAX_BATCH_IDS = 500
+
+
+class GeoBatchParams(BaseModel):
+    """Many circle and rectangle searches evaluated together."""
+
+    queries: list[GeoCircleParams | GeoRectParams] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_QUERIES
+    )
+    limit: int = Field(
+        default=20, ge=0, le=100, description="Organizations per query; 0 returns counts only"
+    )
+
+    @model_validator(mode="after")
+    def check_total_items(self) -> "GeoBatchParams":
+        if len(self.queries) * self.limit > MAX_BATCH_ITEMS:
+            raise ValueError(
+                f"Queries times limit must not exceed {MAX_BATCH_ITEMS}; "
+                "lower the limit or split the batch."
+            )
+        return self
+
+
+class GeoBatchResult(BaseModel):
+    total: int
+    items: list[OrganizationRead]
+
+
+class GeoBatchResponse(BaseModel):
+    results: list[GeoBatchResult] = Field(description="One result per query, in request order")
+
+
+class OrganizationBatchParams(BaseModel):
+    """Organizations fetched together by id."""
+
+    ids: list[UUID] = Field(..., min_length=1, max_length=MAX_BATCH_IDS)
+
+
+class OrganizationBatchResult(BaseModel):
+    id: UUID
+    found: bool
+    item: OrganizationRead | None = Field(description="The organization, or null when missing")
+
+
+class OrganizationBatchResponse(BaseModel):
+    results: list[OrganizationBatchResult] = Field(
+        description="One result per requested id, in request order"
+    )
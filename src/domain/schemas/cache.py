@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+
+class CacheStatsRead(BaseModel):
+    size: int = Field(description="Entries currently held")
+    hits: int
+    misses: int
+    evictions: int = Field(description="Entries dropped to stay within the size limit")
+
+
+class CacheStatsResponse(BaseModel):
+    search: CacheStatsRead
+    tiles: CacheStatsRead
+    counts: CacheStatsRead
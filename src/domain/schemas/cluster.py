@@ -0,0 +1,35 @@
+from pydantic import BaseModel, Field, model_validator
+
+CLUSTER_CELLS_PER_TILE = 4
+"""Grid cells per 256 px map tile edge, i.e. one cluster per 64 px square."""
+
+
+class GeoClusterParams(BaseModel):
+    """Grid resolution for clustering, given as a map zoom level or a cell size."""
+
+    zoom: int | None = Field(default=None, ge=0, le=22)
+    cell_size: float | None = Field(default=None, gt=0, le=90, description="Degrees")
+
+    @model_validator(mode="after")
+    def check_resolution(self) -> "GeoClusterParams":
+        if self.zoom is None and self.cell_size is None:
+            raise ValueError("Either zoom or cell_size must be provided.")
+        return self
+
+    @property
+    def resolved_cell_size(self) -> float:
+        if self.cell_size is not None:
+            return self.cell_size
+        return 360.0 / (2 ** (self.zoom or 0) * CLUSTER_CELLS_PER_TILE)
+
+
+class ClusterRead(BaseModel):
+    latitude: float = Field(examples=[55.7601])
+    longitude: float = Field(examples=[37.5912])
+    count: int = Field(examples=[42])
+
+
+class ClusterResponse(BaseModel):
+    cell_size: float
+    total: int
+    clusters: list[ClusterRead]
@@ -0,0 +1,29 @@
+from enum import StrEnum
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.domain.schemas.geo import GeoCircleParams, GeoPolygonParams, GeoRectParams
+
+
+class OrganizationFilter(BaseModel):
+    """Conditions an organization must all meet; an empty filter matches every one."""
+
+    name: str | None = Field(
+        default=None, min_length=1, description="Case-insensitive partial name match"
+    )
+    building_id: UUID | None = None
+    activity_id: UUID | None = None
+    include_child_activities: bool = Field(
+        default=False, description="Match `activity_id` together with its nested activities"
+    )
+    circle: GeoCircleParams | None = None
+    rect: GeoRectParams | None = None
+    polygon: GeoPolygonParams | None = None
+
+
+class ExportFormat(StrEnum):
+    """Serialization of an organization export."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
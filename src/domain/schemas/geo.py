@@ -1,17 +1,66 @@
-from pydantic import BaseModel, Field, model_validator
+import math
+from enum import StrEnum
+from typing import Annotated, Literal
 
+import shapely
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from shapely.geometry import shape
+from shapely.geometry.base import BaseGeometry
 
-class GeoCircleParams(BaseModel):
-    """Search within a radius (km) from a point."""
+MAX_ENVELOPE_SPAN = 180.0
+"""Widest longitude span (degrees) of a single envelope sent to PostGIS.
+
+Envelopes are planar lon/lat boxes, so only the antimeridian and hemisphere-wide
+pieces need splitting.
+"""
+
+MAX_POLYGON_INPUT_VERTICES = 10_000
+"""Most vertices accepted in a search polygon before simplification."""
+
+MAX_POLYGON_VERTICES = 1_000
+"""Most vertices a search polygon may keep after simplification."""
+
+POLYGON_SIMPLIFY_TOLERANCE = 1e-4
+"""Simplification tolerance in degrees (about 11 m along a meridian)."""
+
+Position = Annotated[list[float], Field(min_length=2, max_length=3)]
+LinearRing = Annotated[list[Position], Field(min_length=4)]
+PolygonCoordinates = Annotated[list[LinearRing], Field(min_length=1)]
+
+
+class GeoOrder(StrEnum):
+    """Ordering of geo search results."""
+
+    NONE = "none"
+    DISTANCE = "distance"
+
+
+class GeoPointParams(BaseModel):
+    """A geographic point."""
 
     latitude: float = Field(..., ge=-90, le=90)
     longitude: float = Field(..., ge=-180, le=180)
+
+
+class GeoCircleParams(GeoPointParams):
+    """Search within a radius (km) from a point."""
+
     radius_km: float = Field(..., gt=0, le=1000)
 
     @property
     def radius_meters(self) -> float:
         return self.radius_km * 1000.0
 
+    def quantized(self, precision: int) -> "GeoCircleParams":
+        """Copy with the center and radius rounded to ``precision`` decimal places."""
+        return self.model_copy(
+            update={
+                "latitude": round(self.latitude, precision),
+                "longitude": round(self.longitude, precision),
+                "radius_km": round(self.radius_km, precision),
+            }
+        )
+
 
 class GeoRectParams(BaseModel):
     """Search within a bounding rectangle."""
@@ -27,6 +76,17 @@ class GeoRectParams(BaseModel):
             raise ValueError("Minimum latitude must be less than or equal to maximum latitude.")
         return self
 
+    def quantized(self, precision: int) -> "GeoRectParams":
+        """Copy with the bounds rounded to ``precision`` decimal places."""
+        return self.model_copy(
+            update={
+                "min_latitude": round(self.min_latitude, precision),
+                "max_latitude": round(self.max_latitude, precision),
+                "min_longitude": round(self.min_longitude, precision),
+                "max_longitude": round(self.max_longitude, precision),
+            }
+        )
+
     @property
     def longitude_span(self) -> float:
         diff = self.max_longitude - self.min_longitude
@@ -41,3 +101,73 @@ class GeoRectParams(BaseModel):
     @property
     def crosses_antimeridian(self) -> bool:
         return self.min_longitude > self.max_longitude
+
+    @property
+    def longitude_ranges(self) -> list[tuple[float, float]]:
+        """Split the rectangle into ``(min, max)`` longitude ranges for indexed lookups.
+
+        Handles antimeridian crossing and spans of any width: every range lies
+        within [-180, 180] and is at most ``MAX_ENVELOPE_SPAN`` degrees wide.
+        """
+        if self.crosses_antimeridian:
+            intervals = [(self.min_longitude, 180.0), (-180.0, self.max_longitude)]
+        else:
+            intervals = [(self.min_longitude, self.max_longitude)]
+
+        ranges: list[tuple[float, float]] = []
+        for start, end in intervals:
+            pieces = max(1, math.ceil((end - start) / MAX_ENVELOPE_SPAN))
+            step = (end - start) / pieces
+            bounds = [start + step * i for i in range(pieces)] + [end]
+            ranges.extend(zip(bounds, bounds[1:], strict=False))
+        return ranges
+
+
+class GeoPolygonParams(BaseModel):
+    """Search within a GeoJSON Polygon or MultiPolygon (longitude, latitude order)."""
+
+    type: Literal["Polygon", "MultiPolygon"]
+    coordinates: PolygonCoordinates | Annotated[list[PolygonCoordinates], Field(min_length=1)]
+
+    _geometry: BaseGeometry = PrivateAttr()
+
+    @model_validator(mode="after")
+    def check_geometry(self) -> "GeoPolygonParams":
+        try:
+            geometry = shape(self.model_dump())
+        except (ValueError, TypeError, IndexError, shapely.errors.GEOSException) as e:
+            raise ValueError(f"Coordinates do not form a {self.type}.") from e
+        if geometry.geom_type != self.type:
+            raise ValueError(f"Coordinates do not form a {self.type}.")
+
+        if shapely.get_num_coordinates(geometry) > MAX_POLYGON_INPUT_VERTICES:
+            raise ValueError(f"Polygon has more than {MAX_POLYGON_INPUT_VERTICES} vertices.")
+        min_lon, min_lat, max_lon, max_lat = geometry.bounds
+        if min_lon < -180 or max_lon > 180 or min_lat < -90 or max_lat > 90:
+            raise ValueError("Polygon coordinates are out of range.")
+
+        parts = list(getattr(geometry, "geoms", [geometry]))
+        for part in parts:
+            if not part.is_valid:
+                raise ValueError(f"Invalid polygon: {shapely.is_valid_reason(part)}.")
+            part_min_lon, _, part_max_lon, _ = part.bounds
+            if part_max_lon - part_min_lon >= 180:
+                raise ValueError(
+                    "Polygon must span less than 180 degrees of longitude; "
+                    "split it at the antimeridian."
+                )
+
+        # Overlapping parts make a MultiPolygon invalid; merge them instead.
+        geometry = shapely.union_all(parts) if len(parts) > 1 else geometry
+        geometry = geometry.simplify(POLYGON_SIMPLIFY_TOLERANCE, preserve_topology=True)
+        if shapely.get_num_coordinates(geometry) > MAX_POLYGON_VERTICES:
+            raise ValueError(
+                f"Polygon has more than {MAX_POLYGON_VERTICES} vertices after simplification."
+            )
+        self._geometry = geometry
+        return self
+
+    @property
+    def wkt(self) -> str:
+        """The validated, simplified geometry as WKT."""
+        return self._geometry.wkt
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import NamedTuple
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -16,3 +17,18 @@ class OrganizationRead(BaseModel):
     building: BuildingRead
     activities: list[ActivityRead]
     created_at: datetime
+
+
+class OrganizationDistanceRead(OrganizationRead):
+    distance_m: float = Field(examples=[1250.4], description="Distance from the search point")
+
+
+class RenderedOrganization(NamedTuple):
+    """An organization the database serialized as ``OrganizationRead`` JSON.
+
+    ``name`` and ``id`` are its ``(name, id)`` sort key, for the page cursor.
+    """
+
+    name: str
+    id: UUID
+    document: str
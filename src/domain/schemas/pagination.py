@@ -1,3 +1,4 @@
+from enum import StrEnum
 from typing import Generic, TypeVar
 
 from pydantic import BaseModel
@@ -5,9 +6,23 @@ from pydantic import BaseModel
 T = TypeVar("T")
 
 
+class TotalMode(StrEnum):
+    """How the total of a paginated response is computed."""
+
+    EXACT = "exact"
+    """``count(*)`` of the matching rows."""
+    ESTIMATE = "estimate"
+    """The query planner's row estimate; the count query is not run."""
+    NONE = "none"
+    """No total; ``has_next`` tells whether another page follows."""
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
-    total: int
+    total: int | None
     page: int
     size: int
-    pages: int
+    pages: int | None
+    next_cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
+    has_next: bool | None = None
@@ -0,0 +1,31 @@
+import re
+from enum import StrEnum
+
+MIN_PHONE_SUFFIX = 4
+
+
+class NameOrder(StrEnum):
+    """Ordering of name search results."""
+
+    NAME = "name"
+    RELEVANCE = "relevance"
+
+
+class PhoneMatch(StrEnum):
+    """How a phone number query is compared with stored numbers."""
+
+    EXACT = "exact"
+    SUFFIX = "suffix"
+
+
+def phone_digits(phone: str) -> str:
+    """The digits of a phone number, the form numbers are stored and compared in.
+
+    An 11-digit number with the domestic trunk prefix 8 gets the country code 7
+    instead, so "8-923-666-13-13" and "+7 (923) 666-13-13" are the same number.
+    Mirrored by the ``phone_digits`` SQL function the phone table is filled with.
+    """
+    digits = re.sub(r"[^0-9]", "", phone)
+    if len(digits) == 11 and digits.startswith("8"):
+        return "7" + digits[1:]
+    return digits
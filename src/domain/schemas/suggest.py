@@ -0,0 +1,17 @@
+from enum import StrEnum
+from uuid import UUID
+
+from pydantic import BaseModel
+
+MAX_SUGGESTIONS = 20
+
+
+class SuggestionKind(StrEnum):
+    ORGANIZATION = "organization"
+    ACTIVITY = "activity"
+
+
+class SuggestionRead(BaseModel):
+    kind: SuggestionKind
+    id: UUID
+    name: str
@@ -0,0 +1,36 @@
+from src.infrastructure.cache.activities import (
+    ActivityTreeCache,
+    activity_tree_cache,
+    load_activity_tree,
+)
+from src.infrastructure.cache.counts import count_cache
+from src.infrastructure.cache.lru import CacheStats, LRUCache
+from src.infrastructure.cache.names import NamePrefixIndex, load_name_index, name_prefix_index
+from src.infrastructure.cache.refresh import refresh_periodically
+from src.infrastructure.cache.search import search_cache
+from src.infrastructure.cache.spatial import (
+    BuildingSpatialIndex,
+    building_spatial_index,
+    load_building_index,
+)
+from src.infrastructure.cache.tiles import tile_cache
+from src.infrastructure.cache.versions import DataVersionWatcher
+
+__all__ = [
+    "ActivityTreeCache",
+    "BuildingSpatialIndex",
+    "CacheStats",
+    "DataVersionWatcher",
+    "LRUCache",
+    "NamePrefixIndex",
+    "activity_tree_cache",
+    "building_spatial_index",
+    "count_cache",
+    "load_activity_tree",
+    "load_building_index",
+    "load_name_index",
+    "name_prefix_index",
+    "refresh_periodically",
+    "search_cache",
+    "tile_cache",
+]
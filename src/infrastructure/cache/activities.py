@@ -0,0 +1,47 @@
+import logging
+from collections.abc import Iterable
+from uuid import UUID
+
+from src.infrastructure.database import async_session_factory
+from src.infrastructure.repositories import ActivityRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityTreeCache:
+    """Materialized path of every activity, held in memory.
+
+    Answers whether an activity exists and where its subtree starts without
+    a database round trip. The taxonomy is small and rarely changes, so the
+    whole table is reloaded when it does.
+    """
+
+    def __init__(self) -> None:
+        self._paths: dict[UUID, str] | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._paths is not None
+
+    def __len__(self) -> int:
+        return 0 if self._paths is None else len(self._paths)
+
+    def load(self, rows: Iterable[tuple[UUID, str]]) -> None:
+        """Replace the cached activities with ``(id, path)`` rows."""
+        self._paths = dict(rows)
+
+    def get_path(self, activity_id: UUID) -> str | None:
+        if self._paths is None:
+            raise RuntimeError("Activity tree cache is not loaded")
+        return self._paths.get(activity_id)
+
+
+activity_tree_cache = ActivityTreeCache()
+
+
+async def load_activity_tree(cache: ActivityTreeCache = activity_tree_cache) -> None:
+    """Load every activity's path from the database into ``cache``."""
+    async with async_session_factory() as session:
+        rows = await ActivityRepository(session).get_paths()
+    cache.load(rows)
+    logger.info("Activity tree cache loaded with %d activities", len(cache))
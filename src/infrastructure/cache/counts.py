@@ -0,0 +1,9 @@
+from collections.abc import Hashable
+
+from src.core.config import config
+from src.infrastructure.cache.lru import LRUCache
+
+count_cache: LRUCache[Hashable, int] = LRUCache(
+    maxsize=config.count_cache.size,
+    ttl=config.count_cache.ttl,
+)
@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, NamedTuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheStats(NamedTuple):
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class LRUCache(Generic[K, V]):
+    """Size-bounded least-recently-used cache with an optional time-to-live.
+
+    Not thread-safe: it is meant to be shared by coroutines of one event loop.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Lookup and eviction counters since the cache was created."""
+        return CacheStats(len(self._entries), self._hits, self._misses, self._evictions)
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if self._maxsize <= 0:
+            return
+
+        expires_at = self._clock() + self._ttl if self._ttl is not None else float("inf")
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
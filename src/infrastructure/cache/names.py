@@ -0,0 +1,92 @@
+import asyncio
+import bisect
+import logging
+import re
+from collections.abc import Iterable
+from operator import itemgetter
+from typing import NamedTuple
+from uuid import UUID
+
+from src.domain.schemas import SuggestionKind, SuggestionRead
+from src.infrastructure.database import async_session_factory
+from src.infrastructure.repositories import ActivityRepository, OrganizationRepository
+
+logger = logging.getLogger(__name__)
+
+_WORD_START = re.compile(r"\b\w")
+
+
+class _Snapshot(NamedTuple):
+    keys: list[str]
+    suggestions: list[SuggestionRead]
+
+
+class NamePrefixIndex:
+    """Organization and activity names held in memory for prefix suggestions.
+
+    Each word of a name contributes one key: the case-folded rest of the name from
+    that word on. Keys are kept sorted, so the names with a word starting with a
+    prefix form one run found by binary search, and a lookup reads only as far
+    into that run as ``limit`` needs.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: _Snapshot | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._snapshot is not None
+
+    def __len__(self) -> int:
+        return 0 if self._snapshot is None else len(self._snapshot.keys)
+
+    def load(self, rows: Iterable[tuple[SuggestionKind, UUID, str]]) -> None:
+        """Replace the indexed names with ``(kind, id, name)`` rows."""
+        entries: list[tuple[str, SuggestionRead]] = []
+        for kind, id_, name in rows:
+            suggestion = SuggestionRead(kind=kind, id=id_, name=name)
+            folded = name.casefold()
+            entries.extend(
+                (folded[word.start() :], suggestion) for word in _WORD_START.finditer(folded)
+            )
+        entries.sort(key=itemgetter(0))
+        self._snapshot = _Snapshot(
+            [key for key, _ in entries], [suggestion for _, suggestion in entries]
+        )
+
+    def suggest(self, prefix: str, limit: int) -> list[SuggestionRead]:
+        """Up to ``limit`` names with a word starting with ``prefix``, by matching word."""
+        snapshot = self._require_snapshot()
+        prefix = prefix.casefold()
+        found: dict[UUID, SuggestionRead] = {}
+        # Indexing rather than slicing, which would copy the tail of both lists.
+        position = bisect.bisect_left(snapshot.keys, prefix)
+        while (
+            len(found) < limit
+            and position < len(snapshot.keys)
+            and snapshot.keys[position].startswith(prefix)
+        ):
+            suggestion = snapshot.suggestions[position]
+            found.setdefault(suggestion.id, suggestion)
+            position += 1
+        return list(found.values())
+
+    def _require_snapshot(self) -> _Snapshot:
+        if self._snapshot is None:
+            raise RuntimeError("Name prefix index is not loaded")
+        return self._snapshot
+
+
+name_prefix_index = NamePrefixIndex()
+
+
+async def load_name_index(index: NamePrefixIndex = name_prefix_index) -> None:
+    """Load every organization and activity name from the database into ``index``."""
+    async with async_session_factory() as session:
+        organizations = await OrganizationRepository(session).get_names()
+        activities = await ActivityRepository(session).get_names()
+    rows = [(SuggestionKind.ORGANIZATION, id_, name) for id_, name in organizations]
+    rows += [(SuggestionKind.ACTIVITY, id_, name) for id_, name in activities]
+    # Sorting every word of every name would stall requests on the event loop.
+    await asyncio.to_thread(index.load, rows)
+    logger.info("Name prefix index loaded with %d names", len(rows))
@@ -0,0 +1,15 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_periodically(refresh: Callable[[], Awaitable[None]], interval: float) -> None:
+    """Call ``refresh`` every ``interval`` seconds until cancelled, logging failures."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh()
+        except Exception:
+            logger.exception("Periodic refresh failed")
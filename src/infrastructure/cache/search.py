@@ -0,0 +1,11 @@
+from collections.abc import Hashable
+from typing import Any
+
+from src.core.config import config
+from src.domain.schemas import PaginatedResponse
+from src.infrastructure.cache.lru import LRUCache
+
+search_cache: LRUCache[Hashable, PaginatedResponse[Any]] = LRUCache(
+    maxsize=config.search_cache.size,
+    ttl=config.search_cache.ttl,
+)
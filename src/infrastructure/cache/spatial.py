@@ -0,0 +1,117 @@
+import logging
+import math
+from collections.abc import Iterable
+from typing import NamedTuple
+from uuid import UUID
+
+import numpy as np
+
+from src.domain.schemas import GeoCircleParams, GeoRectParams
+from src.infrastructure.database import async_session_factory
+from src.infrastructure.repositories import BuildingRepository
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_M = 6_371_008.8
+# Largest relative difference between a distance on the mean sphere and the WGS 84
+# spheroid distance: 0.56%, for north-south distances near the equator.
+MAX_DISTANCE_ERROR = 0.006
+
+
+class _Snapshot(NamedTuple):
+    ids: np.ndarray
+    latitudes: np.ndarray
+    longitudes: np.ndarray
+
+
+class BuildingSpatialIndex:
+    """Building coordinates held in NumPy arrays sorted by latitude.
+
+    Lookups binary-search the latitude band and filter it with vectorized math.
+    Distances are great-circle distances on the mean Earth sphere, which stay
+    within ``MAX_DISTANCE_ERROR`` of the spheroid distances PostGIS uses for
+    ``ST_DWithin``. The reported ``distance_m`` carries that error too, and
+    buildings that close to the circle boundary may be in one answer and not
+    the other.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: _Snapshot | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._snapshot is not None
+
+    def __len__(self) -> int:
+        return 0 if self._snapshot is None else len(self._snapshot.ids)
+
+    def load(self, rows: Iterable[tuple[UUID, float, float]]) -> None:
+        """Replace the indexed buildings with ``(id, latitude, longitude)`` rows."""
+        rows = list(rows)
+        ids = np.array([row[0] for row in rows], dtype=object)
+        latitudes = np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows))
+        longitudes = np.fromiter((row[2] for row in rows), dtype=np.float64, count=len(rows))
+
+        order = np.argsort(latitudes, kind="stable")
+        self._snapshot = _Snapshot(ids[order], latitudes[order], longitudes[order])
+
+    def find_in_radius(self, params: GeoCircleParams) -> dict[UUID, float]:
+        """Map ids of buildings within the circle to their distance in meters."""
+        snapshot = self._require_snapshot()
+        delta = math.degrees(params.radius_meters / EARTH_RADIUS_M)
+        band = self._latitude_band(snapshot, params.latitude - delta, params.latitude + delta)
+
+        distances = _haversine(
+            params.latitude,
+            params.longitude,
+            snapshot.latitudes[band],
+            snapshot.longitudes[band],
+        )
+        inside = distances <= params.radius_meters
+        return dict(
+            zip(snapshot.ids[band][inside].tolist(), distances[inside].tolist(), strict=True)
+        )
+
+    def find_in_rect(self, params: GeoRectParams) -> list[UUID]:
+        """Ids of buildings within the rectangle, antimeridian crossing included."""
+        snapshot = self._require_snapshot()
+        band = self._latitude_band(snapshot, params.min_latitude, params.max_latitude)
+
+        longitudes = snapshot.longitudes[band]
+        inside = np.zeros(len(longitudes), dtype=bool)
+        for start, end in params.longitude_ranges:
+            inside |= (longitudes >= start) & (longitudes <= end)
+        return snapshot.ids[band][inside].tolist()
+
+    def _require_snapshot(self) -> _Snapshot:
+        if self._snapshot is None:
+            raise RuntimeError("Building spatial index is not loaded")
+        return self._snapshot
+
+    @staticmethod
+    def _latitude_band(snapshot: _Snapshot, low: float, high: float) -> slice:
+        start = int(np.searchsorted(snapshot.latitudes, low, side="left"))
+        stop = int(np.searchsorted(snapshot.latitudes, high, side="right"))
+        return slice(start, stop)
+
+
+def _haversine(
+    latitude: float, longitude: float, latitudes: np.ndarray, longitudes: np.ndarray
+) -> np.ndarray:
+    lat1 = math.radians(latitude)
+    lat2 = np.radians(latitudes)
+    half_dlat = (lat2 - lat1) / 2
+    half_dlon = np.radians(longitudes - longitude) / 2
+    a = np.sin(half_dlat) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(half_dlon) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+building_spatial_index = BuildingSpatialIndex()
+
+
+async def load_building_index(index: BuildingSpatialIndex = building_spatial_index) -> None:
+    """Load every building's coordinates from the database into ``index``."""
+    async with async_session_factory() as session:
+        rows = await BuildingRepository(session).get_coordinates()
+    index.load(rows)
+    logger.info("Building spatial index loaded with %d buildings", len(index))
@@ -0,0 +1,7 @@
+from src.core.config import config
+from src.infrastructure.cache.lru import LRUCache
+
+tile_cache: LRUCache[tuple[int, int, int], bytes] = LRUCache(
+    maxsize=config.tiles.cache_size,
+    ttl=config.tiles.cache_ttl,
+)
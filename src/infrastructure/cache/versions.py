@@ -0,0 +1,43 @@
+import logging
+from collections.abc import Awaitable, Callable
+
+from src.infrastructure.database import async_session_factory
+from src.infrastructure.repositories import DataVersionRepository
+
+logger = logging.getLogger(__name__)
+
+
+class DataVersionWatcher:
+    """Calls ``on_change`` when any of the watched tables has been written to.
+
+    Each ``check`` reads the trigger-bumped ``data_version_<table>`` sequences
+    and compares them with the last check that handled a change. The first
+    check always calls ``on_change``, and a failed ``on_change`` is retried
+    on the next check.
+
+    A sequence moves when the write runs, not when it commits, so the reload
+    that follows a change may still see the old rows. The watcher therefore
+    remembers the transaction horizon read after the versions and calls
+    ``on_change`` once more when every transaction running then has finished.
+    """
+
+    def __init__(self, table_names: list[str], on_change: Callable[[], Awaitable[None]]) -> None:
+        self._table_names = table_names
+        self._on_change = on_change
+        self._versions: dict[str, int] | None = None
+        self._pending: int | None = None
+
+    async def check(self) -> None:
+        async with async_session_factory() as session:
+            repo = DataVersionRepository(session)
+            versions = await repo.get_versions(self._table_names)
+            xmin, xmax = await repo.get_transaction_horizon()
+        if versions != self._versions:
+            if self._versions is not None:
+                logger.info("Data changed in %s", ", ".join(self._table_names))
+            await self._on_change()
+            self._versions = versions
+            self._pending = xmax if xmin < xmax else None
+        elif self._pending is not None and xmin >= self._pending:
+            await self._on_change()
+            self._pending = None
@@ -15,6 +15,12 @@ engine = create_async_engine(
     max_overflow=config.postgres.data.pool_max_overflow,
     pool_recycle=config.postgres.data.pool_recycle,
     pool_pre_ping=True,
+    connect_args={
+        "server_settings": {
+            # Threshold of the ``<%`` operator used by relevance-ranked name search.
+            "pg_trgm.word_similarity_threshold": str(config.name_search.similarity),
+        }
+    },
 )
 
 async_session_factory = async_sessionmaker(
@@ -1,5 +1,11 @@
 from src.infrastructure.repositories.activity import ActivityRepository
 from src.infrastructure.repositories.building import BuildingRepository
+from src.infrastructure.repositories.data_version import DataVersionRepository
 from src.infrastructure.repositories.organization import OrganizationRepository
 
-__all__ = ["ActivityRepository", "BuildingRepository", "OrganizationRepository"]
+__all__ = [
+    "ActivityRepository",
+    "BuildingRepository",
+    "DataVersionRepository",
+    "OrganizationRepository",
+]
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from uuid import UUID
 
 from sqlalchemy import select
@@ -11,19 +12,12 @@ class ActivityRepository(BaseRepository[Activity]):
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(Activity, session)
 
-    async def get_subtree_ids(self, activity_id: UUID) -> list[UUID]:
-        base = (
-            select(Activity.id, Activity.parent_id)
-            .where(Activity.id == activity_id)
-            .cte(name="activity_tree", recursive=True)
-        )
+    async def get_names(self) -> Sequence[tuple[UUID, str]]:
+        """``(id, name)`` of every activity."""
+        result = await self._session.execute(select(Activity.id, Activity.name))
+        return result.tuples().all()
 
-        recursive = select(Activity.id, Activity.parent_id).join(
-            base, Activity.parent_id == base.c.id
-        )
-
-        cte = base.union_all(recursive)
-        stmt = select(cte.c.id)
-
-        result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+    async def get_paths(self) -> Sequence[tuple[UUID, str]]:
+        """``(id, path)`` of every activity."""
+        result = await self._session.execute(select(Activity.id, Activity.path))
+        return result.tuples().all()
@@ -1,30 +1,166 @@
+import json
 from collections.abc import Sequence
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import (
+    ColumnElement,
+    Executable,
+    Label,
+    Row,
+    Select,
+    exists,
+    func,
+    inspect,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import raiseload
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import ClauseElement
 
 from src.domain.models import Base
+from src.domain.schemas import TotalMode
 
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement, keeping its bind parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler: SQLCompiler, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def window_total() -> Label[int]:
+    """``count(*) OVER ()``: the number of rows the page was cut from, on every row."""
+    return func.count().over().label("window_total")
+
+
 class BaseRepository(Generic[ModelType]):
-    """Base repository providing common read operations."""
+    """Base repository providing common read operations.
+
+    With ``window_count`` an exact total is read from ``count(*) OVER ()`` added to
+    the page statement, so a page and its total cost one round trip instead of two.
+    """
 
-    def __init__(self, model: type[ModelType], session: AsyncSession) -> None:
+    def __init__(
+        self, model: type[ModelType], session: AsyncSession, *, window_count: bool = False
+    ) -> None:
         self._model = model
         self._session = session
+        self._window_count = window_count
+
+    def _id_is(self, entity_id: UUID) -> ColumnElement[bool]:
+        return inspect(self._model).primary_key[0] == entity_id
 
     async def get_by_id(self, entity_id: UUID) -> ModelType | None:
         return await self._session.get(self._model, entity_id)
 
-    async def get_all(self, *, offset: int = 0, limit: int = 100) -> Sequence[ModelType]:
-        stmt = select(self._model).offset(offset).limit(limit)
+    async def exists(self, entity_id: UUID) -> bool:
+        """Check for the row without loading it."""
+        result = await self._session.execute(select(exists().where(self._id_is(entity_id))))
+        return result.scalar_one()
+
+    async def get_light(self, entity_id: UUID) -> ModelType | None:
+        """Load the row's own columns; touching a relationship raises instead of loading."""
+        stmt = select(self._model).where(self._id_is(entity_id)).options(raiseload("*"))
+        result = await self._session.execute(stmt)
+        return result.scalars().first()
+
+    async def get_all(
+        self, *, offset: int = 0, limit: int = 100, after: UUID | None = None
+    ) -> Sequence[ModelType]:
+        """Load a page in primary key order, after the ``after`` id when given."""
+        pk = inspect(self._model).primary_key[0]
+        stmt = select(self._model).options(raiseload("*")).order_by(pk)
+        if after is not None:
+            stmt = stmt.where(pk > after)
+        stmt = stmt.offset(offset).limit(limit)
         result = await self._session.execute(stmt)
         return result.scalars().all()
 
+    async def get_page(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: UUID | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[ModelType], int | None]:
+        """Load a page in primary key order plus the table's total."""
+        pk = inspect(self._model).primary_key[0]
+        stmt = select(self._model).options(raiseload("*")).order_by(pk)
+        if after is not None:
+            stmt = stmt.where(pk > after)
+        windowed = self._use_window(total_mode, after)
+        if windowed:
+            stmt = stmt.add_columns(window_total())
+        rows, total = await self._execute_page(
+            stmt.offset(offset).limit(limit),
+            None,
+            offset=offset,
+            total_mode=total_mode,
+            windowed=windowed,
+        )
+        return [row[0] for row in rows], total
+
+    def _use_window(self, total_mode: TotalMode, after: object | None) -> bool:
+        """Whether a page's exact total can come from ``window_total()``.
+
+        After a cursor the window would count only the rows past it.
+        """
+        return self._window_count and total_mode is TotalMode.EXACT and after is None
+
+    async def _execute_page(
+        self,
+        stmt: Select[Any],
+        count_stmt: Select[Any] | None,
+        *,
+        offset: int,
+        total_mode: TotalMode,
+        windowed: bool,
+    ) -> tuple[Sequence[tuple[Any, ...] | Row[Any]], int | None]:
+        """Run a page statement and return its rows and total.
+
+        When ``windowed``, the statement's last column is ``window_total()`` and is
+        stripped from the rows. A page past the end has no row to carry the window
+        total, so ``count_stmt`` is counted instead.
+        """
+        result = await self._session.execute(stmt)
+        rows = result.unique().all()
+        if windowed and (rows or offset == 0):
+            return [row[:-1] for row in rows], rows[0][-1] if rows else 0
+        return rows, await self.count_total(count_stmt, total_mode=total_mode)
+
+    async def estimate(self, stmt: Select[Any] | None = None) -> int:
+        """The planner's row estimate for ``stmt`` (or the whole table) without running it."""
+        if stmt is None:
+            stmt = select(inspect(self._model).primary_key[0])
+        result = await self._session.execute(_Explain(stmt))
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def count_total(
+        self, stmt: Select[Any] | None = None, *, total_mode: TotalMode = TotalMode.EXACT
+    ) -> int | None:
+        """Row count of ``stmt`` (or the whole table) as ``total_mode`` asks."""
+        if total_mode is TotalMode.NONE:
+            return None
+        if total_mode is TotalMode.ESTIMATE:
+            return await self.estimate(stmt)
+        return await self.count(stmt)
+
     async def count(self, stmt: Select[Any] | None = None) -> int:
         if stmt is None:
             count_stmt = select(func.count()).select_from(self._model)
@@ -1,56 +1,94 @@
 from collections.abc import Sequence
+from uuid import UUID
 
-from geoalchemy2 import Geography
-from geoalchemy2.functions import (
-    ST_DWithin,
-    ST_Intersects,
-    ST_MakeEnvelope,
-    ST_MakePoint,
-    ST_SetSRID,
-)
-from sqlalchemy import ColumnElement, cast, or_, select
+from sqlalchemy import String, cast, func, literal_column, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
-from src.domain.models import Building
+from src.domain.models import Building, Organization, organization_activity
 from src.domain.schemas import GeoCircleParams, GeoRectParams
 from src.infrastructure.repositories.base import BaseRepository
+from src.infrastructure.repositories.geo import flat, within_envelope, within_radius, within_rect
 
-_GEOGRAPHY_4326 = Geography(srid=4326)
+TILE_LAYER = "buildings"
+TILE_TOP_ACTIVITIES = 3
+WEB_MERCATOR_SRID = 3857
 
 
 class BuildingRepository(BaseRepository[Building]):
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(Building, session)
+    def __init__(self, session: AsyncSession, *, window_count: bool = False) -> None:
+        super().__init__(Building, session, window_count=window_count)
 
     async def find_in_radius(self, params: GeoCircleParams) -> Sequence[Building]:
-        point = cast(
-            ST_SetSRID(ST_MakePoint(params.longitude, params.latitude), 4326),
-            _GEOGRAPHY_4326,
+        stmt = (
+            select(Building).where(within_radius(Building.location, params)).options(raiseload("*"))
         )
-        stmt = select(Building).where(ST_DWithin(Building.location, point, params.radius_meters))
         result = await self._session.execute(stmt)
         return result.scalars().all()
 
     async def find_in_rect(self, params: GeoRectParams) -> Sequence[Building]:
-        filter_condition = self._build_rect_filter(params)
-        stmt = select(Building).where(filter_condition)
+        stmt = (
+            select(Building).where(within_rect(Building.location, params)).options(raiseload("*"))
+        )
         result = await self._session.execute(stmt)
         return result.scalars().all()
 
-    def _build_rect_filter(self, params: GeoRectParams) -> ColumnElement[bool]:
-        if not params.crosses_antimeridian:
-            return ST_Intersects(
-                Building.location,
-                self._envelope(params.min_longitude, params.max_longitude, params),
-            )
+    async def get_coordinates(self) -> Sequence[tuple[UUID, float, float]]:
+        """``(id, latitude, longitude)`` of every building, without loading ORM objects."""
+        stmt = select(Building.id, Building.latitude, Building.longitude)
+        result = await self._session.execute(stmt)
+        return result.tuples().all()
 
-        return or_(
-            ST_Intersects(Building.location, self._envelope(params.min_longitude, 180, params)),
-            ST_Intersects(Building.location, self._envelope(-180, params.max_longitude, params)),
+    async def get_tile(self, z: int, x: int, y: int) -> bytes:
+        """Render a Mapbox Vector Tile of the buildings inside tile ``z/x/y``.
+
+        Each feature carries the building id, address, number of organizations and
+        the ids of its most common activities (comma-separated, most common first).
+        """
+        envelope = func.ST_TileEnvelope(z, x, y)
+        # Compared as planar lon/lat geometry: a tile 180° or wider has no well-defined
+        # great-circle edges, so as geography the world and hemisphere tiles lose rows.
+        location = flat(Building.location)
+        in_tile = within_envelope(Building.location, func.ST_Transform(envelope, 4326))
+
+        organization_count = (
+            select(func.count(Organization.id))
+            .where(Organization.building_id == Building.id)
+            .scalar_subquery()
+        )
+        activity_id = organization_activity.c.activity_id
+        top_activities = (
+            select(activity_id)
+            .join(Organization, Organization.id == organization_activity.c.organization_id)
+            .where(Organization.building_id == Building.id)
+            .group_by(activity_id)
+            .order_by(func.count().desc(), activity_id)
+            .limit(TILE_TOP_ACTIVITIES)
+            .correlate(Building)
+            .subquery()
         )
+        activity_ids = select(
+            func.string_agg(cast(top_activities.c.activity_id, String), ",")
+        ).scalar_subquery()
 
-    def _envelope(self, xmin, xmax, params: GeoRectParams) -> ColumnElement[bool]:
-        return cast(
-            ST_SetSRID(ST_MakeEnvelope(xmin, params.min_latitude, xmax, params.max_latitude), 4326),
-            _GEOGRAPHY_4326,
+        geom = func.ST_AsMVTGeom(
+            func.ST_Transform(location, WEB_MERCATOR_SRID),
+            envelope,
         )
+        features = (
+            select(
+                geom.label("geom"),
+                cast(Building.id, String).label("id"),
+                Building.address.label("address"),
+                organization_count.label("organization_count"),
+                activity_ids.label("activity_ids"),
+            )
+            .where(in_tile)
+            .subquery("features")
+        )
+        stmt = select(func.ST_AsMVT(literal_column(features.name), TILE_LAYER, 4096, "geom")).where(
+            features.c.geom.is_not(None)
+        )
+
+        result = await self._session.execute(stmt)
+        return bytes(result.scalar_one() or b"")
@@ -0,0 +1,34 @@
+from sqlalchemy import cast, func, literal, select
+from sqlalchemy.dialects.postgresql import REGCLASS
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class DataVersionRepository:
+    """Reads the per-table ``data_version_<table>`` sequences bumped by triggers."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_versions(self, table_names: list[str]) -> dict[str, int]:
+        """Current change counters of the given tables."""
+        stmt = select(
+            *(
+                func.coalesce(
+                    func.pg_sequence_last_value(cast(literal(f"data_version_{name}"), REGCLASS)), 0
+                ).label(name)
+                for name in table_names
+            )
+        )
+        row = (await self._session.execute(stmt)).one()
+        return dict(row._mapping)
+
+    async def get_transaction_horizon(self) -> tuple[int, int]:
+        """``xmin`` and ``xmax`` of a fresh snapshot.
+
+        Every transaction below ``xmin`` has finished; everything started so
+        far is below ``xmax``.
+        """
+        snapshot = func.pg_current_snapshot()
+        stmt = select(func.pg_snapshot_xmin(snapshot), func.pg_snapshot_xmax(snapshot))
+        xmin, xmax = (await self._session.execute(stmt)).one()
+        return int(xmin), int(xmax)
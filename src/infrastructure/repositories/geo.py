@@ -0,0 +1,80 @@
+from typing import Any
+
+from geoalchemy2 import Geography, Geometry
+from geoalchemy2.functions import (
+    ST_Distance,
+    ST_DWithin,
+    ST_GeomFromText,
+    ST_Intersects,
+    ST_MakeEnvelope,
+    ST_MakePoint,
+    ST_SetSRID,
+)
+from sqlalchemy import ColumnElement, Float, cast, or_
+
+from src.domain.schemas import GeoCircleParams, GeoPointParams, GeoPolygonParams, GeoRectParams
+
+_GEOGRAPHY_4326 = Geography(srid=4326)
+_GEOMETRY_4326 = Geometry(srid=4326)
+
+
+def make_point(longitude: Any, latitude: Any) -> ColumnElement:
+    return cast(ST_SetSRID(ST_MakePoint(longitude, latitude), 4326), _GEOGRAPHY_4326)
+
+
+def flat(location: ColumnElement) -> ColumnElement:
+    """``location`` as planar lon/lat geometry, served by ``ix_buildings_location_geometry``."""
+    return cast(location, _GEOMETRY_4326)
+
+
+def lonlat_box(xmin: Any, ymin: Any, xmax: Any, ymax: Any) -> ColumnElement:
+    """Planar lon/lat envelope from bounds given as values or column expressions.
+
+    Its edges are parallels and meridians, unlike a geography envelope, whose top
+    and bottom edges follow great circles and bulge toward the pole.
+    """
+    return ST_MakeEnvelope(xmin, ymin, xmax, ymax, 4326)
+
+
+def within_envelope(location: ColumnElement, bounds: ColumnElement) -> ColumnElement[bool]:
+    """Index-backed predicate: ``location`` lies within the planar ``bounds``, edges included."""
+    return flat(location).op("&&")(bounds)
+
+
+def distance_to(location: ColumnElement, params: GeoPointParams) -> ColumnElement[float]:
+    """Exact (spheroid) distance in meters from ``location`` to the point."""
+    return ST_Distance(location, make_point(params.longitude, params.latitude))
+
+
+def knn_distance(location: ColumnElement, params: GeoPointParams) -> ColumnElement[float]:
+    """KNN ``<->`` distance; in ORDER BY it is served by the GiST index."""
+    point = make_point(params.longitude, params.latitude)
+    return location.op("<->", return_type=Float)(point)
+
+
+def within_radius(location: ColumnElement, params: GeoCircleParams) -> ColumnElement[bool]:
+    """Index-backed predicate: ``location`` lies within the circle."""
+    point = make_point(params.longitude, params.latitude)
+    return ST_DWithin(location, point, params.radius_meters)
+
+
+def within_rect(location: ColumnElement, params: GeoRectParams) -> ColumnElement[bool]:
+    """Index-backed predicate: ``location`` lies within the rectangle.
+
+    The rectangle is compared as a lon/lat box, like the in-memory spatial index.
+    An antimeridian-crossing rectangle becomes an OR of envelopes on each side,
+    which Postgres answers with a BitmapOr over the GiST index.
+    """
+    conditions = [
+        within_envelope(location, lonlat_box(xmin, params.min_latitude, xmax, params.max_latitude))
+        for xmin, xmax in params.longitude_ranges
+    ]
+    if len(conditions) == 1:
+        return conditions[0]
+    return or_(*conditions)
+
+
+def within_polygon(location: ColumnElement, params: GeoPolygonParams) -> ColumnElement[bool]:
+    """Index-backed predicate: ``location`` lies within the polygon."""
+    polygon = cast(ST_GeomFromText(params.wkt, 4326), _GEOGRAPHY_4326)
+    return ST_Intersects(location, polygon)
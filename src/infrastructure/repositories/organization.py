@@ -1,98 +1,791 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import Select, func, select
+from geoalchemy2.functions import ST_DWithin
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Integer,
+    ScalarSelect,
+    Select,
+    TableValuedAlias,
+    Text,
+    Uuid,
+    and_,
+    any_,
+    bindparam,
+    case,
+    cast,
+    column,
+    func,
+    literal,
+    literal_column,
+    select,
+    true,
+    tuple_,
+    union,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import aliased, contains_eager, joinedload, selectinload
 
-from src.domain.models import Organization, organization_activity
-from src.infrastructure.repositories.base import BaseRepository
+from src.domain.models import (
+    Activity,
+    Building,
+    Organization,
+    organization_activity,
+    organization_activity_closure,
+    organization_phone,
+)
+from src.domain.schemas import (
+    GeoBatchParams,
+    GeoCircleParams,
+    GeoOrder,
+    GeoPointParams,
+    GeoPolygonParams,
+    GeoRectParams,
+    NameOrder,
+    OrganizationFilter,
+    PhoneMatch,
+    RenderedOrganization,
+    SuggestionKind,
+    TotalMode,
+)
+from src.infrastructure.repositories.base import BaseRepository, window_total
+from src.infrastructure.repositories.geo import (
+    distance_to,
+    knn_distance,
+    lonlat_box,
+    make_point,
+    within_envelope,
+    within_polygon,
+    within_radius,
+    within_rect,
+)
+from src.infrastructure.repositories.text import (
+    text_match,
+    text_rank,
+    word_distance,
+    word_similar,
+    word_starts_with,
+)
+
+NameKey = tuple[str, UUID]
+
+
+def _after_name(after: NameKey) -> ColumnElement[bool]:
+    """Keyset predicate for the ``(name, id)`` order, an index range scan."""
+    return tuple_(Organization.name, Organization.id) > tuple_(*after)
+
+
+def _matching(filters: OrganizationFilter) -> ColumnElement[bool]:
+    """All conditions of an organization filter, AND-ed."""
+    conditions: list[ColumnElement[bool]] = []
+    if filters.name is not None:
+        conditions.append(Organization.name.ilike(f"%{filters.name}%"))
+    if filters.building_id is not None:
+        conditions.append(Organization.building_id == filters.building_id)
+    if filters.activity_id is not None:
+        if filters.include_child_activities:
+            links = organization_activity_closure
+        else:
+            links = organization_activity
+        conditions.append(
+            Organization.id.in_(
+                select(links.c.organization_id).where(links.c.activity_id == filters.activity_id)
+            )
+        )
+
+    location: list[ColumnElement[bool]] = []
+    if filters.circle is not None:
+        location.append(within_radius(Building.location, filters.circle))
+    if filters.rect is not None:
+        location.append(within_rect(Building.location, filters.rect))
+    if filters.polygon is not None:
+        location.append(within_polygon(Building.location, filters.polygon))
+    if location:
+        conditions.append(Organization.building_id.in_(select(Building.id).where(*location)))
+    return and_(true(), *conditions)
+
+
+def _json_object(**fields: Any) -> ColumnElement[Any]:
+    """``json_build_object`` of the keyword arguments; keys are inlined, not bound."""
+    args: list[Any] = []
+    for key, value in fields.items():
+        args += [literal_column(f"'{key}'"), value]
+    return func.json_build_object(*args)
+
+
+def _utc_timestamp(value: ColumnElement[Any]) -> ColumnElement[str]:
+    """A ``timestamptz`` written as the response encoder writes a UTC datetime.
+
+    ``json_build_object`` would write it in the session's TimeZone; this gives
+    ``2025-01-01T00:00:00Z``, with ``.ffffff`` only when there are microseconds.
+    """
+    utc = func.timezone(literal_column("'UTC'"), value)
+    return case(
+        (
+            func.date_trunc(literal_column("'second'"), value) == value,
+            func.to_char(utc, literal_column('\'YYYY-MM-DD"T"HH24:MI:SS"Z"\'')),
+        ),
+        else_=func.to_char(utc, literal_column('\'YYYY-MM-DD"T"HH24:MI:SS.US"Z"\'')),
+    )
+
+
+def _activities_json(organization_id: ColumnElement[UUID]) -> ScalarSelect[Any]:
+    """JSON array of an organization's activities as ``ActivityRead``, in id order."""
+    activity = _json_object(
+        id=Activity.id,
+        name=Activity.name,
+        parent_id=Activity.parent_id,
+        level=Activity.level,
+        created_at=_utc_timestamp(Activity.created_at),
+    )
+    return (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(activity, Activity.id)),
+                literal_column("'[]'::json"),
+            )
+        )
+        .select_from(organization_activity)
+        .join(Activity, Activity.id == organization_activity.c.activity_id)
+        .where(organization_activity.c.organization_id == organization_id)
+        .scalar_subquery()
+    )
+
+
+def _organization_json(building: type[Building]) -> ColumnElement[str]:
+    """An organization with its ``building`` and activities as ``OrganizationRead`` JSON."""
+    document = _json_object(
+        id=Organization.id,
+        name=Organization.name,
+        phone_numbers=Organization.phone_numbers,
+        building=_json_object(
+            id=building.id,
+            address=building.address,
+            latitude=building.latitude,
+            longitude=building.longitude,
+            created_at=_utc_timestamp(building.created_at),
+        ),
+        activities=_activities_json(Organization.id),
+        created_at=_utc_timestamp(Organization.created_at),
+    )
+    return cast(document, Text)
+
+
+def _unnest(name: str, rows: list[tuple[Any, ...]], columns: list[str]) -> TableValuedAlias:
+    """``unnest`` of one array parameter per column; the first column is the query index."""
+    arrays = [bindparam(f"{name}_idx", [row[0] for row in rows], type_=ARRAY(Integer))]
+    arrays += [
+        bindparam(f"{name}_{col}", [row[i] for row in rows], type_=ARRAY(Float))
+        for i, col in enumerate(columns, start=1)
+    ]
+    table_columns = [column("idx", Integer), *(column(col, Float) for col in columns)]
+    return func.unnest(*arrays).table_valued(*table_columns).render_derived(name=name)
 
 
 class OrganizationRepository(BaseRepository[Organization]):
-    def __init__(self, session: AsyncSession) -> None:
-        super().__init__(Organization, session)
+    def __init__(self, session: AsyncSession, *, window_count: bool = False) -> None:
+        super().__init__(Organization, session, window_count=window_count)
 
     def _base_query(self) -> Select[Any]:
-        """Base query with eager loading of relationships."""
+        """Base query with eager loading of relationships.
+
+        Only the building and activities are loaded; their own relationships
+        (building organizations, activity parent, children and organizations)
+        would otherwise pull in the graph around every organization.
+        """
         return select(Organization).options(
-            joinedload(Organization.building),
-            selectinload(Organization.activities),
+            joinedload(Organization.building).raiseload("*"),
+            selectinload(Organization.activities).raiseload("*"),
+        )
+
+    def _distance_query(self, params: GeoPointParams) -> Select[Any]:
+        """Organizations joined to their building, with the distance to a point."""
+        distance = distance_to(Building.location, params).label("distance_m")
+        return (
+            select(Organization, distance)
+            .join(Organization.building)
+            .options(
+                contains_eager(Organization.building).raiseload("*"),
+                selectinload(Organization.activities).raiseload("*"),
+            )
         )
 
+    async def _find_page(
+        self,
+        base_filter: ColumnElement[bool],
+        *,
+        offset: int,
+        limit: int,
+        after: NameKey | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]:
+        """Load one page of organizations matching the filter plus its total.
+
+        Pages are ordered by ``(name, id)``; ``after`` continues from the key of the
+        previous page's last row instead of skipping ``offset`` rows.
+        """
+        stmt = self._base_query().where(base_filter)
+        if after is not None:
+            stmt = stmt.where(_after_name(after))
+        windowed = self._use_window(total_mode, after)
+        if windowed:
+            stmt = stmt.add_columns(window_total())
+        stmt = stmt.order_by(Organization.name, Organization.id).offset(offset).limit(limit)
+        rows, total = await self._execute_page(
+            stmt,
+            select(Organization.id).where(base_filter),
+            offset=offset,
+            total_mode=total_mode,
+            windowed=windowed,
+        )
+        return [row[0] for row in rows], total
+
+    async def _render_page(
+        self,
+        base_filter: ColumnElement[bool],
+        *,
+        offset: int,
+        limit: int,
+        after: NameKey | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[RenderedOrganization], int | None]:
+        """``_find_page`` with every organization serialized to JSON by the database.
+
+        The page of ids is cut first, so the documents are built for its rows only,
+        and the whole page is one statement: no ORM objects, no selectin query.
+        """
+        page = select(Organization.id).where(base_filter)
+        if after is not None:
+            page = page.where(_after_name(after))
+        windowed = self._use_window(total_mode, after)
+        if windowed:
+            page = page.add_columns(window_total())
+        subq = (
+            page.order_by(Organization.name, Organization.id).offset(offset).limit(limit).subquery()
+        )
+
+        # Aliased so location filters on buildings inside ``base_filter`` stay uncorrelated.
+        building = aliased(Building)
+        stmt = (
+            select(Organization.name, Organization.id, _organization_json(building))
+            .join(subq, Organization.id == subq.c.id)
+            .join(building, building.id == Organization.building_id)
+        )
+        if windowed:
+            stmt = stmt.add_columns(subq.c.window_total)
+        rows, total = await self._execute_page(
+            stmt.order_by(Organization.name, Organization.id),
+            select(Organization.id).where(base_filter),
+            offset=offset,
+            total_mode=total_mode,
+            windowed=windowed,
+        )
+        return [RenderedOrganization(*row) for row in rows], total
+
+    async def _find_id_page(
+        self,
+        ids: Select[Any],
+        *,
+        offset: int,
+        limit: int,
+        after: UUID | None,
+        total_mode: TotalMode,
+    ) -> tuple[Sequence[Organization], int | None]:
+        """Load a page of the organizations ``ids`` selects, in id order.
+
+        ``ids`` selects each organization id once, as a column labeled ``id``.
+        The page of ids is cut first and only those organizations are loaded.
+        """
+        id_column = ids.selected_columns.id
+        page = ids if after is None else ids.where(id_column > after)
+        windowed = self._use_window(total_mode, after)
+        if windowed:
+            page = page.add_columns(window_total())
+        subq = page.order_by(id_column).offset(offset).limit(limit).subquery()
+
+        stmt = self._base_query().join(subq, Organization.id == subq.c.id)
+        if windowed:
+            stmt = stmt.add_columns(subq.c.window_total)
+        rows, total = await self._execute_page(
+            stmt.order_by(Organization.id),
+            ids,
+            offset=offset,
+            total_mode=total_mode,
+            windowed=windowed,
+        )
+        return [row[0] for row in rows], total
+
     async def get_by_id_full(self, org_id: UUID) -> Organization | None:
         stmt = self._base_query().where(Organization.id == org_id)
         result = await self._session.execute(stmt)
         return result.scalars().first()
 
-    async def find_by_building_id(
-        self, building_id: UUID, *, offset: int = 0, limit: int = 100
-    ) -> tuple[Sequence[Organization], int]:
-        base_filter = Organization.building_id == building_id
+    async def get_names(self) -> Sequence[tuple[UUID, str]]:
+        """``(id, name)`` of every organization, without loading ORM objects."""
+        result = await self._session.execute(select(Organization.id, Organization.name))
+        return result.tuples().all()
 
-        stmt = self._base_query().where(base_filter).offset(offset).limit(limit)
+    async def suggest_names(
+        self, prefix: str, limit: int
+    ) -> Sequence[tuple[SuggestionKind, UUID, str]]:
+        """Organization and activity names with a word starting with ``prefix``, by name."""
+        names = union_all(
+            select(
+                literal(SuggestionKind.ORGANIZATION.value).label("kind"),
+                Organization.id,
+                Organization.name,
+            ).where(word_starts_with(Organization.name, prefix)),
+            select(
+                literal(SuggestionKind.ACTIVITY.value).label("kind"), Activity.id, Activity.name
+            ).where(word_starts_with(Activity.name, prefix)),
+        ).subquery("names")
+        stmt = select(names).order_by(names.c.name, names.c.id).limit(limit)
         result = await self._session.execute(stmt)
-        items = result.scalars().unique().all()
+        return [(SuggestionKind(kind), id_, name) for kind, id_, name in result.tuples()]
+
+    async def get_many_full(self, ids: Sequence[UUID]) -> Sequence[Organization]:
+        """Organizations with the given ids, in no particular order; missing ids are skipped.
+
+        The building is joined into the same query and the activities of all rows
+        come from one selectin query, so the batch costs two round trips. The ids
+        travel as one array parameter, so every batch size shares a prepared statement.
+        """
+        ids_param = bindparam("ids", list(ids), type_=ARRAY(Uuid))
+        stmt = self._base_query().where(Organization.id == any_(ids_param))
+        result = await self._session.execute(stmt)
+        return result.scalars().unique().all()
+
+    async def find_by_building_id(
+        self,
+        building_id: UUID,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: NameKey | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]:
+        base_filter = Organization.building_id == building_id
+        return await self._find_page(
+            base_filter, offset=offset, limit=limit, after=after, total_mode=total_mode
+        )
 
-        total = await self.count(select(Organization).where(base_filter))
-        return items, total
+    async def render_by_building_id(
+        self,
+        building_id: UUID,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: NameKey | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[RenderedOrganization], int | None]:
+        """``find_by_building_id`` serialized to JSON by the database."""
+        return await self._render_page(
+            Organization.building_id == building_id,
+            offset=offset,
+            limit=limit,
+            after=after,
+            total_mode=total_mode,
+        )
 
     async def find_by_activity_ids(
-        self, activity_ids: list[UUID], *, offset: int = 0, limit: int = 100
-    ) -> tuple[Sequence[Organization], int]:
-        """Find organizations that have any of the given activity IDs."""
-        base = (
+        self,
+        activity_ids: list[UUID],
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: UUID | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]:
+        """Find organizations that have any of the given activity IDs, in id order."""
+        # GROUP BY rather than DISTINCT: a window total counts groups, not links.
+        ids = (
             select(Organization.id)
             .join(organization_activity)
             .where(organization_activity.c.activity_id.in_(activity_ids))
-            .distinct()
+            .group_by(Organization.id)
+        )
+        return await self._find_id_page(
+            ids, offset=offset, limit=limit, after=after, total_mode=total_mode
         )
 
-        count_stmt = select(func.count()).select_from(base.subquery())
-        count_result = await self._session.execute(count_stmt)
-        total = count_result.scalar_one()
+    async def find_by_activity_subtree(
+        self,
+        activity_id: UUID,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: UUID | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]:
+        """Find organizations that have the activity or any of its descendants.
 
-        subq = base.offset(offset).limit(limit).subquery()
-        stmt = self._base_query().where(Organization.id.in_(select(subq)))
-        result = await self._session.execute(stmt)
-        items = result.scalars().unique().all()
+        The closure table holds one row per organization and ancestor activity, so
+        the page and the count are range scans of its primary key with no DISTINCT.
+        Pages are in organization id order, so ``after`` continues the same scan.
+        """
+        closure = organization_activity_closure
+        ids = select(closure.c.organization_id.label("id")).where(
+            closure.c.activity_id == activity_id
+        )
+        return await self._find_id_page(
+            ids, offset=offset, limit=limit, after=after, total_mode=total_mode
+        )
 
-        return items, total
+    async def find_by_phone(
+        self,
+        digits: str,
+        *,
+        match: PhoneMatch = PhoneMatch.EXACT,
+        offset: int = 0,
+        limit: int = 100,
+        after: UUID | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]:
+        """Find organizations with a phone number equal to, or ending with, ``digits``.
+
+        Numbers are stored reversed, so a suffix is a key prefix: both matches are
+        ranges of the phone table's primary key. Pages are in organization id order.
+        """
+        phone = organization_phone
+        key = digits[::-1]
+        if match is PhoneMatch.EXACT:
+            condition = phone.c.reversed_digits == key
+        else:
+            # Keys hold only digits, and ":" sorts right after "9" in the C collation.
+            condition = and_(phone.c.reversed_digits >= key, phone.c.reversed_digits < key + ":")
+        ids = (
+            select(phone.c.organization_id.label("id"))
+            .where(condition)
+            .group_by(phone.c.organization_id)
+        )
+        return await self._find_id_page(
+            ids, offset=offset, limit=limit, after=after, total_mode=total_mode
+        )
 
     async def find_by_building_ids(
-        self, building_ids: list[UUID], *, offset: int = 0, limit: int = 100
-    ) -> tuple[Sequence[Organization], int]:
-        """Find organizations in given buildings."""
-        base_filter = Organization.building_id.in_(building_ids)
+        self,
+        building_ids: list[UUID],
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: NameKey | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]:
+        """Find organizations in given buildings.
+
+        The ids travel as a single array parameter, so large id sets neither bloat
+        the statement nor hit the driver's bind parameter limit.
+        """
+        ids = bindparam("building_ids", building_ids, type_=ARRAY(Uuid))
+        base_filter = Organization.building_id == any_(ids)
+        return await self._find_page(
+            base_filter, offset=offset, limit=limit, after=after, total_mode=total_mode
+        )
+
+    async def find_in_radius(
+        self,
+        params: GeoCircleParams,
+        *,
+        order: GeoOrder = GeoOrder.NONE,
+        offset: int = 0,
+        limit: int = 100,
+        after: NameKey | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[tuple[Organization, float]], int | None]:
+        """Find organizations in buildings within a radius, with their distance in meters.
 
-        count_stmt = select(func.count()).select_from(
-            select(Organization).where(base_filter).subquery()
+        The spatial filter runs inside the organizations query, so the page and the
+        count are both computed in the database. With ``GeoOrder.DISTANCE`` the page
+        is ordered by the KNN operator and read from the GiST index nearest-first;
+        otherwise it is ordered by ``(name, id)`` and ``after`` applies.
+        """
+        in_radius = within_radius(Building.location, params)
+        stmt = self._distance_query(params).where(in_radius)
+        if order is GeoOrder.DISTANCE:
+            stmt = stmt.order_by(knn_distance(Building.location, params), Organization.id)
+        else:
+            if after is not None:
+                stmt = stmt.where(_after_name(after))
+            stmt = stmt.order_by(Organization.name, Organization.id)
+        windowed = self._use_window(total_mode, after)
+        if windowed:
+            stmt = stmt.add_columns(window_total())
+
+        buildings = select(Building.id).where(in_radius)
+        rows, total = await self._execute_page(
+            stmt.offset(offset).limit(limit),
+            select(Organization.id).where(Organization.building_id.in_(buildings)),
+            offset=offset,
+            total_mode=total_mode,
+            windowed=windowed,
         )
-        count_result = await self._session.execute(count_stmt)
-        total = count_result.scalar_one()
+        return [(org, distance) for org, distance in rows], total
+
+    async def find_nearest(
+        self, params: GeoPointParams, *, limit: int = 20
+    ) -> Sequence[tuple[Organization, float]]:
+        """Find the organizations nearest to a point, with their distance in meters.
 
-        stmt = self._base_query().where(base_filter).offset(offset).limit(limit)
+        ``ORDER BY location <-> point LIMIT n`` is a KNN scan of the GiST index,
+        so only the first ``limit`` buildings are visited.
+        """
+        stmt = (
+            self._distance_query(params)
+            .order_by(knn_distance(Building.location, params), Organization.id)
+            .limit(limit)
+        )
         result = await self._session.execute(stmt)
-        items = result.scalars().unique().all()
+        return result.tuples().all()
 
-        return items, total
+    async def find_in_rect(
+        self,
+        params: GeoRectParams,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: NameKey | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]:
+        """Find organizations in buildings within a rectangle of any width."""
+        in_rect = select(Building.id).where(within_rect(Building.location, params))
+        base_filter = Organization.building_id.in_(in_rect)
+        return await self._find_page(
+            base_filter, offset=offset, limit=limit, after=after, total_mode=total_mode
+        )
 
-    async def search_by_name(
-        self, name: str, *, offset: int = 0, limit: int = 100
-    ) -> tuple[Sequence[Organization], int]:
-        """Search organizations by name (case-insensitive partial match)."""
-        pattern = f"%{name}%"
-        base_filter = Organization.name.ilike(pattern)
+    async def find_in_polygon(
+        self,
+        params: GeoPolygonParams,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: NameKey | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]:
+        """Find organizations in buildings within a polygon or multipolygon."""
+        in_polygon = select(Building.id).where(within_polygon(Building.location, params))
+        base_filter = Organization.building_id.in_(in_polygon)
+        return await self._find_page(
+            base_filter, offset=offset, limit=limit, after=after, total_mode=total_mode
+        )
+
+    async def find_in_batch(
+        self, params: GeoBatchParams
+    ) -> list[tuple[Sequence[Organization], int]]:
+        """Run many circle and rectangle searches, returning a page and total per query.
+
+        Circles and rectangle envelopes travel as arrays that are ``unnest``-ed and
+        joined against ``buildings``, so one statement answers every query with a
+        GiST index probe per input row. Each query keeps its first ``limit``
+        organization ids; a second statement loads those organizations.
+        """
+        circles: list[tuple[int, float, float, float]] = []
+        envelopes: list[tuple[int, float, float, float, float]] = []
+        for idx, query in enumerate(params.queries):
+            if isinstance(query, GeoCircleParams):
+                circles.append((idx, query.longitude, query.latitude, query.radius_meters))
+                continue
+            for xmin, xmax in query.longitude_ranges:
+                envelopes.append((idx, xmin, query.min_latitude, xmax, query.max_latitude))
+
+        parts: list[Select[Any]] = []
+        if circles:
+            circle = _unnest("circle", circles, ["longitude", "latitude", "radius"])
+            point = make_point(circle.c.longitude, circle.c.latitude)
+            parts.append(
+                select(circle.c.idx, Building.id.label("building_id"))
+                .select_from(circle)
+                .join(Building, ST_DWithin(Building.location, point, circle.c.radius))
+            )
+        if envelopes:
+            rect = _unnest("rect", envelopes, ["xmin", "ymin", "xmax", "ymax"])
+            bounds = lonlat_box(rect.c.xmin, rect.c.ymin, rect.c.xmax, rect.c.ymax)
+            parts.append(
+                select(rect.c.idx, Building.id.label("building_id"))
+                .select_from(rect)
+                .join(Building, within_envelope(Building.location, bounds))
+            )
+        # UNION drops buildings matched by two envelopes of the same rectangle.
+        matches = (
+            union(*parts).subquery("matches")
+            if len(parts) > 1
+            else (parts[0].distinct().subquery("matches"))
+        )
+
+        rank = func.row_number().over(partition_by=matches.c.idx, order_by=Organization.id)
+        ranked = (
+            select(matches.c.idx, Organization.id.label("id"), rank.label("rank"))
+            .select_from(matches)
+            .join(Organization, Organization.building_id == matches.c.building_id)
+            .subquery("ranked")
+        )
+        page_ids = func.array_agg(aggregate_order_by(ranked.c.id, ranked.c.id)).filter(
+            ranked.c.rank <= params.limit
+        )
+        stmt = select(ranked.c.idx, func.count(), page_ids).group_by(ranked.c.idx)
+        result = await self._session.execute(stmt)
+        pages = {idx: (ids or [], total) for idx, total, ids in result.tuples()}
+
+        wanted = [org_id for ids, _ in pages.values() for org_id in ids]
+        organizations: dict[UUID, Organization] = {}
+        if wanted:
+            ids_param = bindparam("organization_ids", wanted, type_=ARRAY(Uuid))
+            stmt = self._base_query().where(Organization.id == any_(ids_param))
+            result = await self._session.execute(stmt)
+            organizations = {org.id: org for org in result.scalars().unique()}
+
+        results: list[tuple[Sequence[Organization], int]] = []
+        for idx in range(len(params.queries)):
+            ids, total = pages.get(idx, ([], 0))
+            results.append(([organizations[org_id] for org_id in ids], total))
+        return results
+
+    async def find_matching(
+        self,
+        filters: OrganizationFilter,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: NameKey | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]:
+        """Find organizations meeting every condition of the filter.
+
+        All conditions go into one statement, and the count reuses its WHERE clause,
+        so the planner picks the most selective index among them.
+        """
+        return await self._find_page(
+            _matching(filters), offset=offset, limit=limit, after=after, total_mode=total_mode
+        )
+
+    async def render_matching(
+        self,
+        filters: OrganizationFilter,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        after: NameKey | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[RenderedOrganization], int | None]:
+        """``find_matching`` serialized to JSON by the database."""
+        return await self._render_page(
+            _matching(filters), offset=offset, limit=limit, after=after, total_mode=total_mode
+        )
+
+    async def stream_batches(
+        self, filters: OrganizationFilter, *, batch_size: int = 1000
+    ) -> AsyncIterator[Sequence[Organization]]:
+        """Stream every organization matching the filter, in id order, in batches.
 
-        count_stmt = select(func.count()).select_from(
-            select(Organization).where(base_filter).subquery()
+        Rows are read through a server-side cursor ``batch_size`` at a time, and each
+        batch's activities are loaded by one selectin query, so memory holds a single
+        batch however many organizations match.
+        """
+        stmt = (
+            self._base_query()
+            .where(_matching(filters))
+            .order_by(Organization.id)
+            .execution_options(yield_per=batch_size)
         )
-        count_result = await self._session.execute(count_stmt)
-        total = count_result.scalar_one()
+        result = await self._session.stream(stmt)
+        try:
+            async for batch in result.scalars().partitions():
+                yield batch
+        finally:
+            await result.close()
 
-        stmt = self._base_query().where(base_filter).offset(offset).limit(limit)
+    async def cluster_in_rect(
+        self, params: GeoRectParams, cell_size: float
+    ) -> Sequence[tuple[float, float, int]]:
+        """Count organizations per grid cell of ``cell_size`` degrees within a rectangle.
+
+        Returns ``(latitude, longitude, count)`` for every non-empty cell, placed at
+        the mean position of the cell's organizations.
+        """
+        cell_x = func.floor(Building.longitude / cell_size)
+        cell_y = func.floor(Building.latitude / cell_size)
+        stmt = (
+            select(
+                func.avg(Building.latitude),
+                func.avg(Building.longitude),
+                func.count(Organization.id),
+            )
+            .select_from(Organization)
+            .join(Organization.building)
+            .where(within_rect(Building.location, params))
+            .group_by(cell_x, cell_y)
+        )
         result = await self._session.execute(stmt)
-        items = result.scalars().unique().all()
+        return result.tuples().all()
+
+    async def search_by_name(
+        self,
+        name: str,
+        *,
+        order: NameOrder = NameOrder.NAME,
+        offset: int = 0,
+        limit: int = 100,
+        after: NameKey | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]:
+        """Search organizations by name.
+
+        ``NameOrder.NAME`` is a case-insensitive partial match in ``(name, id)``
+        order, where ``after`` applies. ``NameOrder.RELEVANCE`` is a fuzzy word match
+        ranked by trigram similarity: the page is read from the trigram GiST index
+        best match first, so only the first ``offset + limit`` rows are visited.
+        """
+        if order is NameOrder.NAME:
+            base_filter = Organization.name.ilike(f"%{name}%")
+            return await self._find_page(
+                base_filter, offset=offset, limit=limit, after=after, total_mode=total_mode
+            )
 
-        return items, total
+        base_filter = word_similar(name, Organization.name)
+        stmt = (
+            self._base_query()
+            .where(base_filter)
+            .order_by(word_distance(name, Organization.name), Organization.id)
+        )
+        # A window count would rank every match before the first row is returned.
+        rows, total = await self._execute_page(
+            stmt.offset(offset).limit(limit),
+            select(Organization.id).where(base_filter),
+            offset=offset,
+            total_mode=total_mode,
+            windowed=False,
+        )
+        return [row[0] for row in rows], total
+
+    async def search_text(
+        self,
+        query: str,
+        *,
+        offset: int = 0,
+        limit: int = 100,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]:
+        """Full-text search over name, activity names and address, best match first.
+
+        Matches come from the GIN index on the search document; ranking them is a
+        top-N sort bounded by ``offset + limit``, so the page never sorts every match.
+        """
+        base_filter = text_match(Organization.search_document, query)
+        stmt = (
+            self._base_query()
+            .where(base_filter)
+            .order_by(text_rank(Organization.search_document, query).desc(), Organization.id)
+        )
+        rows, total = await self._execute_page(
+            stmt.offset(offset).limit(limit),
+            select(Organization.id).where(base_filter),
+            offset=offset,
+            total_mode=total_mode,
+            windowed=False,
+        )
+        return [row[0] for row in rows], total
@@ -0,0 +1,47 @@
+import re
+
+from sqlalchemy import ColumnElement, Float, func, literal
+from sqlalchemy.dialects.postgresql import REGCONFIG
+
+SEARCH_CONFIG = "russian"
+
+
+def word_similar(query: str, text: ColumnElement[str]) -> ColumnElement[bool]:
+    """Index-backed predicate: ``query`` is similar to some run of words in ``text``.
+
+    ``<%`` compares against ``pg_trgm.word_similarity_threshold``, so misspelt and
+    partial queries still match.
+    """
+    return literal(query).op("<%", return_type=bool)(text)
+
+
+def word_distance(query: str, text: ColumnElement[str]) -> ColumnElement[float]:
+    """``<<->`` word distance, one minus the similarity.
+
+    In ORDER BY it is served by the trigram GiST index.
+    """
+    return literal(query).op("<<->", return_type=Float)(text)
+
+
+def word_starts_with(text: ColumnElement[str], prefix: str) -> ColumnElement[bool]:
+    """Predicate: a word of ``text`` starts with ``prefix``, ignoring case.
+
+    ``\\m`` anchors the regular expression at a word start; a trigram index on
+    ``text`` can serve it.
+    """
+    return text.regexp_match(r"\m" + re.escape(prefix), flags="i")
+
+
+def text_query(query: str) -> ColumnElement[str]:
+    """User input as a ``tsquery``: words are ANDed, quotes, ``or`` and ``-`` work."""
+    return func.websearch_to_tsquery(literal(SEARCH_CONFIG, REGCONFIG), query)
+
+
+def text_match(document: ColumnElement[str], query: str) -> ColumnElement[bool]:
+    """Index-backed predicate: ``document`` matches the ``tsquery`` of ``query``."""
+    return document.bool_op("@@")(text_query(query))
+
+
+def text_rank(document: ColumnElement[str], query: str) -> ColumnElement[float]:
+    """``ts_rank`` of ``document``; higher is better, and weight A outranks B and C."""
+    return func.ts_rank(document, text_query(query), type_=Float)
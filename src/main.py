@@ -1,3 +1,6 @@
+import asyncio
+import contextlib
+import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
@@ -6,13 +9,88 @@ from fastapi import FastAPI
 from src.api.middleware import register_exception_handlers
 from src.api.v1.router import api_v1_router
 from src.core.config import config
+from src.infrastructure.cache import (
+    DataVersionWatcher,
+    count_cache,
+    load_activity_tree,
+    load_building_index,
+    load_name_index,
+    refresh_periodically,
+    search_cache,
+    tile_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _clear_result_caches() -> None:
+    search_cache.clear()
+    tile_cache.clear()
+    count_cache.clear()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan: startup and shutdown events."""
+    background: list[asyncio.Task[None]] = []
+
+    if config.spatial_index.enabled:
+        try:
+            await load_building_index()
+        except Exception:
+            logger.exception("Building spatial index failed to load, using PostGIS")
+        background.append(
+            asyncio.create_task(
+                refresh_periodically(load_building_index, config.spatial_index.refresh_interval)
+            )
+        )
+
+    if config.activity.cache_enabled:
+        activity_watcher = DataVersionWatcher(["activities"], on_change=load_activity_tree)
+        try:
+            await activity_watcher.check()
+        except Exception:
+            logger.exception("Activity tree cache failed to load, using the database")
+        background.append(
+            asyncio.create_task(
+                refresh_periodically(activity_watcher.check, config.activity.cache_check_interval)
+            )
+        )
+
+    if config.suggest.enabled:
+        name_watcher = DataVersionWatcher(
+            ["organizations", "activities"], on_change=load_name_index
+        )
+        try:
+            await name_watcher.check()
+        except Exception:
+            logger.exception("Name prefix index failed to load, using the database")
+        background.append(
+            asyncio.create_task(
+                refresh_periodically(name_watcher.check, config.suggest.check_interval)
+            )
+        )
+
+    # The tile cache is always in use, so the watcher always runs; the search and
+    # count caches only shorten its interval when they are enabled.
+    check_intervals = [config.tiles.check_interval] + [
+        group.check_interval for group in (config.search_cache, config.count_cache) if group.enabled
+    ]
+    watcher = DataVersionWatcher(
+        ["buildings", "organizations", "activities", "organization_activity"],
+        on_change=_clear_result_caches,
+    )
+    background.append(
+        asyncio.create_task(refresh_periodically(watcher.check, min(check_intervals)))
+    )
+
     yield
 
+    for task in background:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
 
 def create_app() -> FastAPI:
     app = FastAPI(
@@ -1,4 +1,5 @@
 from src.services.building import BuildingService
 from src.services.organization import OrganizationService
+from src.services.tile import TileService
 
-__all__ = ["BuildingService", "OrganizationService"]
+__all__ = ["BuildingService", "OrganizationService", "TileService"]
@@ -1,15 +1,39 @@
+from collections.abc import Hashable
+
+from src.domain.interfaces.caches import CacheProtocol
 from src.domain.interfaces.repositories import BuildingRepositoryProtocol
 from src.domain.schemas.building import BuildingRead
-from src.domain.schemas.pagination import PaginatedResponse
-from src.services.pagination import paginate
+from src.domain.schemas.pagination import PaginatedResponse, TotalMode
+from src.services.pagination import PageRequest, decode_cursor, load_page
 
 
 class BuildingService:
-    def __init__(self, repository: BuildingRepositoryProtocol) -> None:
+    def __init__(
+        self,
+        repository: BuildingRepositoryProtocol,
+        count_cache: CacheProtocol[Hashable, int] | None = None,
+    ) -> None:
         self._repo = repository
+        self._count_cache = count_cache
+
+    async def get_all(
+        self,
+        *,
+        page: int = 1,
+        size: int = 20,
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> PaginatedResponse[BuildingRead]:
+        """List buildings in id order, by page number or by cursor."""
+        after = decode_cursor(cursor, 1)[0] if cursor is not None else None
 
-    async def get_all(self, *, page: int = 1, size: int = 20) -> PaginatedResponse[BuildingRead]:
-        offset = (page - 1) * size
-        items = await self._repo.get_all(offset=offset, limit=size)
-        total = await self._repo.count()
-        return paginate(items, total, page, size, BuildingRead)
+        return await load_page(
+            lambda offset, limit, mode: self._repo.get_page(
+                offset=offset, limit=limit, after=after, total_mode=mode
+            ),
+            BuildingRead,
+            PageRequest(page, size, cursor, total_mode),
+            key=lambda building: (building.id,),
+            count_cache=self._count_cache,
+            count_key=("buildings",),
+        )
@@ -0,0 +1,81 @@
+import csv
+import io
+from collections.abc import AsyncIterator, Sequence
+from contextlib import aclosing
+
+from src.domain.interfaces.repositories import OrganizationRepositoryFactory
+from src.domain.models import Organization
+from src.domain.schemas.filter import ExportFormat, OrganizationFilter
+from src.domain.schemas.organization import OrganizationRead
+
+CSV_COLUMNS = [
+    "id",
+    "name",
+    "phone_numbers",
+    "building_id",
+    "address",
+    "latitude",
+    "longitude",
+    "activities",
+    "created_at",
+]
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _ndjson(batch: Sequence[Organization]) -> str:
+    return "".join(OrganizationRead.model_validate(org).model_dump_json() + "\n" for org in batch)
+
+
+def _csv(rows: list[list[object]]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def _csv_rows(batch: Sequence[Organization]) -> str:
+    return _csv(
+        [
+            [
+                org.id,
+                org.name,
+                "; ".join(org.phone_numbers),
+                org.building.id,
+                org.building.address,
+                org.building.latitude,
+                org.building.longitude,
+                "; ".join(activity.name for activity in org.activities),
+                org.created_at.isoformat(),
+            ]
+            for org in batch
+        ]
+    )
+
+
+class OrganizationExportService:
+    def __init__(
+        self, repository_factory: OrganizationRepositoryFactory, batch_size: int = 1000
+    ) -> None:
+        self._repository_factory = repository_factory
+        self._batch_size = batch_size
+
+    async def export(self, filters: OrganizationFilter, fmt: ExportFormat) -> AsyncIterator[str]:
+        """Yield every matching organization, one chunk per streamed batch.
+
+        The export reads through its own repository rather than the request's
+        session, which is closed before a streamed body is sent. The repository and
+        its server-side cursor are released when the iteration ends for any reason,
+        including a client disconnect cancelling the response.
+        """
+        encode = _ndjson if fmt is ExportFormat.NDJSON else _csv_rows
+        if fmt is ExportFormat.CSV:
+            yield _csv([CSV_COLUMNS])
+        async with (
+            self._repository_factory() as repository,
+            aclosing(repository.stream_batches(filters, batch_size=self._batch_size)) as batches,
+        ):
+            async for batch in batches:
+                yield encode(batch)
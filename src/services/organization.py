@@ -1,15 +1,80 @@
+import math
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import Any, TypeVar
 from uuid import UUID
 
-from src.domain.exceptions import NotFoundError
+from src.domain.exceptions import DomainError, NotFoundError
+from src.domain.interfaces.caches import CacheProtocol
+from src.domain.interfaces.indexes import ActivityTreeProtocol, SpatialIndexProtocol
 from src.domain.interfaces.repositories import (
     ActivityRepositoryProtocol,
     BuildingRepositoryProtocol,
     OrganizationRepositoryProtocol,
 )
-from src.domain.schemas.geo import GeoCircleParams, GeoRectParams
-from src.domain.schemas.organization import OrganizationRead
-from src.domain.schemas.pagination import PaginatedResponse
-from src.services.pagination import paginate
+from src.domain.models import Organization
+from src.domain.schemas.batch import (
+    GeoBatchParams,
+    GeoBatchResponse,
+    GeoBatchResult,
+    OrganizationBatchResponse,
+    OrganizationBatchResult,
+)
+from src.domain.schemas.cluster import ClusterRead, ClusterResponse, GeoClusterParams
+from src.domain.schemas.filter import OrganizationFilter
+from src.domain.schemas.geo import (
+    GeoCircleParams,
+    GeoOrder,
+    GeoPointParams,
+    GeoPolygonParams,
+    GeoRectParams,
+)
+from src.domain.schemas.organization import (
+    OrganizationDistanceRead,
+    OrganizationRead,
+    RenderedOrganization,
+)
+from src.domain.schemas.pagination import PaginatedResponse, TotalMode
+from src.domain.schemas.search import MIN_PHONE_SUFFIX, NameOrder, PhoneMatch, phone_digits
+from src.services.pagination import PageRequest, decode_cursor, load_page, load_rendered_page
+
+MAX_CLUSTER_CELLS = 10_000
+
+T = TypeVar("T")
+
+
+def _name_key(org: Organization | RenderedOrganization) -> tuple[str, UUID]:
+    return org.name, org.id
+
+
+def _id_key(org: Organization) -> tuple[UUID]:
+    return (org.id,)
+
+
+def _after_name(cursor: str | None) -> tuple[str, UUID] | None:
+    if cursor is None:
+        return None
+    name, org_id = decode_cursor(cursor, 2)
+    if not isinstance(name, str):
+        raise DomainError("Invalid cursor")
+    return name, org_id
+
+
+def _after_id(cursor: str | None) -> UUID | None:
+    return decode_cursor(cursor, 1)[0] if cursor is not None else None
+
+
+def _rect_bounds(params: GeoRectParams) -> tuple[float, float, float, float]:
+    return params.min_latitude, params.max_latitude, params.min_longitude, params.max_longitude
+
+
+def _with_distance(rows: Sequence[tuple[object, float]]) -> list[OrganizationDistanceRead]:
+    fields = OrganizationRead.model_fields
+    return [
+        OrganizationDistanceRead.model_validate(
+            {**{name: getattr(org, name) for name in fields}, "distance_m": distance}
+        )
+        for org, distance in rows
+    ]
 
 
 class OrganizationService:
@@ -18,10 +83,49 @@ class OrganizationService:
         organization_repo: OrganizationRepositoryProtocol,
         building_repo: BuildingRepositoryProtocol,
         activity_repo: ActivityRepositoryProtocol,
+        spatial_index: SpatialIndexProtocol | None = None,
+        search_cache: CacheProtocol[Hashable, PaginatedResponse[Any]] | None = None,
+        search_cache_precision: int = 4,
+        activity_tree: ActivityTreeProtocol | None = None,
+        count_cache: CacheProtocol[Hashable, int] | None = None,
     ) -> None:
         self._org_repo = organization_repo
         self._building_repo = building_repo
         self._activity_repo = activity_repo
+        self._spatial_index = spatial_index
+        self._search_cache = search_cache
+        self._search_cache_precision = search_cache_precision
+        self._activity_tree = activity_tree
+        self._count_cache = count_cache
+
+    def _ready_spatial_index(self) -> SpatialIndexProtocol | None:
+        if self._spatial_index is not None and self._spatial_index.is_ready:
+            return self._spatial_index
+        return None
+
+    async def _ensure_activity_exists(self, activity_id: UUID) -> None:
+        """Check the activity tree cache first, then the database."""
+        tree = self._activity_tree
+        if tree is not None and tree.is_ready and tree.get_path(activity_id) is not None:
+            return
+        if not await self._activity_repo.exists(activity_id):
+            raise NotFoundError("Activity", activity_id)
+
+    async def _ensure_building_exists(self, building_id: UUID) -> None:
+        if not await self._building_repo.exists(building_id):
+            raise NotFoundError("Building", building_id)
+
+    async def _cached(
+        self, key: Hashable, load: Callable[[], Awaitable[PaginatedResponse[T]]]
+    ) -> PaginatedResponse[T]:
+        if self._search_cache is None:
+            return await load()
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached
+        result = await load()
+        self._search_cache.set(key, result)
+        return result
 
     async def get_by_id(self, org_id: UUID) -> OrganizationRead:
         org = await self._org_repo.get_by_id_full(org_id)
@@ -29,83 +133,408 @@ class OrganizationService:
             raise NotFoundError("Organization", org_id)
         return OrganizationRead.model_validate(org)
 
+    async def get_many(self, ids: Sequence[UUID]) -> OrganizationBatchResponse:
+        """Fetch organizations by id, one result per id in request order.
+
+        Repeated ids are loaded once and answered at every position.
+        """
+        found = {
+            org.id: OrganizationRead.model_validate(org)
+            for org in await self._org_repo.get_many_full(list(dict.fromkeys(ids)))
+        }
+        return OrganizationBatchResponse(
+            results=[
+                OrganizationBatchResult(id=org_id, found=org_id in found, item=found.get(org_id))
+                for org_id in ids
+            ]
+        )
+
     async def get_by_building(
-        self, building_id: UUID, *, page: int = 1, size: int = 20
+        self,
+        building_id: UUID,
+        *,
+        page: int = 1,
+        size: int = 20,
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
     ) -> PaginatedResponse[OrganizationRead]:
-        building = await self._building_repo.get_by_id(building_id)
-        if building is None:
-            raise NotFoundError("Building", building_id)
+        after = _after_name(cursor)
+        await self._ensure_building_exists(building_id)
 
-        offset = (page - 1) * size
-        items, total = await self._org_repo.find_by_building_id(
-            building_id, offset=offset, limit=size
+        return await load_page(
+            lambda offset, limit, mode: self._org_repo.find_by_building_id(
+                building_id, offset=offset, limit=limit, after=after, total_mode=mode
+            ),
+            OrganizationRead,
+            PageRequest(page, size, cursor, total_mode),
+            key=_name_key,
+            count_cache=self._count_cache,
+            count_key=("building", building_id),
+        )
+
+    async def render_by_building(
+        self,
+        building_id: UUID,
+        *,
+        page: int = 1,
+        size: int = 20,
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> bytes:
+        """``get_by_building`` as response JSON, serialized by the database."""
+        after = _after_name(cursor)
+        await self._ensure_building_exists(building_id)
+
+        return await load_rendered_page(
+            lambda offset, limit, mode: self._org_repo.render_by_building_id(
+                building_id, offset=offset, limit=limit, after=after, total_mode=mode
+            ),
+            PageRequest(page, size, cursor, total_mode),
+            key=_name_key,
+            count_cache=self._count_cache,
+            count_key=("building", building_id),
         )
-        return paginate(items, total, page, size, OrganizationRead)
 
     async def get_by_activity(
-        self, activity_id: UUID, *, page: int = 1, size: int = 20
+        self,
+        activity_id: UUID,
+        *,
+        page: int = 1,
+        size: int = 20,
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
     ) -> PaginatedResponse[OrganizationRead]:
-        """Get organizations by a specific activity."""
-        activity = await self._activity_repo.get_by_id(activity_id)
-        if activity is None:
-            raise NotFoundError("Activity", activity_id)
+        """Get organizations by a specific activity, in id order."""
+        after = _after_id(cursor)
+        await self._ensure_activity_exists(activity_id)
 
-        offset = (page - 1) * size
-        items, total = await self._org_repo.find_by_activity_ids(
-            [activity_id], offset=offset, limit=size
+        return await load_page(
+            lambda offset, limit, mode: self._org_repo.find_by_activity_ids(
+                [activity_id], offset=offset, limit=limit, after=after, total_mode=mode
+            ),
+            OrganizationRead,
+            PageRequest(page, size, cursor, total_mode),
+            key=_id_key,
+            count_cache=self._count_cache,
+            count_key=("activity", activity_id),
         )
-        return paginate(items, total, page, size, OrganizationRead)
 
     async def search_by_activity_tree(
-        self, activity_id: UUID, *, page: int = 1, size: int = 20
+        self,
+        activity_id: UUID,
+        *,
+        page: int = 1,
+        size: int = 20,
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
     ) -> PaginatedResponse[OrganizationRead]:
-        """Search organizations by activity including all child activities."""
-        activity = await self._activity_repo.get_by_id(activity_id)
-        if activity is None:
-            raise NotFoundError("Activity", activity_id)
+        """Search organizations by activity including all child activities, in id order."""
+        after = _after_id(cursor)
+        await self._ensure_activity_exists(activity_id)
 
-        subtree_ids = await self._activity_repo.get_subtree_ids(activity_id)
-        offset = (page - 1) * size
-        items, total = await self._org_repo.find_by_activity_ids(
-            subtree_ids, offset=offset, limit=size
+        return await load_page(
+            lambda offset, limit, mode: self._org_repo.find_by_activity_subtree(
+                activity_id, offset=offset, limit=limit, after=after, total_mode=mode
+            ),
+            OrganizationRead,
+            PageRequest(page, size, cursor, total_mode),
+            key=_id_key,
+            count_cache=self._count_cache,
+            count_key=("activity-tree", activity_id),
+        )
+
+    async def search_by_phone(
+        self,
+        phone: str,
+        *,
+        match: PhoneMatch = PhoneMatch.EXACT,
+        page: int = 1,
+        size: int = 20,
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> PaginatedResponse[OrganizationRead]:
+        """Search by phone number in any format, in id order; only the digits count."""
+        digits = phone_digits(phone)
+        if not digits:
+            raise DomainError("Phone number must contain digits")
+        if match is PhoneMatch.SUFFIX and len(digits) < MIN_PHONE_SUFFIX:
+            raise DomainError(f"Phone suffix must have at least {MIN_PHONE_SUFFIX} digits")
+        after = _after_id(cursor)
+        return await load_page(
+            lambda offset, limit, mode: self._org_repo.find_by_phone(
+                digits, match=match, offset=offset, limit=limit, after=after, total_mode=mode
+            ),
+            OrganizationRead,
+            PageRequest(page, size, cursor, total_mode),
+            key=_id_key,
+            count_cache=self._count_cache,
+            count_key=("phone", digits, match),
         )
-        return paginate(items, total, page, size, OrganizationRead)
 
     async def search_by_name(
-        self, name: str, *, page: int = 1, size: int = 20
+        self,
+        name: str,
+        *,
+        order: NameOrder = NameOrder.NAME,
+        page: int = 1,
+        size: int = 20,
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
     ) -> PaginatedResponse[OrganizationRead]:
-        offset = (page - 1) * size
-        items, total = await self._org_repo.search_by_name(name, offset=offset, limit=size)
-        return paginate(items, total, page, size, OrganizationRead)
+        """Search by name.
 
-    async def find_in_radius(
-        self, params: GeoCircleParams, *, page: int = 1, size: int = 20
+        Relevance order pages by number only, like distance order: similarity
+        ranking has no key to resume from.
+        """
+        if cursor is not None and order is NameOrder.RELEVANCE:
+            raise DomainError("Cursor pagination is not available for relevance order")
+        after = _after_name(cursor)
+        return await load_page(
+            lambda offset, limit, mode: self._org_repo.search_by_name(
+                name, order=order, offset=offset, limit=limit, after=after, total_mode=mode
+            ),
+            OrganizationRead,
+            PageRequest(page, size, cursor, total_mode),
+            key=_name_key if order is NameOrder.NAME else None,
+            count_cache=self._count_cache,
+            count_key=("name", name, order),
+        )
+
+    async def search(
+        self,
+        query: str,
+        *,
+        page: int = 1,
+        size: int = 20,
+        total_mode: TotalMode = TotalMode.EXACT,
     ) -> PaginatedResponse[OrganizationRead]:
-        buildings = await self._building_repo.find_in_radius(params)
-        if not buildings:
-            return paginate([], 0, page, size, OrganizationRead)
+        """Full-text search across names, activities and addresses, best match first."""
+        return await load_page(
+            lambda offset, limit, mode: self._org_repo.search_text(
+                query, offset=offset, limit=limit, total_mode=mode
+            ),
+            OrganizationRead,
+            PageRequest(page, size, None, total_mode),
+            key=None,
+            count_cache=self._count_cache,
+            count_key=("text", query),
+        )
 
-        building_ids = [b.id for b in buildings]
-        offset = (page - 1) * size
-        items, total = await self._org_repo.find_by_building_ids(
-            building_ids, offset=offset, limit=size
+    async def find_in_radius(
+        self,
+        params: GeoCircleParams,
+        *,
+        order: GeoOrder = GeoOrder.NONE,
+        page: int = 1,
+        size: int = 20,
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> PaginatedResponse[OrganizationDistanceRead]:
+        """Search within a radius.
+
+        With the search cache enabled the center and radius are quantized first,
+        so nearby requests share one cached result. Distance order pages by number
+        only: a KNN scan has no key to resume from.
+        """
+        if cursor is not None and order is GeoOrder.DISTANCE:
+            raise DomainError("Cursor pagination is not available for distance order")
+        after = _after_name(cursor)
+        if self._search_cache is not None:
+            params = params.quantized(self._search_cache_precision)
+        request = PageRequest(page, size, cursor, total_mode)
+        key = ("radius", params.latitude, params.longitude, params.radius_km, order, request)
+        return await self._cached(key, lambda: self._find_in_radius(params, order, request, after))
+
+    async def _find_in_radius(
+        self,
+        params: GeoCircleParams,
+        order: GeoOrder,
+        request: PageRequest,
+        after: tuple[str, UUID] | None,
+    ) -> PaginatedResponse[OrganizationDistanceRead]:
+        spatial_index = self._ready_spatial_index()
+        distances = None
+        if order is GeoOrder.NONE and spatial_index is not None:
+            distances = spatial_index.find_in_radius(params)
+
+        async def fetch(
+            offset: int, limit: int, mode: TotalMode
+        ) -> tuple[Sequence[tuple[Organization, float]], int | None]:
+            if distances is not None:
+                items, total = await self._find_by_building_ids(
+                    list(distances), offset, limit, after, mode
+                )
+                return [(org, distances[org.building_id]) for org in items], total
+            return await self._org_repo.find_in_radius(
+                params, order=order, offset=offset, limit=limit, after=after, total_mode=mode
+            )
+
+        return await load_page(
+            fetch,
+            OrganizationDistanceRead,
+            request,
+            key=(lambda row: _name_key(row[0])) if order is GeoOrder.NONE else None,
+            convert=_with_distance,
+            count_cache=self._count_cache,
+            count_key=("radius", params.latitude, params.longitude, params.radius_km),
         )
-        return paginate(items, total, page, size, OrganizationRead)
+
+    async def find_nearest(
+        self, params: GeoPointParams, *, limit: int = 20
+    ) -> list[OrganizationDistanceRead]:
+        """Get the organizations nearest to a point, closest first."""
+        rows = await self._org_repo.find_nearest(params, limit=limit)
+        return _with_distance(rows)
 
     async def find_in_rect(
-        self, params: GeoRectParams, *, page: int = 1, size: int = 20
+        self,
+        params: GeoRectParams,
+        *,
+        page: int = 1,
+        size: int = 20,
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> PaginatedResponse[OrganizationRead]:
+        """Search within a rectangle; bounds are quantized like ``find_in_radius``."""
+        after = _after_name(cursor)
+        if self._search_cache is not None:
+            params = params.quantized(self._search_cache_precision)
+        request = PageRequest(page, size, cursor, total_mode)
+        key = ("rect", *_rect_bounds(params), request)
+        return await self._cached(key, lambda: self._find_in_rect(params, request, after))
+
+    async def _find_in_rect(
+        self, params: GeoRectParams, request: PageRequest, after: tuple[str, UUID] | None
     ) -> PaginatedResponse[OrganizationRead]:
-        if params.is_too_wide:
-            buildings = await self._building_repo.get_all()
-        else:
-            buildings = await self._building_repo.find_in_rect(params)
+        spatial_index = self._ready_spatial_index()
 
-        if not buildings:
-            return paginate([], 0, page, size, OrganizationRead)
+        async def fetch(
+            offset: int, limit: int, mode: TotalMode
+        ) -> tuple[Sequence[Organization], int | None]:
+            if spatial_index is not None:
+                building_ids = spatial_index.find_in_rect(params)
+                return await self._find_by_building_ids(building_ids, offset, limit, after, mode)
+            return await self._org_repo.find_in_rect(
+                params, offset=offset, limit=limit, after=after, total_mode=mode
+            )
 
-        building_ids = [b.id for b in buildings]
-        offset = (page - 1) * size
-        items, total = await self._org_repo.find_by_building_ids(
-            building_ids, offset=offset, limit=size
+        return await load_page(
+            fetch,
+            OrganizationRead,
+            request,
+            key=_name_key,
+            count_cache=self._count_cache,
+            count_key=("rect", *_rect_bounds(params)),
+        )
+
+    async def find_in_polygon(
+        self,
+        params: GeoPolygonParams,
+        *,
+        page: int = 1,
+        size: int = 20,
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> PaginatedResponse[OrganizationRead]:
+        after = _after_name(cursor)
+        return await load_page(
+            lambda offset, limit, mode: self._org_repo.find_in_polygon(
+                params, offset=offset, limit=limit, after=after, total_mode=mode
+            ),
+            OrganizationRead,
+            PageRequest(page, size, cursor, total_mode),
+            key=_name_key,
+            count_cache=self._count_cache,
+            count_key=("polygon", params.wkt),
+        )
+
+    async def search_matching(
+        self,
+        filters: OrganizationFilter,
+        *,
+        page: int = 1,
+        size: int = 20,
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> PaginatedResponse[OrganizationRead]:
+        """Search by any combination of conditions, in name order."""
+        after = _after_name(cursor)
+        return await load_page(
+            lambda offset, limit, mode: self._org_repo.find_matching(
+                filters, offset=offset, limit=limit, after=after, total_mode=mode
+            ),
+            OrganizationRead,
+            PageRequest(page, size, cursor, total_mode),
+            key=_name_key,
+            count_cache=self._count_cache,
+            count_key=("query", filters.model_dump_json()),
+        )
+
+    async def render_matching(
+        self,
+        filters: OrganizationFilter,
+        *,
+        page: int = 1,
+        size: int = 20,
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> bytes:
+        """``search_matching`` as response JSON, serialized by the database."""
+        after = _after_name(cursor)
+        return await load_rendered_page(
+            lambda offset, limit, mode: self._org_repo.render_matching(
+                filters, offset=offset, limit=limit, after=after, total_mode=mode
+            ),
+            PageRequest(page, size, cursor, total_mode),
+            key=_name_key,
+            count_cache=self._count_cache,
+            count_key=("query", filters.model_dump_json()),
+        )
+
+    async def find_in_batch(self, params: GeoBatchParams) -> GeoBatchResponse:
+        """Run many circle and rectangle searches at once."""
+        pages = await self._org_repo.find_in_batch(params)
+        return GeoBatchResponse(
+            results=[
+                GeoBatchResult(
+                    total=total,
+                    items=[OrganizationRead.model_validate(item) for item in items],
+                )
+                for items, total in pages
+            ]
+        )
+
+    async def get_clusters(self, params: GeoRectParams, grid: GeoClusterParams) -> ClusterResponse:
+        """Count organizations per grid cell of a viewport."""
+        cell_size = grid.resolved_cell_size
+        latitude_span = params.max_latitude - params.min_latitude
+        cells = math.ceil(params.longitude_span / cell_size) * math.ceil(latitude_span / cell_size)
+        if cells > MAX_CLUSTER_CELLS:
+            raise DomainError(
+                f"Viewport spans {cells} cells (max {MAX_CLUSTER_CELLS}); use a larger cell size"
+            )
+
+        rows = await self._org_repo.cluster_in_rect(params, cell_size)
+        clusters = [
+            ClusterRead(latitude=latitude, longitude=longitude, count=count)
+            for latitude, longitude, count in rows
+        ]
+        return ClusterResponse(
+            cell_size=cell_size,
+            total=sum(cluster.count for cluster in clusters),
+            clusters=clusters,
+        )
+
+    async def _find_by_building_ids(
+        self,
+        building_ids: list[UUID],
+        offset: int,
+        limit: int,
+        after: tuple[str, UUID] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Sequence[Organization], int | None]:
+        if not building_ids:
+            return [], 0
+        return await self._org_repo.find_by_building_ids(
+            building_ids, offset=offset, limit=limit, after=after, total_mode=total_mode
         )
-        return paginate(items, total, page, size, OrganizationRead)
@@ -1,23 +1,208 @@
+import base64
+import json
 import math
-from collections.abc import Sequence
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import Any, NamedTuple
+from uuid import UUID
 
 from pydantic import BaseModel
 
-from src.domain.schemas.pagination import PaginatedResponse
+from src.domain.exceptions import DomainError
+from src.domain.interfaces.caches import CacheProtocol
+from src.domain.schemas.pagination import PaginatedResponse, TotalMode
+
+
+class PageRequest(NamedTuple):
+    """Which page of a list to load and how to count its total."""
+
+    page: int
+    size: int
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
+
+
+FetchPage = Callable[[int, int, TotalMode], Awaitable[tuple[Sequence[Any], int | None]]]
+"""Loads ``(items, total)`` given an offset, a limit and how to count the total."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+    raw = json.dumps(values, default=str, ensure_ascii=False, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> tuple[Any, ...]:
+    """Decode a cursor into its sort key; the last value is always a row id."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != length:
+            raise ValueError
+        return (*values[:-1], UUID(values[-1]))
+    except (AttributeError, TypeError, ValueError) as exc:
+        raise DomainError("Invalid cursor") from exc
+
+
+def page_offset(page: int, size: int, cursor: str | None) -> int:
+    """Row offset of a page; a cursor replaces the offset altogether."""
+    return 0 if cursor is not None else (page - 1) * size
+
+
+def next_cursor(
+    items: Sequence[Any], size: int, key: Callable[[Any], tuple[Any, ...]]
+) -> str | None:
+    """Cursor for the page after ``items``, or ``None`` when this page is short."""
+    if not items or len(items) < size:
+        return None
+    return encode_cursor(*key(items[-1]))
 
 
 def paginate(
     items: Sequence,
-    total: int,
+    total: int | None,
     page: int,
     size: int,
     schema: type[BaseModel],
+    cursor: str | None = None,
+    *,
+    total_mode: TotalMode = TotalMode.EXACT,
+    has_next: bool | None = None,
 ) -> PaginatedResponse:
-    pages = math.ceil(total / size) if size > 0 else 0
+    pages = None
+    if total is not None:
+        pages = math.ceil(total / size) if size > 0 else 0
     return PaginatedResponse(
         items=[schema.model_validate(item) for item in items],
         total=total,
         page=page,
         size=size,
         pages=pages,
+        next_cursor=cursor,
+        total_mode=total_mode,
+        has_next=has_next,
+    )
+
+
+async def _fetch_page(
+    fetch: FetchPage,
+    request: PageRequest,
+    *,
+    key: Callable[[Any], tuple[Any, ...]] | None,
+    count_cache: CacheProtocol[Hashable, int] | None,
+    count_key: Hashable,
+) -> tuple[Sequence[Any], int | None, str | None, bool | None]:
+    """Fetch one page as ``load_page`` describes: its items, total, cursor and ``has_next``."""
+    page, size, cursor, total_mode = request
+    cached = None
+    if total_mode is TotalMode.EXACT and count_cache is not None:
+        cached = count_cache.get(count_key)
+
+    mode = TotalMode.NONE if cached is not None else total_mode
+    limit = size + 1 if total_mode is TotalMode.NONE else size
+    items, total = await fetch(page_offset(page, size, cursor), limit, mode)
+
+    has_next = None
+    if total_mode is TotalMode.NONE:
+        has_next = len(items) > size
+        items, total = items[:size], None
+    elif cached is not None:
+        total = cached
+    elif total_mode is TotalMode.EXACT and count_cache is not None and total is not None:
+        count_cache.set(count_key, total)
+
+    cursor = None
+    if key is not None and has_next is not False:
+        cursor = next_cursor(items, size, key)
+    return items, total, cursor, has_next
+
+
+async def load_page(
+    fetch: FetchPage,
+    schema: type[BaseModel],
+    request: PageRequest,
+    *,
+    key: Callable[[Any], tuple[Any, ...]] | None,
+    convert: Callable[[Sequence[Any]], Sequence[Any]] | None = None,
+    count_cache: CacheProtocol[Hashable, int] | None = None,
+    count_key: Hashable = None,
+) -> PaginatedResponse:
+    """Fetch one page and build its response, counting the total as requested.
+
+    ``none`` skips the count and reads one extra row to learn whether another page
+    follows. An exact total already in ``count_cache`` under ``count_key`` skips the
+    count too; a freshly counted one is stored there. ``key`` gives the cursor sort
+    key of a fetched item, ``None`` for lists without one, and ``convert`` maps
+    fetched items before validation.
+    """
+    items, total, cursor, has_next = await _fetch_page(
+        fetch, request, key=key, count_cache=count_cache, count_key=count_key
+    )
+    if convert is not None:
+        items = convert(items)
+    return paginate(
+        items,
+        total,
+        request.page,
+        request.size,
+        schema,
+        cursor,
+        total_mode=request.total_mode,
+        has_next=has_next,
+    )
+
+
+def render_page(
+    documents: Sequence[str],
+    total: int | None,
+    page: int,
+    size: int,
+    cursor: str | None = None,
+    *,
+    total_mode: TotalMode = TotalMode.EXACT,
+    has_next: bool | None = None,
+) -> bytes:
+    """The JSON of a ``PaginatedResponse`` whose items are already serialized.
+
+    Same fields, order and compact separators as ``paginate`` followed by the
+    response encoder; each document is spliced in as is, without being parsed.
+    """
+    pages = None
+    if total is not None:
+        pages = math.ceil(total / size) if size > 0 else 0
+    envelope = {
+        "total": total,
+        "page": page,
+        "size": size,
+        "pages": pages,
+        "next_cursor": cursor,
+        "total_mode": total_mode.value,
+        "has_next": has_next,
+    }
+    tail = json.dumps(envelope, ensure_ascii=False, separators=(",", ":"))
+    return f'{{"items":[{",".join(documents)}],{tail[1:]}'.encode()
+
+
+async def load_rendered_page(
+    fetch: FetchPage,
+    request: PageRequest,
+    *,
+    key: Callable[[Any], tuple[Any, ...]] | None,
+    count_cache: CacheProtocol[Hashable, int] | None = None,
+    count_key: Hashable = None,
+) -> bytes:
+    """``load_page`` for items the database serialized, rendered straight to JSON.
+
+    Fetched items carry their JSON in ``document``; nothing is validated.
+    """
+    items, total, cursor, has_next = await _fetch_page(
+        fetch, request, key=key, count_cache=count_cache, count_key=count_key
+    )
+    return render_page(
+        [item.document for item in items],
+        total,
+        request.page,
+        request.size,
+        cursor,
+        total_mode=request.total_mode,
+        has_next=has_next,
     )
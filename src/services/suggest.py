@@ -0,0 +1,25 @@
+from src.domain.interfaces.indexes import NamePrefixIndexProtocol
+from src.domain.interfaces.repositories import OrganizationRepositoryFactory
+from src.domain.schemas.suggest import SuggestionRead
+
+
+class SuggestService:
+    def __init__(
+        self,
+        index: NamePrefixIndexProtocol | None,
+        repository_factory: OrganizationRepositoryFactory,
+    ) -> None:
+        self._index = index
+        self._repository_factory = repository_factory
+
+    async def suggest(self, prefix: str, limit: int = 10) -> list[SuggestionRead]:
+        """Organization and activity names with a word starting with ``prefix``.
+
+        A loaded name index answers without opening a session, ordered by the
+        matching word. Until it is loaded, the database answers in name order.
+        """
+        if self._index is not None and self._index.is_ready:
+            return self._index.suggest(prefix, limit)
+        async with self._repository_factory() as repository:
+            rows = await repository.suggest_names(prefix, limit)
+        return [SuggestionRead(kind=kind, id=id_, name=name) for kind, id_, name in rows]
@@ -0,0 +1,26 @@
+from src.domain.exceptions import DomainError
+from src.domain.interfaces.caches import CacheProtocol
+from src.domain.interfaces.repositories import BuildingRepositoryProtocol
+
+
+class TileService:
+    def __init__(
+        self,
+        repository: BuildingRepositoryProtocol,
+        cache: CacheProtocol[tuple[int, int, int], bytes],
+    ) -> None:
+        self._repo = repository
+        self._cache = cache
+
+    async def get_tile(self, z: int, x: int, y: int) -> bytes:
+        """Get the vector tile ``z/x/y``, rendering it on a cache miss."""
+        tiles_per_side = 2**z
+        if not (0 <= x < tiles_per_side and 0 <= y < tiles_per_side):
+            raise DomainError(f"Tile {z}/{x}/{y} is outside the zoom {z} grid")
+
+        key = (z, x, y)
+        tile = self._cache.get(key)
+        if tile is None:
+            tile = await self._repo.get_tile(z, x, y)
+            self._cache.set(key, tile)
+        return tile
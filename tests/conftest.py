@@ -1,10 +1,18 @@
-from collections.abc import AsyncIterator
+import os
+from collections import Counter
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
+from typing import Any
 from unittest.mock import AsyncMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from src.api.dependencies.auth import verify_api_key
+from src.domain.models import Base
 from src.infrastructure.database import get_session
 from src.main import create_app
 
@@ -51,3 +59,76 @@ async def auth_client(app) -> AsyncIterator[AsyncClient]:
         headers={"X-Api-Key": TEST_API_KEY},
     ) as ac:
         yield ac
+
+
+@pytest.fixture
+async def postgis_session() -> AsyncIterator[AsyncSession]:
+    """Session on a migrated PostGIS database, rolled back after the test.
+
+    Tests using it are skipped unless ``TEST_DATABASE_URL`` is set.
+    """
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    engine = create_async_engine(url, poolclass=NullPool)
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, expire_on_commit=False)
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+    await engine.dispose()
+
+
+@dataclass
+class QueryCounter:
+    """SQL statements executed and ORM objects loaded while the counter is attached."""
+
+    statements: list[str] = field(default_factory=list)
+    loaded: Counter[str] = field(default_factory=Counter)
+
+    def reset(self) -> None:
+        self.statements.clear()
+        self.loaded.clear()
+
+
+@pytest.fixture
+def query_counter(postgis_session: AsyncSession) -> Iterator[QueryCounter]:
+    counter = QueryCounter()
+    sync_engine = postgis_session.bind.sync_engine
+
+    def on_execute(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        counter.statements.append(statement)
+
+    def on_load(target: Base, _context: Any) -> None:
+        counter.loaded[type(target).__name__] += 1
+
+    event.listen(sync_engine, "before_cursor_execute", on_execute)
+    event.listen(Base, "load", on_load, propagate=True)
+    try:
+        yield counter
+    finally:
+        event.remove(Base, "load", on_load)
+        event.remove(sync_engine, "before_cursor_execute", on_execute)
+
+
+@pytest.fixture
+async def db_client(postgis_session: AsyncSession) -> AsyncIterator[AsyncClient]:
+    """API client whose requests run in the ``postgis_session`` transaction."""
+    application = create_app()
+
+    async def _override_session():
+        yield postgis_session
+
+    async def _override_api_key():
+        return TEST_API_KEY
+
+    application.dependency_overrides[get_session] = _override_session
+    application.dependency_overrides[verify_api_key] = _override_api_key
+
+    transport = ASGITransport(app=application)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
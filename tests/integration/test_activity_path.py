@@ -0,0 +1,121 @@
+"""Trigger-maintained activity paths and organization closure, and lookups built on them."""
+
+from uuid import UUID
+
+import pytest
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models import Activity, Building, Organization, organization_activity
+from src.infrastructure.repositories import OrganizationRepository
+
+
+async def _add_activity(
+    session: AsyncSession, name: str, parent: Activity | None = None
+) -> Activity:
+    activity = Activity(
+        name=name,
+        parent_id=parent.id if parent else None,
+        level=parent.level + 1 if parent else 1,
+    )
+    session.add(activity)
+    await session.flush()
+    await session.refresh(activity)
+    return activity
+
+
+@pytest.fixture
+async def tree(postgis_session: AsyncSession) -> dict[str, Activity]:
+    food = await _add_activity(postgis_session, "Food")
+    meat = await _add_activity(postgis_session, "Meat", food)
+    dairy = await _add_activity(postgis_session, "Dairy", food)
+    cars = await _add_activity(postgis_session, "Cars")
+    return {"food": food, "meat": meat, "dairy": dairy, "cars": cars}
+
+
+async def test_paths_are_set_on_insert(tree: dict[str, Activity]) -> None:
+    food, meat = tree["food"], tree["meat"]
+
+    assert food.path == f"{food.id.hex}."
+    assert meat.path == f"{food.id.hex}.{meat.id.hex}."
+
+
+async def test_move_rewrites_subtree_paths(
+    postgis_session: AsyncSession, tree: dict[str, Activity]
+) -> None:
+    meat = tree["meat"]
+    sausage = await _add_activity(postgis_session, "Sausage", meat)
+
+    await postgis_session.execute(
+        update(Activity).where(Activity.id == meat.id).values(parent_id=tree["cars"].id)
+    )
+    for activity in (meat, sausage):
+        await postgis_session.refresh(activity)
+
+    assert meat.path == f"{tree['cars'].id.hex}.{meat.id.hex}."
+    assert sausage.path == f"{meat.path}{sausage.id.hex}."
+
+
+@pytest.fixture
+async def orgs(postgis_session: AsyncSession, tree: dict[str, Activity]) -> dict[str, Organization]:
+    building = Building(address="closure test", location=Building.make_location(55.75, 37.61))
+    postgis_session.add(building)
+    await postgis_session.flush()
+    orgs = {
+        "butcher": Organization(name="Butcher", building_id=building.id, activities=[tree["meat"]]),
+        "market": Organization(
+            name="Market", building_id=building.id, activities=[tree["meat"], tree["dairy"]]
+        ),
+        "dealer": Organization(name="Dealer", building_id=building.id, activities=[tree["cars"]]),
+    }
+    postgis_session.add_all(orgs.values())
+    await postgis_session.flush()
+    return orgs
+
+
+async def _subtree_org_ids(session: AsyncSession, activity: Activity) -> set[UUID]:
+    items, total = await OrganizationRepository(session).find_by_activity_subtree(activity.id)
+    assert total == len(items)
+    return {org.id for org in items}
+
+
+async def test_find_by_activity_subtree(
+    postgis_session: AsyncSession, tree: dict[str, Activity], orgs: dict[str, Organization]
+) -> None:
+    assert await _subtree_org_ids(postgis_session, tree["food"]) == {
+        orgs["butcher"].id,
+        orgs["market"].id,
+    }
+    assert await _subtree_org_ids(postgis_session, tree["dairy"]) == {orgs["market"].id}
+
+
+async def test_closure_follows_unassignment(
+    postgis_session: AsyncSession, tree: dict[str, Activity], orgs: dict[str, Organization]
+) -> None:
+    await postgis_session.execute(
+        delete(organization_activity).where(
+            organization_activity.c.organization_id == orgs["market"].id,
+            organization_activity.c.activity_id == tree["meat"].id,
+        )
+    )
+
+    assert await _subtree_org_ids(postgis_session, tree["food"]) == {
+        orgs["butcher"].id,
+        orgs["market"].id,
+    }
+    assert await _subtree_org_ids(postgis_session, tree["meat"]) == {orgs["butcher"].id}
+
+
+async def test_closure_follows_move(
+    postgis_session: AsyncSession, tree: dict[str, Activity], orgs: dict[str, Organization]
+) -> None:
+    await postgis_session.execute(
+        update(Activity).where(Activity.id == tree["meat"].id).values(parent_id=tree["cars"].id)
+    )
+
+    assert await _subtree_org_ids(postgis_session, tree["food"]) == {orgs["market"].id}
+    assert await _subtree_org_ids(postgis_session, tree["cars"]) == {
+        orgs["butcher"].id,
+        orgs["market"].id,
+        orgs["dealer"].id,
+    }
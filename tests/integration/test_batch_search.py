@@ -0,0 +1,65 @@
+"""Batch geo search agrees with the single-query searches it replaces."""
+
+import random
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models import Building, Organization
+from src.domain.schemas import GeoBatchParams, GeoCircleParams, GeoRectParams
+from src.infrastructure.repositories import OrganizationRepository
+
+QUERIES: list[GeoCircleParams | GeoRectParams] = [
+    GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=5),
+    GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=60),
+    GeoCircleParams(latitude=0.0, longitude=0.0, radius_km=1),
+    GeoRectParams(min_latitude=55.5, max_latitude=56.0, min_longitude=37.0, max_longitude=38.0),
+    GeoRectParams(
+        min_latitude=-20.0, max_latitude=-15.0, min_longitude=178.0, max_longitude=-178.0
+    ),
+    GeoRectParams(
+        min_latitude=-20.0, max_latitude=-12.0, min_longitude=-170.0, max_longitude=170.0
+    ),
+]
+
+
+@pytest.fixture
+async def repo(postgis_session: AsyncSession) -> OrganizationRepository:
+    rng = random.Random(7)
+    for i in range(500):
+        if i % 2:
+            latitude, longitude = rng.uniform(55.0, 56.5), rng.uniform(36.5, 38.5)
+        else:
+            latitude, longitude = rng.uniform(-25.0, -10.0), rng.uniform(-180.0, 180.0)
+        building = Building(
+            address=f"batch {i}", location=Building.make_location(latitude, longitude)
+        )
+        postgis_session.add(building)
+        await postgis_session.flush()
+        postgis_session.add(Organization(name=f"batch {i}", building_id=building.id))
+    await postgis_session.flush()
+    return OrganizationRepository(postgis_session)
+
+
+async def test_batch_matches_single_searches(repo: OrganizationRepository) -> None:
+    results = await repo.find_in_batch(GeoBatchParams(queries=QUERIES, limit=100))
+
+    assert len(results) == len(QUERIES)
+    for query, (items, total) in zip(QUERIES, results, strict=True):
+        if isinstance(query, GeoCircleParams):
+            rows, expected_total = await repo.find_in_radius(query, limit=1000)
+            expected = {org.id for org, _ in rows}
+        else:
+            orgs, expected_total = await repo.find_in_rect(query, limit=1000)
+            expected = {org.id for org in orgs}
+
+        assert total == expected_total
+        assert [org.id for org in items] == sorted(expected)[:100]
+
+
+async def test_counts_only(repo: OrganizationRepository) -> None:
+    results = await repo.find_in_batch(GeoBatchParams(queries=QUERIES, limit=0))
+
+    assert all(items == [] for items, _ in results)
+    assert results[2][1] == 0
+    assert results[1][1] > results[0][1]
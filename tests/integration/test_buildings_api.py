@@ -4,6 +4,8 @@ from uuid import UUID
 
 from httpx import AsyncClient
 
+from src.domain.schemas import TotalMode
+
 BUILDING_UUID_1 = UUID("11111111-1111-1111-1111-111111111111")
 BUILDING_UUID_2 = UUID("22222222-2222-2222-2222-222222222222")
 
@@ -27,8 +29,7 @@ class TestListBuildings:
         with patch("src.api.dependencies.services.BuildingRepository") as mock_repo_cls:
             repo = AsyncMock()
             mock_repo_cls.return_value = repo
-            repo.get_all.return_value = buildings
-            repo.count.return_value = 2
+            repo.get_page.return_value = (buildings, 2)
 
             response = await auth_client.get("/api/v1/buildings/")
 
@@ -41,8 +42,7 @@ class TestListBuildings:
         with patch("src.api.dependencies.services.BuildingRepository") as mock_repo_cls:
             repo = AsyncMock()
             mock_repo_cls.return_value = repo
-            repo.get_all.return_value = [_mock_building()]
-            repo.count.return_value = 50
+            repo.get_page.return_value = ([_mock_building()], 50)
 
             response = await auth_client.get("/api/v1/buildings/", params={"page": 2, "size": 10})
 
@@ -51,3 +51,49 @@ class TestListBuildings:
         assert data["page"] == 2
         assert data["size"] == 10
         assert data["total"] == 50
+
+    async def test_list_buildings_by_cursor(self, auth_client: AsyncClient) -> None:
+        with patch("src.api.dependencies.services.BuildingRepository") as mock_repo_cls:
+            repo = AsyncMock()
+            mock_repo_cls.return_value = repo
+            repo.get_page.return_value = ([_mock_building()], 50)
+
+            first = await auth_client.get("/api/v1/buildings/", params={"size": 1})
+            cursor = first.json()["next_cursor"]
+            response = await auth_client.get(
+                "/api/v1/buildings/", params={"size": 1, "cursor": cursor}
+            )
+
+        assert response.status_code == 200
+        repo.get_page.assert_called_with(
+            offset=0, limit=1, after=BUILDING_UUID_1, total_mode=TotalMode.EXACT
+        )
+
+    async def test_invalid_cursor(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.get("/api/v1/buildings/", params={"cursor": "garbage"})
+
+        assert response.status_code == 400
+
+    async def test_list_buildings_without_total(self, auth_client: AsyncClient) -> None:
+        with patch("src.api.dependencies.services.BuildingRepository") as mock_repo_cls:
+            repo = AsyncMock()
+            mock_repo_cls.return_value = repo
+            repo.get_page.return_value = (
+                [
+                    _mock_building(id=BUILDING_UUID_1),
+                    _mock_building(id=BUILDING_UUID_2),
+                ],
+                None,
+            )
+
+            response = await auth_client.get(
+                "/api/v1/buildings/", params={"size": 1, "total": "none"}
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        assert data["pages"] is None
+        assert data["total_mode"] == "none"
+        assert data["has_next"] is True
+        assert len(data["items"]) == 1
@@ -0,0 +1,11 @@
+from httpx import AsyncClient
+
+
+class TestCacheStats:
+    async def test_returns_counters(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.get("/api/v1/cache/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {"search", "tiles", "counts"}
+        assert set(data["tiles"]) == {"size", "hits", "misses", "evictions"}
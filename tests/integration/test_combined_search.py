@@ -0,0 +1,63 @@
+"""Combined filters answered by one page statement and one count."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models import Activity, Building, Organization
+from tests.conftest import QueryCounter
+
+
+@pytest.fixture
+async def seeded(postgis_session: AsyncSession) -> dict[str, str]:
+    near = Building(address="near", location=Building.make_location(55.7500, 37.6100))
+    far = Building(address="far", location=Building.make_location(55.9000, 37.9000))
+    food = Activity(name="Еда", level=1)
+    postgis_session.add_all([near, far, food])
+    await postgis_session.flush()
+    bakery = Activity(name="Выпечка", parent_id=food.id, level=2)
+    postgis_session.add(bakery)
+    await postgis_session.flush()
+    postgis_session.add_all(
+        [
+            Organization(name="Булочная Хлеб", building_id=near.id, activities=[bakery]),
+            Organization(name="Хлебный двор", building_id=far.id, activities=[bakery]),
+            Organization(name="Хлеб и соль", building_id=near.id, activities=[food]),
+            Organization(name="Пекарня", building_id=near.id, activities=[bakery]),
+        ]
+    )
+    await postgis_session.flush()
+    postgis_session.expunge_all()
+    return {"food": str(food.id), "bakery": str(bakery.id)}
+
+
+async def test_all_conditions_in_one_statement(
+    db_client: AsyncClient, seeded: dict[str, str], query_counter: QueryCounter
+) -> None:
+    query_counter.reset()
+
+    response = await db_client.post(
+        "/api/v1/organizations/search/query",
+        json={
+            "name": "хлеб",
+            "activity_id": seeded["food"],
+            "include_child_activities": True,
+            "circle": {"latitude": 55.75, "longitude": 37.61, "radius_km": 2},
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["name"] for item in data["items"]] == ["Булочная Хлеб", "Хлеб и соль"]
+    assert data["total"] == 2
+    # The page, the activities of its organizations and the count.
+    assert len(query_counter.statements) == 3, query_counter.statements
+
+
+async def test_direct_activity_only(db_client: AsyncClient, seeded: dict[str, str]) -> None:
+    response = await db_client.post(
+        "/api/v1/organizations/search/query",
+        json={"name": "хлеб", "activity_id": seeded["food"]},
+    )
+
+    assert [item["name"] for item in response.json()["items"]] == ["Хлеб и соль"]
@@ -0,0 +1,120 @@
+"""Pages serialized by PostgreSQL match the validated ``OrganizationRead`` pages."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import config
+from src.domain.models import Activity, Building, Organization
+from src.domain.schemas import OrganizationFilter, OrganizationRead, PaginatedResponse
+from src.infrastructure.repositories import OrganizationRepository
+from tests.conftest import QueryCounter
+
+
+@pytest.fixture
+async def building(postgis_session: AsyncSession) -> Building:
+    building = Building(
+        address='г. Москва, ул. "Ленина", 1', location=Building.make_location(55.751244, 37.618423)
+    )
+    food = Activity(name="Еда", level=1)
+    postgis_session.add_all([building, food])
+    await postgis_session.flush()
+    meat = Activity(name="Мясная продукция", parent_id=food.id, level=2)
+    milk = Activity(name="Молочная продукция", parent_id=food.id, level=2)
+    postgis_session.add_all([meat, milk])
+    await postgis_session.flush()
+    postgis_session.add_all(
+        [
+            Organization(
+                name='ООО "Рога и Копыта"',
+                phone_numbers=["2-222-222", "8-923-666-13-13"],
+                building_id=building.id,
+                activities=[meat, milk, food],
+            ),
+            Organization(
+                name="Back\\slash\ttab",
+                phone_numbers=["3-333-333"],
+                building_id=building.id,
+                activities=[milk],
+            ),
+            Organization(name="Без видов", phone_numbers=[], building_id=building.id),
+        ]
+    )
+    await postgis_session.flush()
+    postgis_session.expunge_all()
+    return building
+
+
+def _sorted(item: OrganizationRead) -> OrganizationRead:
+    """The ORM loads activities in no particular order; the database sorts them by id."""
+    activities = sorted(item.activities, key=lambda activity: activity.id)
+    return item.model_copy(update={"activities": activities})
+
+
+async def test_documents_match_organization_read(
+    postgis_session: AsyncSession, building: Building
+) -> None:
+    repo = OrganizationRepository(postgis_session)
+
+    orgs, total = await repo.find_by_building_id(building.id)
+    rendered, rendered_total = await repo.render_by_building_id(building.id)
+
+    assert rendered_total == total == 3
+    assert [(row.name, row.id) for row in rendered] == [(org.name, org.id) for org in orgs]
+    for org, row in zip(orgs, rendered, strict=True):
+        expected = _sorted(OrganizationRead.model_validate(org))
+        assert OrganizationRead.model_validate_json(row.document) == expected
+
+
+async def test_documents_are_written_like_the_encoder(
+    postgis_session: AsyncSession, building: Building
+) -> None:
+    # json_build_object alone would write timestamps in this zone, as +03:00.
+    await postgis_session.execute(text("SET LOCAL TimeZone = 'Europe/Moscow'"))
+    repo = OrganizationRepository(postgis_session)
+
+    orgs, _ = await repo.find_by_building_id(building.id)
+    rendered, _ = await repo.render_by_building_id(building.id)
+
+    for org, row in zip(orgs, rendered, strict=True):
+        expected = _sorted(OrganizationRead.model_validate(org)).model_dump_json()
+        assert json.loads(row.document) == json.loads(expected)
+
+
+async def test_matching_pages_match(postgis_session: AsyncSession, building: Building) -> None:
+    repo = OrganizationRepository(postgis_session, window_count=True)
+    filters = OrganizationFilter(
+        building_id=building.id,
+        circle={"latitude": 55.75, "longitude": 37.62, "radius_km": 1},
+    )
+
+    orgs, total = await repo.find_matching(filters, limit=2)
+    rendered, rendered_total = await repo.render_matching(filters, limit=2)
+
+    assert rendered_total == total == 3
+    assert [OrganizationRead.model_validate_json(row.document) for row in rendered] == [
+        _sorted(OrganizationRead.model_validate(org)) for org in orgs
+    ]
+
+
+async def test_api_response_matches(
+    db_client: AsyncClient, building: Building, query_counter: QueryCounter
+) -> None:
+    url = f"/api/v1/organizations/by-building/{building.id}"
+    validated = await db_client.get(url, params={"size": 2})
+    query_counter.reset()
+
+    with patch.object(config.pagination, "render_in_database", True):
+        rendered = await db_client.get(url, params={"size": 2})
+
+    assert rendered.status_code == 200
+    page = PaginatedResponse[OrganizationRead].model_validate_json(rendered.content)
+    expected = PaginatedResponse[OrganizationRead].model_validate_json(validated.content)
+    assert page == expected.model_copy(update={"items": [_sorted(i) for i in expected.items]})
+    # The building check, the page and the count; no ORM object is loaded.
+    assert len(query_counter.statements) == 3, query_counter.statements
+    assert not query_counter.loaded
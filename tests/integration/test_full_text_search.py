@@ -0,0 +1,82 @@
+"""Full-text search documents kept current by triggers, and their ranking."""
+
+import pytest
+from sqlalchemy import text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models import Activity, Building, Organization
+from src.infrastructure.repositories import OrganizationRepository
+
+
+@pytest.fixture
+async def session(postgis_session: AsyncSession) -> AsyncSession:
+    tverskaya = Building(address="ул. Тверская, 7", location=Building.make_location(55.76, 37.61))
+    arbat = Building(address="ул. Арбат, 12", location=Building.make_location(55.75, 37.59))
+    dairy = Activity(name="Молочная продукция", level=1)
+    meat = Activity(name="Мясная продукция", level=1)
+    postgis_session.add_all([tverskaya, arbat, dairy, meat])
+    await postgis_session.flush()
+    postgis_session.add_all(
+        [
+            Organization(name="Ферма", building_id=tverskaya.id, activities=[dairy]),
+            Organization(name="Молочный двор", building_id=arbat.id, activities=[meat]),
+            Organization(name="Мясной ряд", building_id=tverskaya.id, activities=[meat]),
+        ]
+    )
+    await postgis_session.flush()
+    postgis_session.expunge_all()
+    return postgis_session
+
+
+async def _names(session: AsyncSession, query: str) -> list[str]:
+    items, _ = await OrganizationRepository(session).search_text(query, limit=10)
+    return [org.name for org in items]
+
+
+async def test_matches_across_name_activity_and_address(session: AsyncSession) -> None:
+    assert await _names(session, "молочная продукция Тверская") == ["Ферма"]
+
+
+async def test_name_match_outranks_activity_match(session: AsyncSession) -> None:
+    assert await _names(session, "молочный") == ["Молочный двор", "Ферма"]
+
+
+async def test_follows_building_address_changes(session: AsyncSession) -> None:
+    await session.execute(
+        update(Building)
+        .where(Building.address == "ул. Арбат, 12")
+        .values(address="ул. Тверская, 9")
+    )
+
+    assert set(await _names(session, "Тверская")) == {"Ферма", "Молочный двор", "Мясной ряд"}
+
+
+async def test_follows_activity_renames(session: AsyncSession) -> None:
+    await session.execute(
+        update(Activity).where(Activity.name == "Мясная продукция").values(name="Колбасы")
+    )
+
+    assert set(await _names(session, "колбаса")) == {"Молочный двор", "Мясной ряд"}
+
+
+async def test_page_reads_gin_index(session: AsyncSession) -> None:
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = await session.execute(
+        text(
+            "EXPLAIN SELECT id FROM organizations "
+            "WHERE search_document @@ websearch_to_tsquery('russian', 'молочная') "
+            "ORDER BY ts_rank(search_document, websearch_to_tsquery('russian', 'молочная')) DESC "
+            "LIMIT 20"
+        )
+    )
+
+    assert "ix_organizations_search_document" in "\n".join(plan.scalars())
+
+
+async def test_suggest_names_match_word_starts(session: AsyncSession) -> None:
+    rows = await OrganizationRepository(session).suggest_names("ПРОД", 10)
+
+    assert [(kind.value, name) for kind, _, name in rows] == [
+        ("activity", "Молочная продукция"),
+        ("activity", "Мясная продукция"),
+    ]
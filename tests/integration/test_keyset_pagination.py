@@ -0,0 +1,63 @@
+"""Cursor pages walk the same rows as page numbers, in the same order."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models import Activity, Building, Organization
+from src.infrastructure.repositories import OrganizationRepository
+
+
+@pytest.fixture
+async def activity(postgis_session: AsyncSession) -> Activity:
+    activity = Activity(name="keyset", level=1)
+    building = Building(address="keyset", location=Building.make_location(55.75, 37.61))
+    postgis_session.add_all([activity, building])
+    await postgis_session.flush()
+    # Repeated names make the id tie-breaker matter.
+    for i in range(53):
+        postgis_session.add(
+            Organization(name=f"keyset {i % 7}", building_id=building.id, activities=[activity])
+        )
+    await postgis_session.flush()
+    return activity
+
+
+@pytest.fixture
+def repo(postgis_session: AsyncSession, activity: Activity) -> OrganizationRepository:
+    return OrganizationRepository(postgis_session)
+
+
+async def test_name_cursor_matches_offset_pages(repo: OrganizationRepository) -> None:
+    by_offset, total = await repo.search_by_name("keyset", limit=100)
+
+    walked: list[Organization] = []
+    after = None
+    while True:
+        page, _ = await repo.search_by_name("keyset", limit=10, after=after)
+        walked.extend(page)
+        if len(page) < 10:
+            break
+        after = (page[-1].name, page[-1].id)
+
+    assert total == 53
+    assert [org.id for org in walked] == [org.id for org in by_offset]
+    assert [(org.name, org.id) for org in walked] == sorted((o.name, o.id) for o in walked)
+
+
+async def test_id_cursor_matches_offset_pages(
+    repo: OrganizationRepository, activity: Activity
+) -> None:
+    activity_id = activity.id
+    by_offset, _ = await repo.find_by_activity_ids([activity_id], limit=100)
+
+    walked: list[Organization] = []
+    after = None
+    while True:
+        page, _ = await repo.find_by_activity_ids([activity_id], limit=10, after=after)
+        walked.extend(page)
+        if len(page) < 10:
+            break
+        after = page[-1].id
+
+    assert [org.id for org in walked] == [org.id for org in by_offset]
+    assert [org.id for org in walked] == sorted(org.id for org in walked)
@@ -0,0 +1,53 @@
+"""Relevance-ranked name search against the trigram index."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models import Building, Organization
+from src.domain.schemas import NameOrder
+from src.infrastructure.repositories import OrganizationRepository
+
+
+@pytest.fixture
+async def session(postgis_session: AsyncSession) -> AsyncSession:
+    building = Building(address="trigram", location=Building.make_location(55.75, 37.61))
+    postgis_session.add(building)
+    await postgis_session.flush()
+    for name in ["Pharmacy Zdorovye", "Pharmacy Plus", "Farmacia", "Bakery", "Hardware"]:
+        postgis_session.add(Organization(name=name, building_id=building.id))
+    await postgis_session.flush()
+    await postgis_session.execute(text("SET LOCAL pg_trgm.word_similarity_threshold = 0.5"))
+    return postgis_session
+
+
+async def test_ranks_matches_and_tolerates_typos(session: AsyncSession) -> None:
+    repo = OrganizationRepository(session)
+
+    items, total = await repo.search_by_name("Pharmasy", order=NameOrder.RELEVANCE, limit=10)
+
+    names = [org.name for org in items]
+    assert total == len(names)
+    assert set(names) >= {"Pharmacy Zdorovye", "Pharmacy Plus"}
+    assert "Bakery" not in names
+    assert "Hardware" not in names
+
+
+async def test_exact_word_ranks_first(session: AsyncSession) -> None:
+    repo = OrganizationRepository(session)
+
+    items, _ = await repo.search_by_name("Bakery", order=NameOrder.RELEVANCE, limit=1)
+
+    assert [org.name for org in items] == ["Bakery"]
+
+
+async def test_ranked_page_reads_trigram_index(session: AsyncSession) -> None:
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = await session.execute(
+        text(
+            "EXPLAIN SELECT id FROM organizations WHERE 'Pharmasy' <% name "
+            "ORDER BY 'Pharmasy' <<-> name LIMIT 20"
+        )
+    )
+
+    assert "ix_organizations_name_trgm" in "\n".join(plan.scalars())
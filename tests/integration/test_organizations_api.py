@@ -1,3 +1,4 @@
+import json
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import UUID
@@ -5,6 +6,8 @@ from uuid import UUID
 from httpx import AsyncClient
 
 from src.api.dependencies.auth import verify_api_key
+from src.core.config import config
+from src.domain.schemas import RenderedOrganization
 
 ORG_UUID = UUID("11111111-1111-1111-1111-111111111111")
 BUILDING_UUID = UUID("22222222-2222-2222-2222-222222222222")
@@ -38,12 +41,6 @@ def _mock_org(id: UUID = ORG_UUID, name: str = "Test Org") -> MagicMock:
     return org
 
 
-def _mock_building(id: UUID = BUILDING_UUID) -> MagicMock:
-    b = MagicMock()
-    b.id = id
-    return b
-
-
 class TestGetOrganization:
     async def test_get_by_id(self, auth_client: AsyncClient) -> None:
         with (
@@ -89,7 +86,7 @@ class TestGetByBuilding:
             bldg_repo = AsyncMock()
             bldg_cls.return_value = bldg_repo
 
-            bldg_repo.get_by_id.return_value = _mock_building()
+            bldg_repo.exists.return_value = True
             org_repo.find_by_building_id.return_value = ([_mock_org()], 1)
 
             response = await auth_client.get(f"/api/v1/organizations/by-building/{BUILDING_UUID}")
@@ -106,12 +103,39 @@ class TestGetByBuilding:
         ):
             bldg_repo = AsyncMock()
             bldg_cls.return_value = bldg_repo
-            bldg_repo.get_by_id.return_value = None
+            bldg_repo.exists.return_value = False
 
             response = await auth_client.get(f"/api/v1/organizations/by-building/{BUILDING_UUID}")
 
         assert response.status_code == 404
 
+    async def test_rendered_in_database(self, auth_client: AsyncClient) -> None:
+        document = json.dumps({"id": str(ORG_UUID), "name": "Test Org"})
+        with (
+            patch("src.api.dependencies.services.OrganizationRepository") as org_cls,
+            patch("src.api.dependencies.services.BuildingRepository") as bldg_cls,
+            patch("src.api.dependencies.services.ActivityRepository"),
+            patch.object(config.pagination, "render_in_database", True),
+        ):
+            org_repo = AsyncMock()
+            org_cls.return_value = org_repo
+            bldg_repo = AsyncMock()
+            bldg_cls.return_value = bldg_repo
+
+            bldg_repo.exists.return_value = True
+            org_repo.render_by_building_id.return_value = (
+                [RenderedOrganization("Test Org", ORG_UUID, document)],
+                1,
+            )
+
+            response = await auth_client.get(f"/api/v1/organizations/by-building/{BUILDING_UUID}")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.content.startswith(b'{"items":[' + document.encode() + b"],")
+        assert response.json()["total"] == 1
+        org_repo.find_by_building_id.assert_not_called()
+
 
 class TestGetByActivity:
     async def test_returns_orgs(self, auth_client: AsyncClient) -> None:
@@ -125,7 +149,7 @@ class TestGetByActivity:
             act_repo = AsyncMock()
             act_cls.return_value = act_repo
 
-            act_repo.get_by_id.return_value = MagicMock()
+            act_repo.exists.return_value = True
             org_repo.find_by_activity_ids.return_value = ([_mock_org()], 1)
 
             response = await auth_client.get(f"/api/v1/organizations/by-activity/{ACTIVITY_UUID}")
@@ -134,6 +158,26 @@ class TestGetByActivity:
         data = response.json()
         assert data["total"] == 1
 
+    async def test_ignores_render_in_database(self, auth_client: AsyncClient) -> None:
+        with (
+            patch("src.api.dependencies.services.OrganizationRepository") as org_cls,
+            patch("src.api.dependencies.services.BuildingRepository"),
+            patch("src.api.dependencies.services.ActivityRepository") as act_cls,
+            patch.object(config.pagination, "render_in_database", True),
+        ):
+            org_repo = AsyncMock()
+            org_cls.return_value = org_repo
+            act_repo = AsyncMock()
+            act_cls.return_value = act_repo
+
+            act_repo.exists.return_value = True
+            org_repo.find_by_activity_ids.return_value = ([_mock_org()], 1)
+
+            response = await auth_client.get(f"/api/v1/organizations/by-activity/{ACTIVITY_UUID}")
+
+        assert response.status_code == 200
+        assert response.json()["items"][0]["building"]["address"] == "Test Address"
+
     async def test_activity_not_found(self, auth_client: AsyncClient) -> None:
         with (
             patch("src.api.dependencies.services.OrganizationRepository"),
@@ -142,13 +186,101 @@ class TestGetByActivity:
         ):
             act_repo = AsyncMock()
             act_cls.return_value = act_repo
-            act_repo.get_by_id.return_value = None
+            act_repo.exists.return_value = False
 
             response = await auth_client.get(f"/api/v1/organizations/by-activity/{ACTIVITY_UUID}")
 
         assert response.status_code == 404
 
 
+class TestSearchByPhone:
+    async def test_suffix_search(self, auth_client: AsyncClient) -> None:
+        with (
+            patch("src.api.dependencies.services.OrganizationRepository") as org_cls,
+            patch("src.api.dependencies.services.BuildingRepository"),
+            patch("src.api.dependencies.services.ActivityRepository"),
+        ):
+            repo = AsyncMock()
+            org_cls.return_value = repo
+            repo.find_by_phone.return_value = ([_mock_org()], 1)
+
+            response = await auth_client.get(
+                "/api/v1/organizations/search/by-phone",
+                params={"phone": "666-13-13", "match": "suffix"},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+        assert repo.find_by_phone.call_args.args == ("6661313",)
+        assert repo.find_by_phone.call_args.kwargs["match"] == "suffix"
+
+    async def test_short_suffix(self, auth_client: AsyncClient) -> None:
+        with (
+            patch("src.api.dependencies.services.OrganizationRepository"),
+            patch("src.api.dependencies.services.BuildingRepository"),
+            patch("src.api.dependencies.services.ActivityRepository"),
+        ):
+            response = await auth_client.get(
+                "/api/v1/organizations/search/by-phone",
+                params={"phone": "13", "match": "suffix"},
+            )
+
+        assert response.status_code == 400
+
+
+class TestSuggest:
+    async def test_suggests_from_database_without_index(self, auth_client: AsyncClient) -> None:
+        with patch("src.api.dependencies.services.OrganizationRepository") as org_cls:
+            repo = AsyncMock()
+            org_cls.return_value = repo
+            repo.suggest_names.return_value = [("activity", ACTIVITY_UUID, "Молочная продукция")]
+
+            response = await auth_client.get(
+                "/api/v1/organizations/suggest", params={"prefix": "мол", "limit": 5}
+            )
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"kind": "activity", "id": str(ACTIVITY_UUID), "name": "Молочная продукция"}
+        ]
+        repo.suggest_names.assert_called_once_with("мол", 5)
+
+    async def test_limit_is_capped(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.get(
+            "/api/v1/organizations/suggest", params={"prefix": "мол", "limit": 21}
+        )
+
+        assert response.status_code == 422
+
+
+class TestFullTextSearch:
+    async def test_search(self, auth_client: AsyncClient) -> None:
+        with (
+            patch("src.api.dependencies.services.OrganizationRepository") as org_cls,
+            patch("src.api.dependencies.services.BuildingRepository"),
+            patch("src.api.dependencies.services.ActivityRepository"),
+        ):
+            repo = AsyncMock()
+            org_cls.return_value = repo
+            repo.search_text.return_value = ([_mock_org()], 1)
+
+            response = await auth_client.get(
+                "/api/v1/organizations/search",
+                params={"q": "молочная продукция Тверская", "size": 5},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["next_cursor"] is None
+        assert repo.search_text.call_args.args == ("молочная продукция Тверская",)
+        assert repo.search_text.call_args.kwargs["limit"] == 5
+
+    async def test_search_requires_query(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.get("/api/v1/organizations/search")
+        assert response.status_code == 422
+
+
 class TestSearchByName:
     async def test_search_by_name(self, auth_client: AsyncClient) -> None:
         with (
@@ -173,6 +305,19 @@ class TestSearchByName:
         response = await auth_client.get("/api/v1/organizations/search/by-name")
         assert response.status_code == 422
 
+    async def test_relevance_order_rejects_cursor(self, auth_client: AsyncClient) -> None:
+        with (
+            patch("src.api.dependencies.services.OrganizationRepository"),
+            patch("src.api.dependencies.services.BuildingRepository"),
+            patch("src.api.dependencies.services.ActivityRepository"),
+        ):
+            response = await auth_client.get(
+                "/api/v1/organizations/search/by-name",
+                params={"name": "Test", "order": "relevance", "cursor": "abc"},
+            )
+
+        assert response.status_code == 400
+
 
 class TestSearchByActivityTree:
     async def test_search_with_subtree(self, auth_client: AsyncClient) -> None:
@@ -186,12 +331,8 @@ class TestSearchByActivityTree:
             act_repo = AsyncMock()
             act_cls.return_value = act_repo
 
-            act_repo.get_by_id.return_value = MagicMock()
-            act_repo.get_subtree_ids.return_value = [
-                ACTIVITY_UUID,
-                UUID("44444444-4444-4444-4444-444444444444"),
-            ]
-            org_repo.find_by_activity_ids.return_value = ([_mock_org()], 1)
+            act_repo.exists.return_value = True
+            org_repo.find_by_activity_subtree.return_value = ([_mock_org()], 1)
 
             response = await auth_client.get(
                 f"/api/v1/organizations/search/by-activity-tree/{ACTIVITY_UUID}"
@@ -206,16 +347,12 @@ class TestSearchInRadius:
     async def test_finds_orgs_in_radius(self, auth_client: AsyncClient) -> None:
         with (
             patch("src.api.dependencies.services.OrganizationRepository") as org_cls,
-            patch("src.api.dependencies.services.BuildingRepository") as bldg_cls,
+            patch("src.api.dependencies.services.BuildingRepository"),
             patch("src.api.dependencies.services.ActivityRepository"),
         ):
             org_repo = AsyncMock()
             org_cls.return_value = org_repo
-            bldg_repo = AsyncMock()
-            bldg_cls.return_value = bldg_repo
-
-            bldg_repo.find_in_radius.return_value = [_mock_building()]
-            org_repo.find_by_building_ids.return_value = ([_mock_org()], 1)
+            org_repo.find_in_radius.return_value = ([(_mock_org(), 42.0)], 1)
 
             response = await auth_client.get(
                 "/api/v1/organizations/search/in-radius",
@@ -225,16 +362,25 @@ class TestSearchInRadius:
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 1
+        assert data["items"][0]["distance_m"] == 42.0
+
+    async def test_rejects_unknown_order(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.get(
+            "/api/v1/organizations/search/in-radius",
+            params={"latitude": 0, "longitude": 0, "radius_km": 1, "order": "name"},
+        )
+
+        assert response.status_code == 422
 
     async def test_empty_when_no_buildings(self, auth_client: AsyncClient) -> None:
         with (
-            patch("src.api.dependencies.services.OrganizationRepository"),
-            patch("src.api.dependencies.services.BuildingRepository") as bldg_cls,
+            patch("src.api.dependencies.services.OrganizationRepository") as org_cls,
+            patch("src.api.dependencies.services.BuildingRepository"),
             patch("src.api.dependencies.services.ActivityRepository"),
         ):
-            bldg_repo = AsyncMock()
-            bldg_cls.return_value = bldg_repo
-            bldg_repo.find_in_radius.return_value = []
+            org_repo = AsyncMock()
+            org_cls.return_value = org_repo
+            org_repo.find_in_radius.return_value = ([], 0)
 
             response = await auth_client.get(
                 "/api/v1/organizations/search/in-radius",
@@ -246,20 +392,46 @@ class TestSearchInRadius:
         assert data["total"] == 0
 
 
+class TestSearchNearest:
+    async def test_returns_nearest_orgs(self, auth_client: AsyncClient) -> None:
+        with (
+            patch("src.api.dependencies.services.OrganizationRepository") as org_cls,
+            patch("src.api.dependencies.services.BuildingRepository"),
+            patch("src.api.dependencies.services.ActivityRepository"),
+        ):
+            org_repo = AsyncMock()
+            org_cls.return_value = org_repo
+            org_repo.find_nearest.return_value = [(_mock_org(), 15.5)]
+
+            response = await auth_client.get(
+                "/api/v1/organizations/search/nearest",
+                params={"latitude": 55.75, "longitude": 37.61, "limit": 5},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["distance_m"] == 15.5
+
+    async def test_limit_is_capped(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.get(
+            "/api/v1/organizations/search/nearest",
+            params={"latitude": 55.75, "longitude": 37.61, "limit": 1000},
+        )
+
+        assert response.status_code == 422
+
+
 class TestSearchInRect:
     async def test_finds_orgs_in_rect(self, auth_client: AsyncClient) -> None:
         with (
             patch("src.api.dependencies.services.OrganizationRepository") as org_cls,
-            patch("src.api.dependencies.services.BuildingRepository") as bldg_cls,
+            patch("src.api.dependencies.services.BuildingRepository"),
             patch("src.api.dependencies.services.ActivityRepository"),
         ):
             org_repo = AsyncMock()
             org_cls.return_value = org_repo
-            bldg_repo = AsyncMock()
-            bldg_cls.return_value = bldg_repo
-
-            bldg_repo.find_in_rect.return_value = [_mock_building()]
-            org_repo.find_by_building_ids.return_value = ([_mock_org()], 1)
+            org_repo.find_in_rect.return_value = ([_mock_org()], 1)
 
             response = await auth_client.get(
                 "/api/v1/organizations/search/in-rect",
@@ -276,6 +448,268 @@ class TestSearchInRect:
         assert data["total"] == 1
 
 
+class TestSearchInPolygon:
+    POLYGON = {
+        "type": "Polygon",
+        "coordinates": [[[37.0, 55.0], [38.0, 55.0], [38.0, 56.0], [37.0, 56.0], [37.0, 55.0]]],
+    }
+
+    async def test_finds_orgs_in_polygon(self, auth_client: AsyncClient) -> None:
+        with (
+            patch("src.api.dependencies.services.OrganizationRepository") as org_cls,
+            patch("src.api.dependencies.services.BuildingRepository"),
+            patch("src.api.dependencies.services.ActivityRepository"),
+        ):
+            org_repo = AsyncMock()
+            org_cls.return_value = org_repo
+            org_repo.find_in_polygon.return_value = ([_mock_org()], 1)
+
+            response = await auth_client.post(
+                "/api/v1/organizations/search/in-polygon",
+                json=self.POLYGON,
+                params={"page": 1, "size": 10},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        org_repo.find_in_polygon.assert_called_once()
+
+    async def test_invalid_polygon(self, auth_client: AsyncClient) -> None:
+        bowtie = [[0.0, 0.0], [1.0, 1.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]
+
+        response = await auth_client.post(
+            "/api/v1/organizations/search/in-polygon",
+            json={"type": "Polygon", "coordinates": [bowtie]},
+        )
+
+        assert response.status_code == 422
+
+    async def test_unsupported_geometry_type(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.post(
+            "/api/v1/organizations/search/in-polygon",
+            json={"type": "Point", "coordinates": [37.0, 55.0]},
+        )
+
+        assert response.status_code == 422
+
+
+class TestSearchQuery:
+    async def test_passes_combined_filter(self, auth_client: AsyncClient) -> None:
+        with (
+            patch("src.api.dependencies.services.OrganizationRepository") as org_cls,
+            patch("src.api.dependencies.services.BuildingRepository"),
+            patch("src.api.dependencies.services.ActivityRepository"),
+        ):
+            repo = AsyncMock()
+            org_cls.return_value = repo
+            repo.find_matching.return_value = ([_mock_org()], 1)
+
+            response = await auth_client.post(
+                "/api/v1/organizations/search/query",
+                params={"size": 5},
+                json={
+                    "name": "Test",
+                    "activity_id": str(ACTIVITY_UUID),
+                    "include_child_activities": True,
+                    "rect": {
+                        "min_latitude": 55.0,
+                        "max_latitude": 56.0,
+                        "min_longitude": 37.0,
+                        "max_longitude": 38.0,
+                    },
+                },
+            )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+        filters = repo.find_matching.call_args.args[0]
+        assert filters.name == "Test"
+        assert filters.activity_id == ACTIVITY_UUID
+        assert filters.include_child_activities is True
+        assert filters.rect.max_longitude == 38.0
+        assert repo.find_matching.call_args.kwargs["limit"] == 5
+
+    async def test_rejects_invalid_circle(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.post(
+            "/api/v1/organizations/search/query",
+            json={"circle": {"latitude": 95, "longitude": 37.61, "radius_km": 2}},
+        )
+
+        assert response.status_code == 422
+
+
+class TestSearchBatch:
+    async def test_runs_circles_and_rects(self, auth_client: AsyncClient) -> None:
+        with (
+            patch("src.api.dependencies.services.OrganizationRepository") as org_cls,
+            patch("src.api.dependencies.services.BuildingRepository"),
+            patch("src.api.dependencies.services.ActivityRepository"),
+        ):
+            org_repo = AsyncMock()
+            org_cls.return_value = org_repo
+            org_repo.find_in_batch.return_value = [([_mock_org()], 1), ([], 0)]
+
+            response = await auth_client.post(
+                "/api/v1/organizations/search/batch",
+                json={
+                    "queries": [
+                        {"latitude": 55.75, "longitude": 37.61, "radius_km": 1},
+                        {
+                            "min_latitude": 55.0,
+                            "max_latitude": 56.0,
+                            "min_longitude": 37.0,
+                            "max_longitude": 38.0,
+                        },
+                    ],
+                    "limit": 5,
+                },
+            )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["total"] for r in results] == [1, 0]
+        params = org_repo.find_in_batch.call_args.args[0]
+        assert type(params.queries[0]).__name__ == "GeoCircleParams"
+        assert type(params.queries[1]).__name__ == "GeoRectParams"
+        assert params.limit == 5
+
+    async def test_empty_batch(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.post(
+            "/api/v1/organizations/search/batch", json={"queries": []}
+        )
+
+        assert response.status_code == 422
+
+    async def test_too_many_items(self, auth_client: AsyncClient) -> None:
+        circle = {"latitude": 55.75, "longitude": 37.61, "radius_km": 1}
+        response = await auth_client.post(
+            "/api/v1/organizations/search/batch",
+            json={"queries": [circle] * 1000, "limit": 6},
+        )
+
+        assert response.status_code == 422
+
+
+class TestGetBatch:
+    async def test_returns_results_in_request_order(self, auth_client: AsyncClient) -> None:
+        other = UUID("99999999-9999-9999-9999-999999999999")
+        with (
+            patch("src.api.dependencies.services.OrganizationRepository") as org_cls,
+            patch("src.api.dependencies.services.BuildingRepository"),
+            patch("src.api.dependencies.services.ActivityRepository"),
+        ):
+            org_repo = AsyncMock()
+            org_cls.return_value = org_repo
+            org_repo.get_many_full.return_value = [_mock_org()]
+
+            response = await auth_client.post(
+                "/api/v1/organizations/batch", json={"ids": [str(other), str(ORG_UUID)]}
+            )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert results[0] == {"id": str(other), "found": False, "item": None}
+        assert results[1]["found"] is True
+        assert results[1]["item"]["name"] == "Test Org"
+
+    async def test_too_many_ids(self, auth_client: AsyncClient) -> None:
+        ids = [str(UUID(int=i)) for i in range(501)]
+
+        response = await auth_client.post("/api/v1/organizations/batch", json={"ids": ids})
+
+        assert response.status_code == 422
+
+
+class TestClusters:
+    RECT = {
+        "min_latitude": 55.0,
+        "max_latitude": 56.0,
+        "min_longitude": 37.0,
+        "max_longitude": 38.0,
+    }
+
+    async def test_returns_clusters(self, auth_client: AsyncClient) -> None:
+        with (
+            patch("src.api.dependencies.services.OrganizationRepository") as org_cls,
+            patch("src.api.dependencies.services.BuildingRepository"),
+            patch("src.api.dependencies.services.ActivityRepository"),
+        ):
+            org_repo = AsyncMock()
+            org_cls.return_value = org_repo
+            org_repo.cluster_in_rect.return_value = [(55.75, 37.61, 12)]
+
+            response = await auth_client.get(
+                "/api/v1/organizations/clusters", params={**self.RECT, "zoom": 9}
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 12
+        assert data["clusters"] == [{"latitude": 55.75, "longitude": 37.61, "count": 12}]
+
+    async def test_requires_zoom_or_cell_size(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.get("/api/v1/organizations/clusters", params=self.RECT)
+
+        assert response.status_code == 422
+
+    async def test_too_many_cells(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.get(
+            "/api/v1/organizations/clusters", params={**self.RECT, "cell_size": 0.001}
+        )
+
+        assert response.status_code == 400
+
+
+class TestExport:
+    async def test_streams_ndjson(self, auth_client: AsyncClient) -> None:
+        async def batches(*_args: object, **_kwargs: object):  # noqa: ANN202
+            yield [_mock_org()]
+            yield [_mock_org(id=UUID(int=5), name="Second")]
+
+        with patch("src.api.dependencies.services.OrganizationRepository") as mock_repo_cls:
+            repo = MagicMock()
+            mock_repo_cls.return_value = repo
+            repo.stream_batches.side_effect = batches
+
+            response = await auth_client.post("/api/v1/organizations/export", json={"name": "Org"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["name"] for line in lines] == ["Test Org", "Second"]
+        filters = repo.stream_batches.call_args.args[0]
+        assert filters.name == "Org"
+
+    async def test_streams_csv(self, auth_client: AsyncClient) -> None:
+        async def batches(*_args: object, **_kwargs: object):  # noqa: ANN202
+            yield [_mock_org()]
+
+        with patch("src.api.dependencies.services.OrganizationRepository") as mock_repo_cls:
+            repo = MagicMock()
+            mock_repo_cls.return_value = repo
+            repo.stream_batches.side_effect = batches
+
+            response = await auth_client.post(
+                "/api/v1/organizations/export", params={"format": "csv"}, json={}
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="organizations.csv"' in response.headers["content-disposition"]
+        header, row = response.text.splitlines()
+        assert header.startswith("id,name,phone_numbers")
+        assert row.startswith(f"{ORG_UUID},Test Org,1-111-111")
+
+    async def test_rejects_invalid_filter(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.post(
+            "/api/v1/organizations/export",
+            json={"circle": {"latitude": 100, "longitude": 0, "radius_km": 1}},
+        )
+
+        assert response.status_code == 422
+
+
 class TestAuthentication:
     async def test_missing_api_key(self, app, client: AsyncClient) -> None:
         """Test that requests without API key are rejected."""
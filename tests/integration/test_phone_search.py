@@ -0,0 +1,74 @@
+"""Phone lookups against the trigger-maintained phone table."""
+
+import pytest
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models import Building, Organization, organization_phone
+from src.domain.schemas import PhoneMatch
+from src.domain.schemas.search import phone_digits
+from src.infrastructure.repositories import OrganizationRepository
+
+
+@pytest.fixture
+async def session(postgis_session: AsyncSession) -> AsyncSession:
+    building = Building(address="phones", location=Building.make_location(55.75, 37.61))
+    postgis_session.add(building)
+    await postgis_session.flush()
+    postgis_session.add_all(
+        [
+            Organization(name="Мясо", phone_numbers=["8-923-666-13-13"], building_id=building.id),
+            Organization(
+                name="Молоко",
+                phone_numbers=["+7 (923) 666-13-13", "2-222-222"],
+                building_id=building.id,
+            ),
+            Organization(name="Хлеб", phone_numbers=["3-333-333"], building_id=building.id),
+        ]
+    )
+    await postgis_session.flush()
+    postgis_session.expunge_all()
+    return postgis_session
+
+
+async def _names(session: AsyncSession, phone: str, match: PhoneMatch) -> set[str]:
+    repo = OrganizationRepository(session)
+    items, total = await repo.find_by_phone(phone_digits(phone), match=match)
+    assert total == len(items)
+    return {org.name for org in items}
+
+
+async def test_exact_match(session: AsyncSession) -> None:
+    assert await _names(session, "89236661313", PhoneMatch.EXACT) == {"Мясо", "Молоко"}
+    assert await _names(session, "2222222", PhoneMatch.EXACT) == {"Молоко"}
+    assert await _names(session, "222222", PhoneMatch.EXACT) == set()
+
+
+async def test_suffix_match_ignores_country_prefix(session: AsyncSession) -> None:
+    assert await _names(session, "9236661313", PhoneMatch.SUFFIX) == {"Мясо", "Молоко"}
+
+
+async def test_trunk_prefix_matches_country_code(session: AsyncSession) -> None:
+    assert await _names(session, "+7 (923) 666-13-13", PhoneMatch.EXACT) == {"Мясо", "Молоко"}
+    assert await _names(session, "+7 (923) 666-13-13", PhoneMatch.SUFFIX) == {"Мясо", "Молоко"}
+    assert await _names(session, "8 923 666 13 13", PhoneMatch.EXACT) == {"Мясо", "Молоко"}
+
+
+async def test_follows_phone_changes(session: AsyncSession) -> None:
+    await session.execute(
+        update(Organization).where(Organization.name == "Хлеб").values(phone_numbers=["4-444-444"])
+    )
+
+    assert await _names(session, "3333333", PhoneMatch.EXACT) == set()
+    assert await _names(session, "4444444", PhoneMatch.EXACT) == {"Хлеб"}
+
+
+async def test_deleted_organization_leaves_no_phones(session: AsyncSession) -> None:
+    await session.execute(text("DELETE FROM organizations WHERE name = 'Хлеб'"))
+
+    rows = await session.execute(
+        select(organization_phone.c.reversed_digits).where(
+            organization_phone.c.reversed_digits == "3333333"
+        )
+    )
+    assert rows.all() == []
@@ -0,0 +1,119 @@
+"""Statements and ORM objects each endpoint costs against a real database."""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models import Activity, Building, Organization
+from tests.conftest import QueryCounter
+
+
+@dataclass
+class Seeded:
+    building_id: UUID
+    root_activity_id: UUID
+    child_activity_id: UUID
+    organization_id: UUID
+
+
+@pytest.fixture
+async def seeded(postgis_session: AsyncSession) -> Seeded:
+    building = Building(address="counts", location=Building.make_location(55.75, 37.61))
+    other = Building(address="counts 2", location=Building.make_location(55.76, 37.62))
+    root = Activity(name="Root", level=1)
+    postgis_session.add_all([building, other, root])
+    await postgis_session.flush()
+    child = Activity(name="Child", parent_id=root.id, level=2)
+    postgis_session.add(child)
+    await postgis_session.flush()
+
+    organizations = [
+        Organization(name=f"Org {i}", building_id=building.id, activities=[root, child])
+        for i in range(3)
+    ]
+    organizations.append(Organization(name="Elsewhere", building_id=other.id, activities=[child]))
+    postgis_session.add_all(organizations)
+    await postgis_session.flush()
+
+    seeded = Seeded(building.id, root.id, child.id, organizations[0].id)
+    # Start every request from an empty identity map, as a fresh session would.
+    postgis_session.expunge_all()
+    return seeded
+
+
+@pytest.mark.parametrize(
+    ("path", "statements", "loaded"),
+    [
+        (
+            "/api/v1/organizations/{organization_id}",
+            2,
+            {"Organization": 1, "Building": 1, "Activity": 2},
+        ),
+        (
+            "/api/v1/organizations/by-building/{building_id}",
+            4,
+            {"Organization": 3, "Building": 1, "Activity": 2},
+        ),
+        (
+            "/api/v1/organizations/by-activity/{child_activity_id}",
+            4,
+            {"Organization": 4, "Building": 2, "Activity": 2},
+        ),
+        (
+            "/api/v1/organizations/search/by-activity-tree/{root_activity_id}",
+            4,
+            {"Organization": 4, "Building": 2, "Activity": 2},
+        ),
+        ("/api/v1/buildings/?size=2", 2, {"Building": 2}),
+    ],
+)
+async def test_endpoint_cost(
+    db_client: AsyncClient,
+    seeded: Seeded,
+    query_counter: QueryCounter,
+    path: str,
+    statements: int,
+    loaded: dict[str, int],
+) -> None:
+    query_counter.reset()
+
+    response = await db_client.get(path.format(**vars(seeded)))
+
+    assert response.status_code == 200
+    assert len(query_counter.statements) == statements, query_counter.statements
+    assert dict(query_counter.loaded) == loaded
+
+
+async def test_batch_costs_two_statements(
+    db_client: AsyncClient, seeded: Seeded, query_counter: QueryCounter
+) -> None:
+    missing = UUID("99999999-9999-9999-9999-999999999999")
+    query_counter.reset()
+
+    response = await db_client.post(
+        "/api/v1/organizations/batch",
+        json={"ids": [str(missing), str(seeded.organization_id)]},
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["found"] for r in results] == [False, True]
+    assert results[1]["item"]["id"] == str(seeded.organization_id)
+    assert len(query_counter.statements) == 2, query_counter.statements
+
+
+async def test_batch_sizes_share_one_statement(
+    db_client: AsyncClient, seeded: Seeded, query_counter: QueryCounter
+) -> None:
+    statements = []
+    for count in (1, 3):
+        ids = [str(UUID(int=i)) for i in range(1, count)] + [str(seeded.organization_id)]
+        query_counter.reset()
+        await db_client.post("/api/v1/organizations/batch", json={"ids": ids})
+        statements.append(query_counter.statements[0])
+
+    # One array parameter, so asyncpg prepares the statement once for every batch size.
+    assert statements[0] == statements[1]
@@ -0,0 +1,100 @@
+"""Parity of the in-memory spatial index with the PostGIS queries it replaces."""
+
+import random
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models import Building
+from src.domain.schemas.geo import GeoCircleParams, GeoRectParams
+from src.infrastructure.cache.spatial import MAX_DISTANCE_ERROR, BuildingSpatialIndex
+from src.infrastructure.repositories import BuildingRepository
+from src.infrastructure.repositories.geo import distance_to
+
+
+@pytest.fixture
+async def loaded(postgis_session: AsyncSession) -> tuple[BuildingRepository, BuildingSpatialIndex]:
+    rng = random.Random(42)
+    for i in range(2_000):
+        if i % 2:
+            latitude, longitude = rng.uniform(55.0, 56.5), rng.uniform(36.5, 38.5)
+        else:
+            latitude, longitude = rng.uniform(-25.0, -10.0), rng.uniform(-180.0, 180.0)
+        postgis_session.add(
+            Building(address=f"parity {i}", location=Building.make_location(latitude, longitude))
+        )
+    await postgis_session.flush()
+
+    repo = BuildingRepository(postgis_session)
+    index = BuildingSpatialIndex()
+    index.load(await repo.get_coordinates())
+    return repo, index
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=5),
+        GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=60),
+        GeoCircleParams(latitude=-17.7, longitude=179.5, radius_km=400),
+    ],
+)
+async def test_radius_parity(
+    postgis_session: AsyncSession,
+    loaded: tuple[BuildingRepository, BuildingSpatialIndex],
+    params: GeoCircleParams,
+) -> None:
+    repo, index = loaded
+    in_memory = index.find_in_radius(params)
+    postgis = {b.id for b in await repo.find_in_radius(params)}
+    ids = set(in_memory) | postgis
+    stmt = select(Building.id, distance_to(Building.location, params)).where(Building.id.in_(ids))
+    spheroid = dict((await postgis_session.execute(stmt)).tuples().all())
+
+    assert postgis
+    for id_, distance in in_memory.items():
+        assert distance == pytest.approx(spheroid[id_], rel=MAX_DISTANCE_ERROR)
+    # Only buildings within the error bound of the boundary may disagree.
+    for id_ in set(in_memory) ^ postgis:
+        assert spheroid[id_] == pytest.approx(params.radius_meters, rel=MAX_DISTANCE_ERROR)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        GeoRectParams(min_latitude=55.5, max_latitude=56.0, min_longitude=37.0, max_longitude=38.0),
+        GeoRectParams(
+            min_latitude=-20.0, max_latitude=-15.0, min_longitude=178.0, max_longitude=-178.0
+        ),
+        GeoRectParams(
+            min_latitude=-20.0, max_latitude=-12.0, min_longitude=-170.0, max_longitude=170.0
+        ),
+    ],
+)
+async def test_rect_parity(
+    loaded: tuple[BuildingRepository, BuildingSpatialIndex], params: GeoRectParams
+) -> None:
+    repo, index = loaded
+    in_memory = set(index.find_in_rect(params))
+    postgis = {b.id for b in await repo.find_in_rect(params)}
+
+    # Both compare plain lon/lat boxes, so they agree up to the edges.
+    assert postgis
+    assert in_memory == postgis
+
+
+async def test_rect_edges_follow_parallels(postgis_session: AsyncSession) -> None:
+    # A geography envelope's top edge would bulge up to about 63.7° at longitude 45.
+    above = Building(address="above", location=Building.make_location(60.0, 45.0))
+    inside = Building(address="inside", location=Building.make_location(54.9, 45.0))
+    postgis_session.add_all([above, inside])
+    await postgis_session.flush()
+    params = GeoRectParams(
+        min_latitude=50.0, max_latitude=55.0, min_longitude=0.0, max_longitude=90.0
+    )
+
+    found = {b.id for b in await BuildingRepository(postgis_session).find_in_rect(params)}
+
+    assert inside.id in found
+    assert above.id not in found
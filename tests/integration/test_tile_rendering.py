@@ -0,0 +1,50 @@
+"""Vector tiles against PostGIS, down to the world and hemisphere tiles."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models import Building
+from src.infrastructure.repositories import BuildingRepository
+
+# (latitude, longitude) on each side of the prime meridian and the equator.
+CITIES = {
+    "moscow": (55.7558, 37.6173),
+    "new_york": (40.7128, -74.0060),
+    "sydney": (-33.8688, 151.2093),
+    "rio": (-22.9068, -43.1729),
+}
+
+
+@pytest.fixture
+async def buildings(postgis_session: AsyncSession) -> dict[str, bytes]:
+    added = {
+        name: Building(address=name, location=Building.make_location(*point))
+        for name, point in CITIES.items()
+    }
+    postgis_session.add_all(added.values())
+    await postgis_session.flush()
+    # Tiles carry the building id as a string property.
+    return {name: str(building.id).encode() for name, building in added.items()}
+
+
+async def _tile_members(
+    session: AsyncSession, buildings: dict[str, bytes], z: int, x: int, y: int
+) -> set[str]:
+    tile = await BuildingRepository(session).get_tile(z, x, y)
+    return {name for name, building_id in buildings.items() if building_id in tile}
+
+
+async def test_world_tile_has_both_sides_of_the_meridian(
+    postgis_session: AsyncSession, buildings: dict[str, bytes]
+) -> None:
+    assert await _tile_members(postgis_session, buildings, 0, 0, 0) == set(CITIES)
+
+
+@pytest.mark.parametrize(
+    ("x", "y", "expected"),
+    [(0, 0, "new_york"), (1, 0, "moscow"), (0, 1, "rio"), (1, 1, "sydney")],
+)
+async def test_hemisphere_tiles(
+    postgis_session: AsyncSession, buildings: dict[str, bytes], x: int, y: int, expected: str
+) -> None:
+    assert await _tile_members(postgis_session, buildings, 1, x, y) == {expected}
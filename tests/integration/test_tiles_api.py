@@ -0,0 +1,30 @@
+from unittest.mock import AsyncMock, patch
+
+from httpx import AsyncClient
+
+from src.infrastructure.cache import tile_cache
+
+
+class TestGetTile:
+    async def test_returns_vector_tile(self, auth_client: AsyncClient) -> None:
+        tile_cache.clear()
+        with patch("src.api.dependencies.services.BuildingRepository") as repo_cls:
+            repo = AsyncMock()
+            repo_cls.return_value = repo
+            repo.get_tile.return_value = b"\x1a\x02mvt"
+
+            response = await auth_client.get("/api/v1/tiles/12/2476/1280.mvt")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.mapbox-vector-tile"
+        assert response.content == b"\x1a\x02mvt"
+
+    async def test_tile_outside_grid(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.get("/api/v1/tiles/1/5/0.mvt")
+
+        assert response.status_code == 400
+
+    async def test_zoom_out_of_range(self, auth_client: AsyncClient) -> None:
+        response = await auth_client.get("/api/v1/tiles/30/0/0.mvt")
+
+        assert response.status_code == 422
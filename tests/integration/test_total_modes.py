@@ -0,0 +1,43 @@
+"""Estimated totals come from the planner without counting rows."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models import Building, Organization
+from src.domain.schemas import TotalMode
+from src.infrastructure.repositories import BuildingRepository, OrganizationRepository
+
+
+@pytest.fixture
+async def session(postgis_session: AsyncSession) -> AsyncSession:
+    building = Building(address="totals", location=Building.make_location(55.75, 37.61))
+    postgis_session.add(building)
+    await postgis_session.flush()
+    for i in range(30):
+        postgis_session.add(Organization(name=f"totals {i}", building_id=building.id))
+    await postgis_session.flush()
+    return postgis_session
+
+
+async def test_estimate_returns_planner_rows(session: AsyncSession) -> None:
+    repo = OrganizationRepository(session)
+
+    items, total = await repo.search_by_name("totals", limit=10, total_mode=TotalMode.ESTIMATE)
+
+    assert len(items) == 10
+    assert isinstance(total, int)
+    assert total >= 0
+
+
+async def test_table_estimate(session: AsyncSession) -> None:
+    total = await BuildingRepository(session).count_total(total_mode=TotalMode.ESTIMATE)
+
+    assert isinstance(total, int)
+
+
+async def test_none_skips_count(session: AsyncSession) -> None:
+    repo = OrganizationRepository(session)
+
+    _, total = await repo.search_by_name("totals", limit=10, total_mode=TotalMode.NONE)
+
+    assert total is None
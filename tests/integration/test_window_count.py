@@ -0,0 +1,79 @@
+"""``count(*) OVER ()`` totals match separate counts in one statement fewer."""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models import Activity, Building, Organization
+from src.domain.schemas import GeoCircleParams, GeoOrder
+from src.infrastructure.repositories import BuildingRepository, OrganizationRepository
+from tests.conftest import QueryCounter
+
+Search = Callable[[OrganizationRepository, int], Awaitable[tuple[Any, int | None]]]
+
+
+@pytest.fixture
+async def activity(postgis_session: AsyncSession) -> Activity:
+    activity = Activity(name="window", level=1)
+    building = Building(address="window", location=Building.make_location(55.75, 37.61))
+    postgis_session.add_all([activity, building])
+    await postgis_session.flush()
+    for i in range(25):
+        postgis_session.add(
+            Organization(name=f"window {i}", building_id=building.id, activities=[activity])
+        )
+    await postgis_session.flush()
+    return activity
+
+
+def _searches(activity: Activity) -> dict[str, Search]:
+    circle = GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=1)
+    return {
+        "name": lambda repo, offset: repo.search_by_name("window", offset=offset, limit=10),
+        "activity": lambda repo, offset: repo.find_by_activity_ids(
+            [activity.id], offset=offset, limit=10
+        ),
+        "tree": lambda repo, offset: repo.find_by_activity_subtree(
+            activity.id, offset=offset, limit=10
+        ),
+        "radius": lambda repo, offset: repo.find_in_radius(
+            circle, order=GeoOrder.DISTANCE, offset=offset, limit=10
+        ),
+    }
+
+
+@pytest.mark.parametrize("search", ["name", "activity", "tree", "radius"])
+@pytest.mark.parametrize("offset", [0, 20, 40])
+async def test_window_total_matches_separate_count(
+    postgis_session: AsyncSession,
+    activity: Activity,
+    query_counter: QueryCounter,
+    search: str,
+    offset: int,
+) -> None:
+    run = _searches(activity)[search]
+
+    query_counter.reset()
+    separate_items, separate_total = await run(OrganizationRepository(postgis_session), offset)
+    separate_statements = len(query_counter.statements)
+
+    query_counter.reset()
+    window_repo = OrganizationRepository(postgis_session, window_count=True)
+    window_items, window_total = await run(window_repo, offset)
+    window_statements = len(query_counter.statements)
+
+    assert window_total == separate_total == 25
+    assert window_items == separate_items
+    # Past the last page no row carries the window total, so it is counted apart.
+    assert window_statements == separate_statements - (1 if offset < 25 else 0)
+
+
+async def test_building_page_total(postgis_session: AsyncSession, activity: Activity) -> None:
+    repo = BuildingRepository(postgis_session, window_count=True)
+
+    items, total = await repo.get_page(limit=5)
+
+    assert total == await BuildingRepository(postgis_session).count()
+    assert len(items) == min(5, total)
@@ -0,0 +1,34 @@
+from uuid import UUID
+
+import pytest
+
+from src.infrastructure.cache.activities import ActivityTreeCache
+
+ROOT = UUID("11111111-1111-1111-1111-111111111111")
+CHILD = UUID("22222222-2222-2222-2222-222222222222")
+
+
+class TestActivityTreeCache:
+    def test_not_ready_until_loaded(self) -> None:
+        cache = ActivityTreeCache()
+
+        assert not cache.is_ready
+        with pytest.raises(RuntimeError):
+            cache.get_path(ROOT)
+
+    def test_get_path(self) -> None:
+        cache = ActivityTreeCache()
+        cache.load([(ROOT, f"{ROOT.hex}."), (CHILD, f"{ROOT.hex}.{CHILD.hex}.")])
+
+        assert cache.is_ready
+        assert len(cache) == 2
+        assert cache.get_path(CHILD) == f"{ROOT.hex}.{CHILD.hex}."
+        assert cache.get_path(UUID(int=0)) is None
+
+    def test_load_replaces_previous_rows(self) -> None:
+        cache = ActivityTreeCache()
+        cache.load([(ROOT, "a.")])
+        cache.load([(CHILD, "b.")])
+
+        assert cache.get_path(ROOT) is None
+        assert cache.get_path(CHILD) == "b."
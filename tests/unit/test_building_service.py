@@ -5,6 +5,7 @@ from uuid import UUID
 import pytest
 
 from src.domain.models.building import Building
+from src.domain.schemas.pagination import TotalMode
 from src.services.building import BuildingService
 
 BUILDING_UUID_1 = UUID("11111111-1111-1111-1111-111111111111")
@@ -39,8 +40,7 @@ class TestGetAll:
         self, service: BuildingService, repo: AsyncMock
     ) -> None:
         buildings = [_make_building(id=BUILDING_UUID_1), _make_building(id=BUILDING_UUID_2)]
-        repo.get_all.return_value = buildings
-        repo.count.return_value = 2
+        repo.get_page.return_value = (buildings, 2)
 
         result = await service.get_all(page=1, size=20)
 
@@ -53,9 +53,35 @@ class TestGetAll:
     async def test_pagination_offset_calculated(
         self, service: BuildingService, repo: AsyncMock
     ) -> None:
-        repo.get_all.return_value = []
-        repo.count.return_value = 0
+        repo.get_page.return_value = ([], 0)
 
         await service.get_all(page=3, size=10)
 
-        repo.get_all.assert_called_once_with(offset=20, limit=10)
+        repo.get_page.assert_called_once_with(
+            offset=20, limit=10, after=None, total_mode=TotalMode.EXACT
+        )
+
+    async def test_cursor_resumes_after_last_id(
+        self, service: BuildingService, repo: AsyncMock
+    ) -> None:
+        repo.get_page.return_value = ([_make_building(id=BUILDING_UUID_1)], 2)
+
+        first = await service.get_all(page=1, size=1)
+        assert first.next_cursor is not None
+
+        await service.get_all(page=5, size=1, cursor=first.next_cursor)
+
+        repo.get_page.assert_called_with(
+            offset=0, limit=1, after=BUILDING_UUID_1, total_mode=TotalMode.EXACT
+        )
+
+    async def test_total_none_skips_count(self, service: BuildingService, repo: AsyncMock) -> None:
+        repo.get_page.return_value = ([_make_building()], None)
+
+        result = await service.get_all(size=5, total_mode=TotalMode.NONE)
+
+        repo.get_page.assert_called_once_with(
+            offset=0, limit=6, after=None, total_mode=TotalMode.NONE
+        )
+        assert result.total is None
+        assert result.has_next is False
@@ -17,6 +17,21 @@ class TestConfig:
         assert cfg.app.debug is False
         assert cfg.security.api_key == "secret-api-key"
         assert cfg.activity.max_depth == 3
+        assert cfg.activity.cache_enabled is False
+        assert cfg.spatial_index.enabled is False
+        assert cfg.spatial_index.refresh_interval == 300
+        assert cfg.tiles.cache_size == 2048
+        assert cfg.tiles.cache_ttl == 600
+        assert cfg.tiles.check_interval == 5
+        assert cfg.search_cache.enabled is False
+        assert cfg.search_cache.precision == 4
+        assert cfg.pagination.window_count is False
+        assert cfg.pagination.render_in_database is False
+        assert cfg.count_cache.enabled is False
+        assert cfg.count_cache.ttl == 300
+        assert cfg.export.batch_size == 1000
+        assert cfg.name_search.similarity == 0.5
+        assert cfg.suggest.enabled is False
 
     def test_database_url_property(self) -> None:
         env = {
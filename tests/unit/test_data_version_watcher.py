@@ -0,0 +1,74 @@
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.infrastructure.cache.versions import DataVersionWatcher
+
+
+@pytest.fixture
+def repo() -> Iterator[AsyncMock]:
+    with (
+        patch("src.infrastructure.cache.versions.async_session_factory", MagicMock()),
+        patch("src.infrastructure.cache.versions.DataVersionRepository") as repo_cls,
+    ):
+        repo = AsyncMock()
+        repo.get_transaction_horizon.return_value = (1, 1)
+        repo_cls.return_value = repo
+        yield repo
+
+
+async def test_calls_on_change_when_a_version_moves(repo: AsyncMock) -> None:
+    on_change = AsyncMock()
+    watcher = DataVersionWatcher(["buildings", "organizations"], on_change)
+    repo.get_versions.side_effect = [
+        {"buildings": 3, "organizations": 1},
+        {"buildings": 3, "organizations": 1},
+        {"buildings": 3, "organizations": 2},
+    ]
+
+    await watcher.check()
+    on_change.assert_awaited_once()
+
+    await watcher.check()
+    on_change.assert_awaited_once()
+
+    await watcher.check()
+    assert on_change.await_count == 2
+    repo.get_versions.assert_called_with(["buildings", "organizations"])
+
+
+async def test_failed_on_change_is_retried(repo: AsyncMock) -> None:
+    on_change = AsyncMock(side_effect=[RuntimeError("db down"), None])
+    watcher = DataVersionWatcher(["activities"], on_change)
+    repo.get_versions.return_value = {"activities": 1}
+
+    with pytest.raises(RuntimeError):
+        await watcher.check()
+    await watcher.check()
+    await watcher.check()
+
+    assert on_change.await_count == 2
+
+
+async def test_reloads_again_once_writers_have_finished(repo: AsyncMock) -> None:
+    on_change = AsyncMock()
+    watcher = DataVersionWatcher(["buildings"], on_change)
+    repo.get_versions.side_effect = [{"buildings": 1}, {"buildings": 2}, {"buildings": 2}]
+    await watcher.check()
+
+    # The write that bumped the sequence may not have committed yet.
+    repo.get_transaction_horizon.return_value = (10, 12)
+    await watcher.check()
+    assert on_change.await_count == 2
+
+    repo.get_transaction_horizon.return_value = (11, 13)
+    repo.get_versions.side_effect = None
+    repo.get_versions.return_value = {"buildings": 2}
+    await watcher.check()
+    assert on_change.await_count == 2
+
+    repo.get_transaction_horizon.return_value = (12, 14)
+    await watcher.check()
+    await watcher.check()
+    assert on_change.await_count == 3
@@ -0,0 +1,123 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+from uuid import UUID
+
+from src.domain.models.organization import Organization
+from src.domain.schemas.filter import ExportFormat, OrganizationFilter
+from src.services.export import CSV_COLUMNS, OrganizationExportService
+
+BUILDING_UUID = UUID("22222222-2222-2222-2222-222222222222")
+
+
+def _make_org(index: int) -> MagicMock:
+    org = MagicMock(spec=Organization)
+    org.id = UUID(int=index)
+    org.name = f"Org {index}"
+    org.phone_numbers = ["1-111-111", "2-222-222"]
+    org.building_id = BUILDING_UUID
+    org.created_at = datetime(2025, 1, 1, tzinfo=UTC)
+
+    building = MagicMock()
+    building.id = BUILDING_UUID
+    building.address = "Test Address"
+    building.latitude = 55.75
+    building.longitude = 37.61
+    building.created_at = datetime(2025, 1, 1, tzinfo=UTC)
+    org.building = building
+
+    act = MagicMock()
+    act.id = UUID(int=1000)
+    act.name = "Activity"
+    act.parent_id = None
+    act.level = 1
+    act.created_at = datetime(2025, 1, 1, tzinfo=UTC)
+    org.activities = [act]
+    return org
+
+
+class FakeRepository:
+    def __init__(self, batches: list[list[MagicMock]]) -> None:
+        self.batches = batches
+        self.batch_size: int | None = None
+        self.stream_closed = False
+
+    async def stream_batches(
+        self, filters: OrganizationFilter, *, batch_size: int = 1000
+    ) -> AsyncIterator[list[MagicMock]]:
+        self.batch_size = batch_size
+        try:
+            for batch in self.batches:
+                yield batch
+        finally:
+            self.stream_closed = True
+
+
+def _service(
+    repository: FakeRepository, batch_size: int = 2
+) -> tuple[OrganizationExportService, list[bool]]:
+    closed: list[bool] = []
+
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[FakeRepository]:
+        try:
+            yield repository
+        finally:
+            closed.append(True)
+
+    return OrganizationExportService(factory, batch_size=batch_size), closed
+
+
+class TestExport:
+    async def test_ndjson_one_chunk_per_batch(self) -> None:
+        repo = FakeRepository([[_make_org(1), _make_org(2)], [_make_org(3)]])
+        service, closed = _service(repo)
+
+        chunks = [
+            chunk async for chunk in service.export(OrganizationFilter(), ExportFormat.NDJSON)
+        ]
+
+        assert len(chunks) == 2
+        lines = "".join(chunks).splitlines()
+        assert [json.loads(line)["name"] for line in lines] == ["Org 1", "Org 2", "Org 3"]
+        assert repo.batch_size == 2
+        assert closed == [True]
+
+    async def test_csv_starts_with_header(self) -> None:
+        repo = FakeRepository([[_make_org(1)]])
+        service, _ = _service(repo)
+
+        body = "".join(
+            [chunk async for chunk in service.export(OrganizationFilter(), ExportFormat.CSV)]
+        )
+
+        rows = list(csv.reader(io.StringIO(body)))
+        assert rows[0] == CSV_COLUMNS
+        assert rows[1][1] == "Org 1"
+        assert rows[1][2] == "1-111-111; 2-222-222"
+        assert rows[1][7] == "Activity"
+
+    async def test_empty_result_yields_nothing(self) -> None:
+        service, closed = _service(FakeRepository([]))
+
+        chunks = [
+            chunk async for chunk in service.export(OrganizationFilter(), ExportFormat.NDJSON)
+        ]
+
+        assert chunks == []
+        assert closed == [True]
+
+    async def test_early_close_releases_repository(self) -> None:
+        repo = FakeRepository([[_make_org(1)], [_make_org(2)], [_make_org(3)]])
+        service, closed = _service(repo)
+
+        stream = service.export(OrganizationFilter(), ExportFormat.NDJSON)
+        await anext(stream)
+        await stream.aclose()
+
+        assert repo.stream_closed is True
+        assert closed == [True]
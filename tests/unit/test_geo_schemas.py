@@ -0,0 +1,136 @@
+import pytest
+from pydantic import ValidationError
+
+from src.domain.schemas.cluster import GeoClusterParams
+from src.domain.schemas.geo import (
+    MAX_ENVELOPE_SPAN,
+    MAX_POLYGON_VERTICES,
+    GeoCircleParams,
+    GeoPolygonParams,
+    GeoRectParams,
+)
+
+
+def _rect(min_longitude: float, max_longitude: float) -> GeoRectParams:
+    return GeoRectParams(
+        min_latitude=-10.0,
+        max_latitude=10.0,
+        min_longitude=min_longitude,
+        max_longitude=max_longitude,
+    )
+
+
+def _square(lon: float, lat: float, side: float = 1.0) -> list[list[float]]:
+    return [[lon, lat], [lon + side, lat], [lon + side, lat + side], [lon, lat + side], [lon, lat]]
+
+
+class TestLongitudeRanges:
+    def test_narrow_rect_is_single_range(self) -> None:
+        assert _rect(37.0, 38.0).longitude_ranges == [(37.0, 38.0)]
+
+    def test_antimeridian_rect_is_split_at_180(self) -> None:
+        assert _rect(170.0, -170.0).longitude_ranges == [(170.0, 180.0), (-180.0, -170.0)]
+
+    @pytest.mark.parametrize(
+        ("min_longitude", "max_longitude"),
+        [(-170.0, 170.0), (-180.0, 180.0), (0.0, 179.9), (100.0, 90.0)],
+    )
+    def test_wide_rect_ranges_cover_span(self, min_longitude: float, max_longitude: float) -> None:
+        rect = _rect(min_longitude, max_longitude)
+        ranges = rect.longitude_ranges
+
+        assert all(-180.0 <= start <= end <= 180.0 for start, end in ranges)
+        assert all(end - start <= MAX_ENVELOPE_SPAN for start, end in ranges)
+        assert sum(end - start for start, end in ranges) == pytest.approx(rect.longitude_span)
+
+    def test_ranges_are_contiguous(self) -> None:
+        ranges = _rect(-180.0, 180.0).longitude_ranges
+
+        assert ranges[0][0] == -180.0
+        assert ranges[-1][1] == 180.0
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:], strict=False))
+
+
+class TestQuantized:
+    def test_circle(self) -> None:
+        params = GeoCircleParams(latitude=55.123456, longitude=-37.654321, radius_km=1.23456)
+
+        assert params.quantized(3) == GeoCircleParams(
+            latitude=55.123, longitude=-37.654, radius_km=1.235
+        )
+
+    def test_rect_keeps_bounds_ordered(self) -> None:
+        params = GeoRectParams(
+            min_latitude=10.00004,
+            max_latitude=10.00006,
+            min_longitude=179.99996,
+            max_longitude=-179.99996,
+        )
+
+        quantized = params.quantized(4)
+
+        assert quantized.min_latitude <= quantized.max_latitude
+        assert (quantized.min_longitude, quantized.max_longitude) == (180.0, -180.0)
+
+
+class TestGeoClusterParams:
+    def test_cell_size_from_zoom(self) -> None:
+        assert GeoClusterParams(zoom=0).resolved_cell_size == 90.0
+        assert GeoClusterParams(zoom=10).resolved_cell_size == pytest.approx(360 / 1024 / 4)
+
+    def test_explicit_cell_size_wins(self) -> None:
+        assert GeoClusterParams(zoom=3, cell_size=0.5).resolved_cell_size == 0.5
+
+    def test_requires_zoom_or_cell_size(self) -> None:
+        with pytest.raises(ValidationError):
+            GeoClusterParams()
+
+
+class TestGeoPolygonParams:
+    def test_polygon_wkt(self) -> None:
+        params = GeoPolygonParams(type="Polygon", coordinates=[_square(37.0, 55.0)])
+
+        assert params.wkt == "POLYGON ((37 55, 38 55, 38 56, 37 56, 37 55))"
+
+    def test_overlapping_multipolygon_parts_are_merged(self) -> None:
+        params = GeoPolygonParams(
+            type="MultiPolygon",
+            coordinates=[[_square(37.0, 55.0)], [_square(37.5, 55.0)]],
+        )
+
+        assert params.wkt.startswith("POLYGON ")
+
+    def test_simplifies_dense_rings(self) -> None:
+        steps = 5000
+        edge = [[37.0 + i / steps, 55.0] for i in range(steps)]
+        ring = [*edge, [38.0, 55.0], [38.0, 56.0], [37.0, 56.0], [37.0, 55.0]]
+
+        params = GeoPolygonParams(type="Polygon", coordinates=[ring])
+
+        assert params.wkt == "POLYGON ((37 55, 38 55, 38 56, 37 56, 37 55))"
+
+    def test_rejects_too_many_vertices_after_simplification(self) -> None:
+        parts = [[_square(i * 0.5, 0.0, 0.1)] for i in range(MAX_POLYGON_VERTICES // 5 + 1)]
+
+        with pytest.raises(ValidationError, match="after simplification"):
+            GeoPolygonParams(type="MultiPolygon", coordinates=parts)
+
+    def test_rejects_self_intersection(self) -> None:
+        bowtie = [[0.0, 0.0], [1.0, 1.0], [1.0, 0.0], [0.0, 1.0], [0.0, 0.0]]
+
+        with pytest.raises(ValidationError, match="Self-intersection"):
+            GeoPolygonParams(type="Polygon", coordinates=[bowtie])
+
+    def test_rejects_type_mismatch(self) -> None:
+        with pytest.raises(ValidationError):
+            GeoPolygonParams(type="MultiPolygon", coordinates=[_square(0.0, 0.0)])
+
+    def test_rejects_out_of_range(self) -> None:
+        with pytest.raises(ValidationError, match="out of range"):
+            GeoPolygonParams(type="Polygon", coordinates=[_square(179.5, 0.0)])
+
+    def test_rejects_hemisphere_wide_polygon(self) -> None:
+        ring = [[-90.0, 0.0], [90.0, 0.0], [90.0, 1.0], [-90.0, 1.0], [-90.0, 0.0]]
+
+        with pytest.raises(ValidationError, match="antimeridian"):
+            GeoPolygonParams(type="Polygon", coordinates=[ring])
@@ -0,0 +1,66 @@
+from src.infrastructure.cache.lru import CacheStats, LRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    def test_get_returns_stored_value(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(maxsize=2)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_entries_expire_after_ttl(self) -> None:
+        clock = FakeClock()
+        cache: LRUCache[str, int] = LRUCache(maxsize=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_zero_size_disables_cache(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(maxsize=0)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+
+    def test_clear(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_stats_count_hits_misses_and_evictions(self) -> None:
+        clock = FakeClock()
+        cache: LRUCache[str, int] = LRUCache(maxsize=1, ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+        cache.set("b", 2)
+        clock.now = 10.0
+        cache.get("b")
+
+        assert cache.stats == CacheStats(size=0, hits=1, misses=2, evictions=1)
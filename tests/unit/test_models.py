@@ -0,0 +1,12 @@
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.domain.models import Building
+
+
+class TestBuildingCoordinates:
+    def test_coordinates_are_selected_as_columns(self) -> None:
+        sql = str(select(Building).compile(dialect=postgresql.dialect()))
+
+        assert "ST_Y(CAST(buildings.location AS geometry" in sql
+        assert "ST_X(CAST(buildings.location AS geometry" in sql
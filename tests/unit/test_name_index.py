@@ -0,0 +1,63 @@
+from uuid import UUID
+
+import pytest
+
+from src.domain.schemas.suggest import SuggestionKind
+from src.infrastructure.cache.names import NamePrefixIndex
+
+HORNS = UUID("11111111-1111-1111-1111-111111111111")
+ROSES = UUID("22222222-2222-2222-2222-222222222222")
+DAIRY = UUID("33333333-3333-3333-3333-333333333333")
+MEAT = UUID("44444444-4444-4444-4444-444444444444")
+
+
+@pytest.fixture
+def index() -> NamePrefixIndex:
+    index = NamePrefixIndex()
+    index.load(
+        [
+            (SuggestionKind.ORGANIZATION, HORNS, 'ООО "Рога и Копыта"'),
+            (SuggestionKind.ORGANIZATION, ROSES, "Розы России"),
+            (SuggestionKind.ACTIVITY, DAIRY, "Молочная продукция"),
+            (SuggestionKind.ACTIVITY, MEAT, "Мясная продукция"),
+        ]
+    )
+    return index
+
+
+class TestSuggest:
+    def test_matches_name_start_ignoring_case(self, index: NamePrefixIndex) -> None:
+        result = index.suggest("мол", 10)
+
+        assert [(s.kind, s.id, s.name) for s in result] == [
+            (SuggestionKind.ACTIVITY, DAIRY, "Молочная продукция")
+        ]
+
+    def test_matches_later_words(self, index: NamePrefixIndex) -> None:
+        assert [s.id for s in index.suggest("КОП", 10)] == [HORNS]
+        assert [s.id for s in index.suggest("рог", 10)] == [HORNS]
+
+    def test_ordered_by_matching_word(self, index: NamePrefixIndex) -> None:
+        assert [s.id for s in index.suggest("ро", 10)] == [HORNS, ROSES]
+
+    def test_name_listed_once(self, index: NamePrefixIndex) -> None:
+        assert [s.id for s in index.suggest("р", 10)] == [HORNS, ROSES]
+
+    def test_respects_limit(self, index: NamePrefixIndex) -> None:
+        assert [s.id for s in index.suggest("продукция", 1)] == [DAIRY]
+
+    def test_no_match(self, index: NamePrefixIndex) -> None:
+        assert index.suggest("хлеб", 10) == []
+
+    def test_reload_replaces_names(self, index: NamePrefixIndex) -> None:
+        index.load([(SuggestionKind.ACTIVITY, MEAT, "Колбасы")])
+
+        assert index.suggest("мяс", 10) == []
+        assert [s.id for s in index.suggest("колб", 10)] == [MEAT]
+
+    def test_not_loaded(self) -> None:
+        index = NamePrefixIndex()
+
+        assert not index.is_ready
+        with pytest.raises(RuntimeError):
+            index.suggest("а", 10)
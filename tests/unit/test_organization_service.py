@@ -1,12 +1,27 @@
+import json
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
 import pytest
 
-from src.domain.exceptions import NotFoundError
+from src.domain.exceptions import DomainError, NotFoundError
 from src.domain.models.organization import Organization
-from src.domain.schemas.geo import GeoCircleParams, GeoRectParams
+from src.domain.schemas.batch import GeoBatchParams
+from src.domain.schemas.cluster import GeoClusterParams
+from src.domain.schemas.filter import OrganizationFilter
+from src.domain.schemas.geo import (
+    GeoCircleParams,
+    GeoOrder,
+    GeoPointParams,
+    GeoPolygonParams,
+    GeoRectParams,
+)
+from src.domain.schemas.organization import OrganizationRead, RenderedOrganization
+from src.domain.schemas.pagination import TotalMode
+from src.domain.schemas.search import NameOrder, PhoneMatch
+from src.infrastructure.cache.activities import ActivityTreeCache
+from src.infrastructure.cache.lru import LRUCache
 from src.services.organization import OrganizationService
 
 ORG_UUID = UUID("11111111-1111-1111-1111-111111111111")
@@ -43,12 +58,6 @@ def _make_org(id: UUID = ORG_UUID, name: str = "Test Org") -> MagicMock:
     return org
 
 
-def _make_building(id: UUID = BUILDING_UUID) -> MagicMock:
-    b = MagicMock()
-    b.id = id
-    return b
-
-
 @pytest.fixture
 def org_repo() -> AsyncMock:
     return AsyncMock()
@@ -97,6 +106,23 @@ class TestGetById:
             await service.get_by_id(ORG_UUID)
 
 
+class TestGetMany:
+    async def test_keeps_request_order_and_marks_missing(
+        self, service: OrganizationService, org_repo: AsyncMock
+    ) -> None:
+        other = UUID("99999999-9999-9999-9999-999999999999")
+        org_repo.get_many_full.return_value = [_make_org()]
+
+        result = await service.get_many([other, ORG_UUID, ORG_UUID])
+
+        org_repo.get_many_full.assert_called_once_with([other, ORG_UUID])
+        assert [r.id for r in result.results] == [other, ORG_UUID, ORG_UUID]
+        assert [r.found for r in result.results] == [False, True, True]
+        assert result.results[0].item is None
+        assert result.results[1].item is not None
+        assert result.results[1].item.name == "Test Org"
+
+
 class TestGetByBuilding:
     async def test_returns_orgs_in_building(
         self,
@@ -104,7 +130,7 @@ class TestGetByBuilding:
         org_repo: AsyncMock,
         building_repo: AsyncMock,
     ) -> None:
-        building_repo.get_by_id.return_value = _make_building()
+        building_repo.exists.return_value = True
         org_repo.find_by_building_id.return_value = ([_make_org()], 1)
 
         result = await service.get_by_building(BUILDING_UUID, page=1, size=20)
@@ -117,7 +143,7 @@ class TestGetByBuilding:
         service: OrganizationService,
         building_repo: AsyncMock,
     ) -> None:
-        building_repo.get_by_id.return_value = None
+        building_repo.exists.return_value = False
 
         with pytest.raises(NotFoundError):
             await service.get_by_building(BUILDING_UUID)
@@ -130,7 +156,7 @@ class TestGetByActivity:
         org_repo: AsyncMock,
         activity_repo: AsyncMock,
     ) -> None:
-        activity_repo.get_by_id.return_value = MagicMock()
+        activity_repo.exists.return_value = True
         org_repo.find_by_activity_ids.return_value = ([_make_org()], 1)
 
         result = await service.get_by_activity(ACTIVITY_UUID, page=1, size=20)
@@ -142,7 +168,7 @@ class TestGetByActivity:
         service: OrganizationService,
         activity_repo: AsyncMock,
     ) -> None:
-        activity_repo.get_by_id.return_value = None
+        activity_repo.exists.return_value = False
 
         with pytest.raises(NotFoundError):
             await service.get_by_activity(ACTIVITY_UUID)
@@ -155,20 +181,86 @@ class TestSearchByActivityTree:
         org_repo: AsyncMock,
         activity_repo: AsyncMock,
     ) -> None:
-        activity_repo.get_by_id.return_value = MagicMock()
-        activity_repo.get_subtree_ids.return_value = [
-            ACTIVITY_UUID,
-            ACTIVITY_UUID_2,
-            ACTIVITY_UUID_3,
-        ]
-        org_repo.find_by_activity_ids.return_value = ([_make_org()], 1)
+        activity_repo.exists.return_value = True
+        org_repo.find_by_activity_subtree.return_value = ([_make_org()], 1)
 
-        result = await service.search_by_activity_tree(ACTIVITY_UUID)
+        result = await service.search_by_activity_tree(ACTIVITY_UUID, page=2, size=10)
 
-        activity_repo.get_subtree_ids.assert_called_once_with(ACTIVITY_UUID)
+        org_repo.find_by_activity_subtree.assert_called_once_with(
+            ACTIVITY_UUID, offset=10, limit=10, after=None, total_mode=TotalMode.EXACT
+        )
         assert result.total == 1
 
 
+class TestActivityTreeCache:
+    @pytest.fixture
+    def tree_service(
+        self,
+        org_repo: AsyncMock,
+        building_repo: AsyncMock,
+        activity_repo: AsyncMock,
+    ) -> OrganizationService:
+        tree = ActivityTreeCache()
+        tree.load([(ACTIVITY_UUID, "aa."), (ACTIVITY_UUID_2, "aa.bb.")])
+        return OrganizationService(
+            organization_repo=org_repo,
+            building_repo=building_repo,
+            activity_repo=activity_repo,
+            activity_tree=tree,
+        )
+
+    async def test_tree_search_resolves_activity_in_memory(
+        self,
+        tree_service: OrganizationService,
+        org_repo: AsyncMock,
+        activity_repo: AsyncMock,
+    ) -> None:
+        org_repo.find_by_activity_subtree.return_value = ([_make_org()], 1)
+
+        await tree_service.search_by_activity_tree(ACTIVITY_UUID_2)
+
+        activity_repo.exists.assert_not_called()
+        org_repo.find_by_activity_subtree.assert_called_once_with(
+            ACTIVITY_UUID_2, offset=0, limit=20, after=None, total_mode=TotalMode.EXACT
+        )
+
+    async def test_get_by_activity_checks_existence_in_memory(
+        self,
+        tree_service: OrganizationService,
+        org_repo: AsyncMock,
+        activity_repo: AsyncMock,
+    ) -> None:
+        org_repo.find_by_activity_ids.return_value = ([], 0)
+
+        await tree_service.get_by_activity(ACTIVITY_UUID)
+
+        activity_repo.exists.assert_not_called()
+
+    async def test_unknown_id_falls_back_to_database(
+        self,
+        tree_service: OrganizationService,
+        org_repo: AsyncMock,
+        activity_repo: AsyncMock,
+    ) -> None:
+        activity_repo.exists.return_value = True
+        org_repo.find_by_activity_subtree.return_value = ([], 0)
+
+        await tree_service.search_by_activity_tree(ACTIVITY_UUID_3)
+
+        activity_repo.exists.assert_called_once_with(ACTIVITY_UUID_3)
+        org_repo.find_by_activity_subtree.assert_called_once()
+
+    async def test_unknown_id_missing_from_database(
+        self,
+        tree_service: OrganizationService,
+        activity_repo: AsyncMock,
+    ) -> None:
+        activity_repo.exists.return_value = False
+
+        with pytest.raises(NotFoundError):
+            await tree_service.search_by_activity_tree(ACTIVITY_UUID_3)
+
+
 class TestSearchByName:
     async def test_searches_by_name(
         self,
@@ -179,9 +271,298 @@ class TestSearchByName:
 
         result = await service.search_by_name("Test")
 
-        org_repo.search_by_name.assert_called_once_with("Test", offset=0, limit=20)
+        org_repo.search_by_name.assert_called_once_with(
+            "Test",
+            order=NameOrder.NAME,
+            offset=0,
+            limit=20,
+            after=None,
+            total_mode=TotalMode.EXACT,
+        )
         assert result.total == 1
 
+    async def test_relevance_order_has_no_cursor(
+        self,
+        service: OrganizationService,
+        org_repo: AsyncMock,
+    ) -> None:
+        org_repo.search_by_name.return_value = ([_make_org()], 5)
+
+        result = await service.search_by_name("Tset", order=NameOrder.RELEVANCE, size=1)
+
+        assert org_repo.search_by_name.call_args.kwargs["order"] is NameOrder.RELEVANCE
+        assert result.next_cursor is None
+        assert result.pages == 5
+
+    async def test_relevance_order_rejects_cursor(self, service: OrganizationService) -> None:
+        with pytest.raises(DomainError):
+            await service.search_by_name("Test", order=NameOrder.RELEVANCE, cursor="abc")
+
+
+class TestSearchByPhone:
+    async def test_compares_digits_only(
+        self, service: OrganizationService, org_repo: AsyncMock
+    ) -> None:
+        org_repo.find_by_phone.return_value = ([_make_org()], 1)
+
+        result = await service.search_by_phone("+7 (923) 666-13-13")
+
+        org_repo.find_by_phone.assert_called_once_with(
+            "79236661313",
+            match=PhoneMatch.EXACT,
+            offset=0,
+            limit=20,
+            after=None,
+            total_mode=TotalMode.EXACT,
+        )
+        assert result.total == 1
+
+    async def test_trunk_prefix_becomes_country_code(
+        self, service: OrganizationService, org_repo: AsyncMock
+    ) -> None:
+        org_repo.find_by_phone.return_value = ([], 0)
+
+        await service.search_by_phone("8-923-666-13-13")
+
+        assert org_repo.find_by_phone.call_args.args == ("79236661313",)
+
+    async def test_suffix_needs_enough_digits(
+        self, service: OrganizationService, org_repo: AsyncMock
+    ) -> None:
+        with pytest.raises(DomainError):
+            await service.search_by_phone("1-13", match=PhoneMatch.SUFFIX)
+
+        org_repo.find_by_phone.assert_not_called()
+
+    async def test_rejects_number_without_digits(self, service: OrganizationService) -> None:
+        with pytest.raises(DomainError):
+            await service.search_by_phone("---")
+
+
+class TestSearchMatching:
+    async def test_pages_by_name_with_cursor(
+        self, service: OrganizationService, org_repo: AsyncMock
+    ) -> None:
+        org_repo.find_matching.return_value = ([_make_org()], 4)
+        filters = OrganizationFilter(name="Test", building_id=BUILDING_UUID)
+
+        first = await service.search_matching(filters, size=1)
+        await service.search_matching(filters, size=1, cursor=first.next_cursor)
+
+        org_repo.find_matching.assert_called_with(
+            filters,
+            offset=0,
+            limit=1,
+            after=("Test Org", ORG_UUID),
+            total_mode=TotalMode.EXACT,
+        )
+
+
+class TestSearch:
+    async def test_ranked_pages_have_no_cursor(
+        self, service: OrganizationService, org_repo: AsyncMock
+    ) -> None:
+        org_repo.search_text.return_value = ([_make_org()], 3)
+
+        result = await service.search("молочная продукция", page=2, size=1)
+
+        org_repo.search_text.assert_called_once_with(
+            "молочная продукция", offset=1, limit=1, total_mode=TotalMode.EXACT
+        )
+        assert result.total == 3
+        assert result.next_cursor is None
+
+
+def _rendered(org: MagicMock) -> RenderedOrganization:
+    document = OrganizationRead.model_validate(org).model_dump_json()
+    return RenderedOrganization(org.name, org.id, document)
+
+
+class TestRenderedPages:
+    async def test_matches_validated_page(
+        self,
+        service: OrganizationService,
+        org_repo: AsyncMock,
+        building_repo: AsyncMock,
+    ) -> None:
+        building_repo.exists.return_value = True
+        org_repo.find_by_building_id.return_value = ([_make_org()], 4)
+        org_repo.render_by_building_id.return_value = ([_rendered(_make_org())], 4)
+
+        validated = await service.get_by_building(BUILDING_UUID, page=2, size=1)
+        rendered = await service.render_by_building(BUILDING_UUID, page=2, size=1)
+
+        assert json.loads(rendered) == validated.model_dump(mode="json")
+        assert validated.next_cursor is not None
+
+    async def test_none_mode_reads_one_extra_row(
+        self, service: OrganizationService, org_repo: AsyncMock
+    ) -> None:
+        rows = [_rendered(_make_org(UUID(int=i), f"Org {i}")) for i in (1, 2)]
+        org_repo.render_matching.return_value = (rows, None)
+        filters = OrganizationFilter(name="Org")
+
+        data = json.loads(await service.render_matching(filters, size=1, total_mode=TotalMode.NONE))
+
+        org_repo.render_matching.assert_called_once_with(
+            filters, offset=0, limit=2, after=None, total_mode=TotalMode.NONE
+        )
+        assert [item["name"] for item in data["items"]] == ["Org 1"]
+        assert data["has_next"] is True
+        assert data["total"] is None
+
+    async def test_raises_not_found_for_building(
+        self, service: OrganizationService, building_repo: AsyncMock
+    ) -> None:
+        building_repo.exists.return_value = False
+
+        with pytest.raises(NotFoundError):
+            await service.render_by_building(BUILDING_UUID)
+
+
+class TestCursorPagination:
+    async def test_full_page_carries_next_cursor(
+        self, service: OrganizationService, org_repo: AsyncMock
+    ) -> None:
+        org_repo.search_by_name.return_value = ([_make_org()], 5)
+
+        first = await service.search_by_name("Test", size=1)
+        assert first.next_cursor is not None
+
+        await service.search_by_name("Test", page=3, size=1, cursor=first.next_cursor)
+
+        org_repo.search_by_name.assert_called_with(
+            "Test",
+            order=NameOrder.NAME,
+            offset=0,
+            limit=1,
+            after=("Test Org", ORG_UUID),
+            total_mode=TotalMode.EXACT,
+        )
+
+    async def test_short_page_has_no_next_cursor(
+        self, service: OrganizationService, org_repo: AsyncMock
+    ) -> None:
+        org_repo.search_by_name.return_value = ([_make_org()], 1)
+
+        result = await service.search_by_name("Test", size=20)
+
+        assert result.next_cursor is None
+
+    async def test_activity_pages_resume_after_id(
+        self,
+        service: OrganizationService,
+        org_repo: AsyncMock,
+        activity_repo: AsyncMock,
+    ) -> None:
+        activity_repo.exists.return_value = True
+        org_repo.find_by_activity_subtree.return_value = ([_make_org()], 5)
+
+        first = await service.search_by_activity_tree(ACTIVITY_UUID, size=1)
+        await service.search_by_activity_tree(ACTIVITY_UUID, size=1, cursor=first.next_cursor)
+
+        org_repo.find_by_activity_subtree.assert_called_with(
+            ACTIVITY_UUID, offset=0, limit=1, after=ORG_UUID, total_mode=TotalMode.EXACT
+        )
+
+    async def test_cursor_of_another_order_is_rejected(
+        self,
+        service: OrganizationService,
+        org_repo: AsyncMock,
+        activity_repo: AsyncMock,
+    ) -> None:
+        activity_repo.exists.return_value = True
+        org_repo.find_by_activity_subtree.return_value = ([_make_org()], 5)
+        by_id = await service.search_by_activity_tree(ACTIVITY_UUID, size=1)
+
+        with pytest.raises(DomainError):
+            await service.search_by_name("Test", cursor=by_id.next_cursor)
+
+    async def test_malformed_cursor_is_rejected(self, service: OrganizationService) -> None:
+        with pytest.raises(DomainError):
+            await service.search_by_name("Test", cursor="not-a-cursor")
+
+    async def test_distance_order_has_no_cursor(
+        self, service: OrganizationService, org_repo: AsyncMock
+    ) -> None:
+        org_repo.find_in_radius.return_value = ([(_make_org(), 10.0)], 5)
+        params = GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=5)
+
+        result = await service.find_in_radius(params, order=GeoOrder.DISTANCE, size=1)
+        assert result.next_cursor is None
+
+        with pytest.raises(DomainError):
+            await service.find_in_radius(params, order=GeoOrder.DISTANCE, cursor="x")
+
+
+class TestTotalModes:
+    async def test_none_reads_one_extra_row(
+        self, service: OrganizationService, org_repo: AsyncMock
+    ) -> None:
+        orgs = [_make_org(id=UUID(int=i), name=f"Org {i}") for i in range(3)]
+        org_repo.search_by_name.return_value = (orgs, None)
+
+        result = await service.search_by_name("Org", size=2, total_mode=TotalMode.NONE)
+
+        org_repo.search_by_name.assert_called_once_with(
+            "Org",
+            order=NameOrder.NAME,
+            offset=0,
+            limit=3,
+            after=None,
+            total_mode=TotalMode.NONE,
+        )
+        assert [item.name for item in result.items] == ["Org 0", "Org 1"]
+        assert result.total is None
+        assert result.pages is None
+        assert result.has_next is True
+        assert result.total_mode is TotalMode.NONE
+        assert result.next_cursor is not None
+
+    async def test_none_last_page(self, service: OrganizationService, org_repo: AsyncMock) -> None:
+        org_repo.search_by_name.return_value = ([_make_org()], None)
+
+        result = await service.search_by_name("Test", size=1, total_mode=TotalMode.NONE)
+
+        assert result.has_next is False
+        assert result.next_cursor is None
+
+    async def test_estimate_is_passed_through(
+        self, service: OrganizationService, org_repo: AsyncMock
+    ) -> None:
+        org_repo.search_by_name.return_value = ([_make_org()], 1200)
+
+        result = await service.search_by_name("Test", total_mode=TotalMode.ESTIMATE)
+
+        assert org_repo.search_by_name.call_args.kwargs["total_mode"] is TotalMode.ESTIMATE
+        assert result.total == 1200
+        assert result.total_mode is TotalMode.ESTIMATE
+        assert result.has_next is None
+
+    async def test_cached_total_skips_count(
+        self,
+        org_repo: AsyncMock,
+        building_repo: AsyncMock,
+        activity_repo: AsyncMock,
+    ) -> None:
+        counts: LRUCache = LRUCache(maxsize=16)
+        service = OrganizationService(
+            organization_repo=org_repo,
+            building_repo=building_repo,
+            activity_repo=activity_repo,
+            count_cache=counts,
+        )
+        org_repo.search_by_name.return_value = ([_make_org()], 42)
+
+        await service.search_by_name("Test", page=1)
+        second = await service.search_by_name("Test", page=2)
+
+        modes = [call.kwargs["total_mode"] for call in org_repo.search_by_name.call_args_list]
+        assert modes == [TotalMode.EXACT, TotalMode.NONE]
+        assert second.total == 42
+        assert second.total_mode is TotalMode.EXACT
+        assert counts.stats.hits == 1
+
 
 class TestFindInRadius:
     async def test_finds_in_radius(
@@ -190,21 +571,43 @@ class TestFindInRadius:
         org_repo: AsyncMock,
         building_repo: AsyncMock,
     ) -> None:
-        building = _make_building()
-        building_repo.find_in_radius.return_value = [building]
-        org_repo.find_by_building_ids.return_value = ([_make_org()], 1)
+        org_repo.find_in_radius.return_value = ([(_make_org(), 120.5)], 1)
 
         params = GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=5)
         result = await service.find_in_radius(params)
 
+        org_repo.find_in_radius.assert_called_once_with(
+            params, order=GeoOrder.NONE, offset=0, limit=20, after=None, total_mode=TotalMode.EXACT
+        )
+        building_repo.find_in_radius.assert_not_called()
         assert result.total == 1
+        assert result.items[0].distance_m == 120.5
+
+    async def test_passes_distance_order(
+        self,
+        service: OrganizationService,
+        org_repo: AsyncMock,
+    ) -> None:
+        org_repo.find_in_radius.return_value = ([], 0)
+
+        params = GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=5)
+        await service.find_in_radius(params, order=GeoOrder.DISTANCE, page=3, size=10)
+
+        org_repo.find_in_radius.assert_called_once_with(
+            params,
+            order=GeoOrder.DISTANCE,
+            offset=20,
+            limit=10,
+            after=None,
+            total_mode=TotalMode.EXACT,
+        )
 
     async def test_empty_when_no_buildings(
         self,
         service: OrganizationService,
-        building_repo: AsyncMock,
+        org_repo: AsyncMock,
     ) -> None:
-        building_repo.find_in_radius.return_value = []
+        org_repo.find_in_radius.return_value = ([], 0)
 
         params = GeoCircleParams(latitude=0, longitude=0, radius_km=1)
         result = await service.find_in_radius(params)
@@ -213,16 +616,132 @@ class TestFindInRadius:
         assert result.items == []
 
 
+class TestSpatialIndex:
+    @pytest.fixture
+    def spatial_index(self) -> MagicMock:
+        index = MagicMock()
+        index.is_ready = True
+        return index
+
+    @pytest.fixture
+    def indexed_service(
+        self,
+        org_repo: AsyncMock,
+        building_repo: AsyncMock,
+        activity_repo: AsyncMock,
+        spatial_index: MagicMock,
+    ) -> OrganizationService:
+        return OrganizationService(
+            organization_repo=org_repo,
+            building_repo=building_repo,
+            activity_repo=activity_repo,
+            spatial_index=spatial_index,
+        )
+
+    async def test_radius_answered_from_index(
+        self,
+        indexed_service: OrganizationService,
+        org_repo: AsyncMock,
+        spatial_index: MagicMock,
+    ) -> None:
+        spatial_index.find_in_radius.return_value = {BUILDING_UUID: 321.0}
+        org_repo.find_by_building_ids.return_value = ([_make_org()], 1)
+
+        params = GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=5)
+        result = await indexed_service.find_in_radius(params)
+
+        org_repo.find_by_building_ids.assert_called_once_with(
+            [BUILDING_UUID], offset=0, limit=20, after=None, total_mode=TotalMode.EXACT
+        )
+        org_repo.find_in_radius.assert_not_called()
+        assert result.items[0].distance_m == 321.0
+
+    async def test_rect_answered_from_index(
+        self,
+        indexed_service: OrganizationService,
+        org_repo: AsyncMock,
+        spatial_index: MagicMock,
+    ) -> None:
+        spatial_index.find_in_rect.return_value = [BUILDING_UUID]
+        org_repo.find_by_building_ids.return_value = ([_make_org()], 1)
+
+        params = GeoRectParams(
+            min_latitude=55.0, max_latitude=56.0, min_longitude=37.0, max_longitude=38.0
+        )
+        result = await indexed_service.find_in_rect(params)
+
+        org_repo.find_in_rect.assert_not_called()
+        assert result.total == 1
+
+    async def test_empty_index_result_skips_database(
+        self,
+        indexed_service: OrganizationService,
+        org_repo: AsyncMock,
+        spatial_index: MagicMock,
+    ) -> None:
+        spatial_index.find_in_rect.return_value = []
+
+        params = GeoRectParams(min_latitude=0, max_latitude=1, min_longitude=0, max_longitude=1)
+        result = await indexed_service.find_in_rect(params)
+
+        org_repo.find_by_building_ids.assert_not_called()
+        assert result.total == 0
+
+    async def test_distance_order_uses_database(
+        self,
+        indexed_service: OrganizationService,
+        org_repo: AsyncMock,
+        spatial_index: MagicMock,
+    ) -> None:
+        org_repo.find_in_radius.return_value = ([], 0)
+
+        params = GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=5)
+        await indexed_service.find_in_radius(params, order=GeoOrder.DISTANCE)
+
+        spatial_index.find_in_radius.assert_not_called()
+
+    async def test_falls_back_when_index_not_loaded(
+        self,
+        indexed_service: OrganizationService,
+        org_repo: AsyncMock,
+        spatial_index: MagicMock,
+    ) -> None:
+        spatial_index.is_ready = False
+        org_repo.find_in_radius.return_value = ([], 0)
+
+        params = GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=5)
+        await indexed_service.find_in_radius(params)
+
+        spatial_index.find_in_radius.assert_not_called()
+        org_repo.find_in_radius.assert_called_once()
+
+
+class TestFindNearest:
+    async def test_returns_orgs_with_distance(
+        self,
+        service: OrganizationService,
+        org_repo: AsyncMock,
+    ) -> None:
+        org_repo.find_nearest.return_value = [
+            (_make_org(id=ORG_UUID), 10.0),
+            (_make_org(id=ACTIVITY_UUID_2), 25.0),
+        ]
+
+        params = GeoPointParams(latitude=55.75, longitude=37.61)
+        result = await service.find_nearest(params, limit=2)
+
+        org_repo.find_nearest.assert_called_once_with(params, limit=2)
+        assert [item.distance_m for item in result] == [10.0, 25.0]
+        assert result[0].id == ORG_UUID
+
+
 class TestFindInRect:
     async def test_finds_in_rect(
         self,
         service: OrganizationService,
         org_repo: AsyncMock,
-        building_repo: AsyncMock,
     ) -> None:
-        building = _make_building()
-        building_repo.find_in_rect.return_value = [building]
-        org_repo.find_by_building_ids.return_value = ([_make_org()], 1)
+        org_repo.find_in_rect.return_value = ([_make_org()], 1)
 
         params = GeoRectParams(
             min_latitude=55.0,
@@ -232,14 +751,39 @@ class TestFindInRect:
         )
         result = await service.find_in_rect(params)
 
+        org_repo.find_in_rect.assert_called_once_with(
+            params, offset=0, limit=20, after=None, total_mode=TotalMode.EXACT
+        )
         assert result.total == 1
 
-    async def test_empty_when_no_buildings(
+    async def test_wide_rect_is_searched_in_database(
         self,
         service: OrganizationService,
+        org_repo: AsyncMock,
         building_repo: AsyncMock,
     ) -> None:
-        building_repo.find_in_rect.return_value = []
+        org_repo.find_in_rect.return_value = ([_make_org()], 250)
+
+        params = GeoRectParams(
+            min_latitude=-60.0,
+            max_latitude=70.0,
+            min_longitude=-170.0,
+            max_longitude=170.0,
+        )
+        result = await service.find_in_rect(params, page=2, size=20)
+
+        building_repo.get_all.assert_not_called()
+        org_repo.find_in_rect.assert_called_once_with(
+            params, offset=20, limit=20, after=None, total_mode=TotalMode.EXACT
+        )
+        assert result.total == 250
+
+    async def test_empty_when_no_buildings(
+        self,
+        service: OrganizationService,
+        org_repo: AsyncMock,
+    ) -> None:
+        org_repo.find_in_rect.return_value = ([], 0)
 
         params = GeoRectParams(
             min_latitude=0,
@@ -250,3 +794,173 @@ class TestFindInRect:
         result = await service.find_in_rect(params)
 
         assert result.total == 0
+
+
+class TestSearchCache:
+    @pytest.fixture
+    def cache(self) -> LRUCache:
+        return LRUCache(maxsize=16)
+
+    @pytest.fixture
+    def cached_service(
+        self,
+        org_repo: AsyncMock,
+        building_repo: AsyncMock,
+        activity_repo: AsyncMock,
+        cache: LRUCache,
+    ) -> OrganizationService:
+        return OrganizationService(
+            organization_repo=org_repo,
+            building_repo=building_repo,
+            activity_repo=activity_repo,
+            search_cache=cache,
+            search_cache_precision=3,
+        )
+
+    async def test_nearby_radius_searches_share_result(
+        self,
+        cached_service: OrganizationService,
+        org_repo: AsyncMock,
+        cache: LRUCache,
+    ) -> None:
+        org_repo.find_in_radius.return_value = ([(_make_org(), 120.5)], 1)
+
+        first = await cached_service.find_in_radius(
+            GeoCircleParams(latitude=55.750001, longitude=37.610004, radius_km=5)
+        )
+        second = await cached_service.find_in_radius(
+            GeoCircleParams(latitude=55.750002, longitude=37.609996, radius_km=5.0001)
+        )
+
+        assert second == first
+        org_repo.find_in_radius.assert_called_once_with(
+            GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=5),
+            order=GeoOrder.NONE,
+            offset=0,
+            limit=20,
+            after=None,
+            total_mode=TotalMode.EXACT,
+        )
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    async def test_page_is_part_of_key(
+        self,
+        cached_service: OrganizationService,
+        org_repo: AsyncMock,
+    ) -> None:
+        org_repo.find_in_radius.return_value = ([], 0)
+        params = GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=5)
+
+        await cached_service.find_in_radius(params, page=1)
+        await cached_service.find_in_radius(params, page=2)
+        await cached_service.find_in_radius(params, order=GeoOrder.DISTANCE, page=2)
+
+        assert org_repo.find_in_radius.call_count == 3
+
+    async def test_rect_search_is_cached(
+        self,
+        cached_service: OrganizationService,
+        org_repo: AsyncMock,
+    ) -> None:
+        org_repo.find_in_rect.return_value = ([_make_org()], 1)
+        params = GeoRectParams(
+            min_latitude=55.0001, max_latitude=56.0, min_longitude=37.0, max_longitude=38.0
+        )
+
+        await cached_service.find_in_rect(params)
+        result = await cached_service.find_in_rect(params)
+
+        org_repo.find_in_rect.assert_called_once()
+        assert result.total == 1
+
+    async def test_without_cache_params_are_not_quantized(
+        self,
+        service: OrganizationService,
+        org_repo: AsyncMock,
+    ) -> None:
+        org_repo.find_in_radius.return_value = ([], 0)
+        params = GeoCircleParams(latitude=55.750001, longitude=37.61, radius_km=5)
+
+        await service.find_in_radius(params)
+        await service.find_in_radius(params)
+
+        assert org_repo.find_in_radius.call_count == 2
+        assert org_repo.find_in_radius.call_args.args[0] == params
+
+
+class TestFindInPolygon:
+    async def test_finds_in_polygon(
+        self,
+        service: OrganizationService,
+        org_repo: AsyncMock,
+    ) -> None:
+        org_repo.find_in_polygon.return_value = ([_make_org()], 21)
+
+        params = GeoPolygonParams(
+            type="Polygon",
+            coordinates=[[[37.0, 55.0], [38.0, 55.0], [38.0, 56.0], [37.0, 55.0]]],
+        )
+        result = await service.find_in_polygon(params, page=2, size=10)
+
+        org_repo.find_in_polygon.assert_called_once_with(
+            params, offset=10, limit=10, after=None, total_mode=TotalMode.EXACT
+        )
+        assert result.total == 21
+        assert result.pages == 3
+
+
+class TestFindInBatch:
+    async def test_results_follow_query_order(
+        self,
+        service: OrganizationService,
+        org_repo: AsyncMock,
+    ) -> None:
+        org_repo.find_in_batch.return_value = [([_make_org()], 3), ([], 0)]
+
+        params = GeoBatchParams(
+            queries=[
+                GeoCircleParams(latitude=55.75, longitude=37.61, radius_km=1),
+                GeoRectParams(
+                    min_latitude=0.0, max_latitude=1.0, min_longitude=0.0, max_longitude=1.0
+                ),
+            ],
+        )
+        result = await service.find_in_batch(params)
+
+        org_repo.find_in_batch.assert_called_once_with(params)
+        assert [r.total for r in result.results] == [3, 0]
+        assert result.results[0].items[0].id == ORG_UUID
+        assert result.results[1].items == []
+
+
+class TestGetClusters:
+    async def test_returns_clusters_with_total(
+        self,
+        service: OrganizationService,
+        org_repo: AsyncMock,
+    ) -> None:
+        org_repo.cluster_in_rect.return_value = [(55.7, 37.6, 40), (55.9, 37.4, 2)]
+
+        params = GeoRectParams(
+            min_latitude=55.0, max_latitude=56.0, min_longitude=37.0, max_longitude=38.0
+        )
+        result = await service.get_clusters(params, GeoClusterParams(cell_size=0.25))
+
+        org_repo.cluster_in_rect.assert_called_once_with(params, 0.25)
+        assert result.total == 42
+        assert result.cell_size == 0.25
+        assert [cluster.count for cluster in result.clusters] == [40, 2]
+
+    async def test_rejects_too_fine_grid(
+        self,
+        service: OrganizationService,
+        org_repo: AsyncMock,
+    ) -> None:
+        params = GeoRectParams(
+            min_latitude=-80.0, max_latitude=80.0, min_longitude=-180.0, max_longitude=180.0
+        )
+
+        with pytest.raises(DomainError):
+            await service.get_clusters(params, GeoClusterParams(cell_size=0.01))
+        org_repo.cluster_in_rect.assert_not_called()
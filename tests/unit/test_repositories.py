@@ -0,0 +1,21 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql
+
+from src.infrastructure.repositories import ActivityRepository
+
+ENTITY_UUID = UUID("11111111-1111-1111-1111-111111111111")
+
+
+class TestExists:
+    async def test_runs_exists_query(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=False))
+
+        assert await ActivityRepository(session).exists(ENTITY_UUID) is False
+
+        stmt = session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("SELECT EXISTS (SELECT")
+        assert "activities.id = " in sql
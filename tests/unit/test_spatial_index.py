@@ -0,0 +1,109 @@
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.domain.schemas.geo import GeoCircleParams, GeoRectParams
+from src.infrastructure.cache.spatial import MAX_DISTANCE_ERROR, BuildingSpatialIndex
+
+MOSCOW_CENTER = UUID("11111111-1111-1111-1111-111111111111")
+MOSCOW_NORTH = UUID("22222222-2222-2222-2222-222222222222")
+SAINT_PETERSBURG = UUID("33333333-3333-3333-3333-333333333333")
+FIJI = UUID("44444444-4444-4444-4444-444444444444")
+SAMOA = UUID("55555555-5555-5555-5555-555555555555")
+
+
+@pytest.fixture
+def index() -> BuildingSpatialIndex:
+    index = BuildingSpatialIndex()
+    index.load(
+        [
+            (SAINT_PETERSBURG, 59.935800, 30.325875),
+            (MOSCOW_CENTER, 55.762373, 37.607898),
+            (MOSCOW_NORTH, 55.790272, 37.530019),
+            (FIJI, -17.713371, 178.065033),
+            (SAMOA, -13.759029, -172.104629),
+        ]
+    )
+    return index
+
+
+class TestFindInRadius:
+    def test_returns_buildings_with_distances(self, index: BuildingSpatialIndex) -> None:
+        params = GeoCircleParams(latitude=55.762373, longitude=37.607898, radius_km=10)
+
+        result = index.find_in_radius(params)
+
+        assert set(result) == {MOSCOW_CENTER, MOSCOW_NORTH}
+        assert result[MOSCOW_CENTER] == pytest.approx(0.0, abs=1e-6)
+        assert result[MOSCOW_NORTH] == pytest.approx(5_800, rel=0.05)
+
+    def test_large_radius(self, index: BuildingSpatialIndex) -> None:
+        params = GeoCircleParams(latitude=55.762373, longitude=37.607898, radius_km=700)
+
+        assert set(index.find_in_radius(params)) == {
+            MOSCOW_CENTER,
+            MOSCOW_NORTH,
+            SAINT_PETERSBURG,
+        }
+
+    def test_radius_across_antimeridian(self, index: BuildingSpatialIndex) -> None:
+        params = GeoCircleParams(latitude=-17.7, longitude=-179.9, radius_km=300)
+
+        assert set(index.find_in_radius(params)) == {FIJI}
+
+    @pytest.mark.parametrize(
+        ("latitude", "spheroid_m"),
+        [(0.0, 110_574.4), (89.0, 111_693.9)],
+    )
+    def test_distance_error_is_bounded(self, latitude: float, spheroid_m: float) -> None:
+        # One degree along a meridian is shortest on WGS 84 at the equator and
+        # longest at the poles, the two extremes of the sphere's error.
+        index = BuildingSpatialIndex()
+        index.load([(MOSCOW_CENTER, latitude + 1.0, 0.0)])
+        params = GeoCircleParams(latitude=latitude, longitude=0.0, radius_km=200)
+
+        distance = index.find_in_radius(params)[MOSCOW_CENTER]
+
+        assert distance == pytest.approx(spheroid_m, rel=MAX_DISTANCE_ERROR)
+
+
+class TestFindInRect:
+    def test_narrow_rect(self, index: BuildingSpatialIndex) -> None:
+        params = GeoRectParams(
+            min_latitude=55.0, max_latitude=56.0, min_longitude=37.0, max_longitude=38.0
+        )
+
+        assert set(index.find_in_rect(params)) == {MOSCOW_CENTER, MOSCOW_NORTH}
+
+    def test_antimeridian_rect(self, index: BuildingSpatialIndex) -> None:
+        params = GeoRectParams(
+            min_latitude=-20.0, max_latitude=-10.0, min_longitude=170.0, max_longitude=-170.0
+        )
+
+        assert set(index.find_in_rect(params)) == {FIJI, SAMOA}
+
+    def test_world_rect(self, index: BuildingSpatialIndex) -> None:
+        params = GeoRectParams(
+            min_latitude=-90.0, max_latitude=90.0, min_longitude=-180.0, max_longitude=180.0
+        )
+
+        assert len(index.find_in_rect(params)) == 5
+
+
+class TestLoad:
+    def test_not_ready_until_loaded(self) -> None:
+        index = BuildingSpatialIndex()
+
+        assert not index.is_ready
+        with pytest.raises(RuntimeError):
+            index.find_in_rect(
+                GeoRectParams(min_latitude=0, max_latitude=1, min_longitude=0, max_longitude=1)
+            )
+
+    def test_reload_replaces_buildings(self, index: BuildingSpatialIndex) -> None:
+        new_id = uuid4()
+        index.load([(new_id, 0.0, 0.0)])
+
+        params = GeoCircleParams(latitude=0, longitude=0, radius_km=1)
+        assert list(index.find_in_radius(params)) == [new_id]
+        assert len(index) == 1
@@ -0,0 +1,45 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+from src.domain.schemas.suggest import SuggestionKind
+from src.infrastructure.cache.names import NamePrefixIndex
+from src.services.suggest import SuggestService
+
+ORG_UUID = UUID("11111111-1111-1111-1111-111111111111")
+
+
+def _factory(repository: AsyncMock) -> Callable[[], AbstractAsyncContextManager[AsyncMock]]:
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[AsyncMock]:
+        yield repository
+
+    return factory
+
+
+class TestSuggest:
+    async def test_answers_from_loaded_index(self) -> None:
+        index = NamePrefixIndex()
+        index.load([(SuggestionKind.ORGANIZATION, ORG_UUID, "Рога и Копыта")])
+        repository = AsyncMock()
+        service = SuggestService(index=index, repository_factory=_factory(repository))
+
+        result = await service.suggest("рог", 5)
+
+        assert [s.id for s in result] == [ORG_UUID]
+        repository.suggest_names.assert_not_called()
+
+    async def test_falls_back_to_database_until_loaded(self) -> None:
+        repository = AsyncMock()
+        repository.suggest_names.return_value = [
+            (SuggestionKind.ORGANIZATION, ORG_UUID, "Рога и Копыта")
+        ]
+        service = SuggestService(index=NamePrefixIndex(), repository_factory=_factory(repository))
+
+        result = await service.suggest("рог", 5)
+
+        repository.suggest_names.assert_called_once_with("рог", 5)
+        assert [(s.kind, s.name) for s in result] == [
+            (SuggestionKind.ORGANIZATION, "Рога и Копыта")
+        ]
@@ -0,0 +1,49 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.exceptions import DomainError
+from src.infrastructure.cache.lru import LRUCache
+from src.services.tile import TileService
+
+
+@pytest.fixture
+def repo() -> AsyncMock:
+    repo = AsyncMock()
+    repo.get_tile.return_value = b"tile"
+    return repo
+
+
+@pytest.fixture
+def service(repo: AsyncMock) -> TileService:
+    return TileService(repository=repo, cache=LRUCache(maxsize=8))
+
+
+class TestGetTile:
+    async def test_renders_tile(self, service: TileService, repo: AsyncMock) -> None:
+        assert await service.get_tile(10, 619, 320) == b"tile"
+        repo.get_tile.assert_called_once_with(10, 619, 320)
+
+    async def test_second_request_served_from_cache(
+        self, service: TileService, repo: AsyncMock
+    ) -> None:
+        await service.get_tile(10, 619, 320)
+        await service.get_tile(10, 619, 320)
+
+        repo.get_tile.assert_called_once()
+
+    async def test_empty_tile_is_cached(self, service: TileService, repo: AsyncMock) -> None:
+        repo.get_tile.return_value = b""
+
+        await service.get_tile(2, 0, 0)
+        await service.get_tile(2, 0, 0)
+
+        repo.get_tile.assert_called_once()
+
+    @pytest.mark.parametrize(("z", "x", "y"), [(0, 1, 0), (3, 0, 8), (10, 1024, 0)])
+    async def test_rejects_tiles_outside_grid(
+        self, service: TileService, repo: AsyncMock, z: int, x: int, y: int
+    ) -> None:
+        with pytest.raises(DomainError):
+            await service.get_tile(z, x, y)
+        repo.get_tile.assert_not_called()